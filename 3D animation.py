@@ -1,7 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # Required for 3D plotting
-from matplotlib.animation import FuncAnimation
+
+from analytical_geometry.animation import chord_geometry, frame_animation, precompute
 
 # Ellipse Parameters
 a = 5  # Semi-major axis
@@ -53,40 +54,32 @@ def init():
     point_aux2.set_3d_properties([])
     return point_ellipse1, point_ellipse2, chord_line, point_aux1, point_aux2
 
-def update(frame):
-    # Animate the eccentric angles
-    phi1 = frame * 0.05
-    phi2 = (phi1 + phi_offset) % (2 * np.pi)
-
-    # Calculate the ellipse coordinates (with z = 0 because our curve is in the xy-plane)
-    x1, y1, z1 = a * np.cos(phi1), b * np.sin(phi1), 0
-    x2, y2, z2 = a * np.cos(phi2), b * np.sin(phi2), 0
+def chord_geometry_3d(phi1):
+    """Chord geometry of every frame plus the camera angles."""
+    g = chord_geometry(a, b, phi1, phi_offset)
+    # Camera: the azimuth rotates with the frame (applied by frame_animation)
+    g.update(elev=np.full(len(phi1), 20), azim=np.arange(len(phi1)))
+    return g
 
-    # Calculate the corresponding auxiliary circle coordinates (radius = a)
-    aux_x1, aux_y1, aux_z1 = a * np.cos(phi1), a * np.sin(phi1), 0
-    aux_x2, aux_y2, aux_z2 = a * np.cos(phi2), a * np.sin(phi2), 0
+# Geometry of all frames, evaluated once before rendering
+geometry = precompute(chord_geometry_3d, np.arange(360) * 0.05)
 
-    # Set the updated data as sequences
-    point_ellipse1.set_data([x1], [y1])
-    point_ellipse1.set_3d_properties([z1])
-    point_ellipse2.set_data([x2], [y2])
-    point_ellipse2.set_3d_properties([z2])
-    
-    chord_line.set_data([x1, x2], [y1, y2])
-    chord_line.set_3d_properties([z1, z2])
-    
-    point_aux1.set_data([aux_x1], [aux_y1])
-    point_aux1.set_3d_properties([aux_z1])
-    point_aux2.set_data([aux_x2], [aux_y2])
-    point_aux2.set_3d_properties([aux_z2])
-
-    # Also update the camera (azimuth rotates with the frame)
-    ax.view_init(elev=20, azim=frame)
+def update(frame):
+    # Only look up the precomputed geometry of this frame (the curve lies in z = 0)
+    g = geometry
+    for artist, pts in ((point_ellipse1, g.P1[frame:frame + 1]),
+                        (point_ellipse2, g.P2[frame:frame + 1]),
+                        (chord_line, g.chord[frame]),
+                        (point_aux1, g.A1[frame:frame + 1]),
+                        (point_aux2, g.A2[frame:frame + 1])):
+        artist.set_data(pts[:, 0], pts[:, 1])
+        artist.set_3d_properties(np.zeros(len(pts)))
 
     return point_ellipse1, point_ellipse2, chord_line, point_aux1, point_aux2
 
 # Create the 3D animation
-anim3d = FuncAnimation(fig, update, frames=360, init_func=init,
-                       interval=50, blit=False)
+# Blitting is requested, but frame_animation redraws fully while the camera rotates
+anim3d = frame_animation(fig, geometry, update, init_func=init,
+                         interval=50, blit=True)
 plt.legend()
 plt.show()
\ No newline at end of file
@@ -2,6 +2,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 
+from analytical_geometry.collision import first_contact, path_collisions
+from analytical_geometry.ellipses import EllipseBatch
+from analytical_geometry.polygons import ellipse_polygon
+
 # ------------------------------------------------
 # Program 1: Collision Detection with an Elliptical Obstacle
 # ------------------------------------------------
@@ -10,13 +14,6 @@ import matplotlib.animation as animation
 a_obs = 3    # semi-axis along x
 b_obs = 2    # semi-axis along y
 
-def is_inside_ellipse(x, y, a, b):
-    """
-    Returns True if point (x,y) lies inside (or on) the ellipse:
-        (x/a)^2 + (y/b)^2 <= 1.
-    """
-    return (x**2)/(a**2) + (y**2)/(b**2) <= 1
-
 # Define the robot's planned straight-line path.
 start = np.array([-6, -4])
 goal  = np.array([6, 4])
@@ -32,10 +29,10 @@ ax.set_aspect('equal')
 ax.grid(True)
 ax.set_title("Collision Detection with an Elliptical Obstacle")
 
-# Plot the obstacle: draw the ellipse.
-t = np.linspace(0, 2*np.pi, 400)
-ellipse_x = a_obs * np.cos(t)
-ellipse_y = b_obs * np.sin(t)
+# Plot the obstacle: draw the ellipse (as few vertices as a 0.005 error allows).
+outline = ellipse_polygon(a_obs, b_obs, 0.005, "inner")
+ellipse_x = np.append(outline[:, 0], outline[0, 0])
+ellipse_y = np.append(outline[:, 1], outline[0, 1])
 ax.plot(ellipse_x, ellipse_y, 'k-', lw=2, label="Obstacle (Ellipse)")
 
 # Plot the path (the planned trajectory).
@@ -47,6 +44,22 @@ ax.plot(goal[0], goal[1], 'ro', markersize=8, label="Goal")
 
 # Create the robot as a circle (using a small radius).
 r_robot = 0.3   # robot's "size"
+
+# Exact (continuous) first contact of the robot disc with the obstacle along
+# the whole path; the time is a fractional index into `path`.
+contact_time, contact_point, _ = first_contact(path, r_robot, EllipseBatch(0, 0, a_obs, b_obs))
+if np.isfinite(contact_time):
+    print(f"First contact at path index {contact_time:.3f}, "
+          f"point ({contact_point[0]:.3f}, {contact_point[1]:.3f})")
+else:
+    print("Path is collision-free.")
+# Validate every pose of the path up front; the animation only reads the result.
+collisions = path_collisions(path, r_robot, EllipseBatch(0, 0, a_obs, b_obs))
+colliding = collisions.colliding[0]
+if collisions.first_index[0] >= 0:
+    print(f"First colliding pose {collisions.first_index[0]}, "
+          f"penetration depth {collisions.depth[0]:.3f}, "
+          f"collision-free prefix of {len(collisions.prefix())} poses")
 robot_patch = plt.Circle((start[0], start[1]), r_robot, color='green')
 ax.add_patch(robot_patch)
 
@@ -58,8 +71,8 @@ def update_collision(frame):
     pos = path[frame]
     # Update the circle's center.
     robot_patch.center = (pos[0], pos[1])
-    # Check collision: if the center is inside the ellipse, we declare collision.
-    if is_inside_ellipse(pos[0], pos[1], a_obs, b_obs):
+    # Collision status of this pose was computed before rendering.
+    if colliding[frame]:
         robot_patch.set_color('red')             # change color on collision
         collision_text.set_text("Collision Detected!")
     else:
@@ -1,5 +1,7 @@
 from graphviz import Digraph
 
+from analytical_geometry.concept_maps import render_cached
+
 # Create a concept map for 0.6 Geometrical Properties of an Ellipse (Part 1)
 dot = Digraph(comment='Concept Map for 0.6 Geometrical Properties (Part 1)')
 dot.attr(rankdir='TB', size='8,6')
@@ -32,4 +34,5 @@ dot.edge('E', 'F', label='→ Insight')
 dot.edge('A', 'F', label='Based on ellipse geometry')
 
 # Render the concept map to a PNG file and open it (this creates a file "concept_map_geometrical_properties1.png")
-dot.render('concept_map_geometrical_properties1', view=True, format='png')
\ No newline at end of file
+# (Skipped when the PNG is up to date.)
+render_cached(dot, 'concept_map_geometrical_properties1', format='png', view=True)
\ No newline at end of file
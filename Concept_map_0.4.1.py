@@ -1,5 +1,7 @@
 from graphviz import Digraph
 
+from analytical_geometry.concept_maps import render_cached
+
 # Create a directed Graphviz diagram for section 0.4.1
 dot = Digraph(comment='Detailed Concept Map for 0.4.1: Intersection of a Line with an Ellipse')
 dot.attr(rankdir='TB')  # Layout: top-to-bottom
@@ -23,5 +25,5 @@ dot.edge('E', 'F')
 dot.edge('F', 'G')
 dot.edge('G', 'H')
 
-# Render and export the diagram as PNG.
-dot.render('detailed_concept_04_1', format='png', view=True)
\ No newline at end of file
+# Render and export the diagram as PNG (skipped when the PNG is up to date).
+render_cached(dot, 'detailed_concept_04_1', format='png', view=True)
\ No newline at end of file
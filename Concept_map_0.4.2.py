@@ -1,5 +1,7 @@
 from graphviz import Digraph
 
+from analytical_geometry.concept_maps import render_cached
+
 # Create a directed Graphviz diagram for section 0.4.2
 dot = Digraph(comment='Detailed Concept Map for 0.4.2: Tangent and Normal at a Point on the Ellipse')
 dot.attr(rankdir='TB')  # top-to-bottom direction
@@ -22,5 +24,5 @@ dot.edge('D', 'E', label='Form equation for tangent')
 dot.edge('E', 'F', label='Find perpendicular line')
 dot.edge('F', 'G')
 
-# Render the diagram as PNG.
-dot.render('detailed_concept_04_2', format='png', view=True)
\ No newline at end of file
+# Render the diagram as PNG (skipped when the PNG is up to date).
+render_cached(dot, 'detailed_concept_04_2', format='png', view=True)
\ No newline at end of file
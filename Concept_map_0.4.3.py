@@ -1,5 +1,7 @@
 from graphviz import Digraph
 
+from analytical_geometry.concept_maps import render_cached
+
 # Create a directed Graphviz diagram for section 0.4.3
 dot = Digraph(comment='Detailed Concept Map for 0.4.3: Condition for Tangency')
 dot.attr(rankdir='TB')
@@ -25,5 +27,5 @@ dot.edge('F', 'G')
 dot.edge('G', 'H')
 dot.edge('H', 'I')
 
-# Render the diagram as PNG.
-dot.render('detailed_concept_04_3', format='png', view=True)
\ No newline at end of file
+# Render the diagram as PNG (skipped when the PNG is up to date).
+render_cached(dot, 'detailed_concept_04_3', format='png', view=True)
\ No newline at end of file
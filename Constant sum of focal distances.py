@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+
+from analytical_geometry.animation import frame_animation, precompute
 
 # Ellipse parameters
 a = 5.0
@@ -28,27 +29,32 @@ line_F1, = ax.plot([], [], 'g--', lw=2, label="P-F1")
 line_F2, = ax.plot([], [], 'm--', lw=2, label="P-F2")
 text_sum = ax.text(-a, a, "", fontsize=12, color="purple")
 
-def update_focal(theta):
-    # theta is a scalar.
-    P = np.array([a * np.cos(theta), b * np.sin(theta)])
-    d1 = np.linalg.norm(P - F1)
-    d2 = np.linalg.norm(P - F2)
-    sum_d = d1 + d2
-    
-    # Wrap scalar values in lists:
-    point_P.set_data([P[0]], [P[1]])
+def focal_geometry(theta):
+    """Point P and its focal distances for every frame angle theta at once."""
+    P = np.column_stack([a * np.cos(theta), b * np.sin(theta)])
+    d1 = np.linalg.norm(P - F1, axis=1)
+    d2 = np.linalg.norm(P - F2, axis=1)
+    labels = [f"Sum = {s:.2f} (2a = {2*a:.2f})" for s in d1 + d2]
+    return {"P": P, "d1": d1, "d2": d2, "label": labels}
+
+geometry = precompute(focal_geometry, np.linspace(0, 2*np.pi, 200))
+
+def update_focal(frame):
+    # frame is an index into the precomputed geometry.
+    P = geometry.P[frame]
+    point_P.set_data(P[:1], P[1:])
     line_F1.set_data([P[0], F1[0]], [P[1], F1[1]])
     line_F2.set_data([P[0], F2[0]], [P[1], F2[1]])
-    text_sum.set_text(f"Sum = {sum_d:.2f} (2a = {2*a:.2f})")
-    
+    text_sum.set_text(geometry.label[frame])
+
     return point_P, line_F1, line_F2, text_sum
 
-# Create the animation by passing the update function and the frames as a sequence.
-anim2 = FuncAnimation(fig,
-                      update_focal,
-                      frames=np.linspace(0, 2*np.pi, 200),
-                      interval=50,
-                      blit=True)
+# Create the animation over the precomputed frames.
+anim2 = frame_animation(fig,
+                        geometry,
+                        update_focal,
+                        interval=50,
+                        blit=True)
 
 plt.title("Animation 2: Constant Sum of Focal Distances")
 ax.legend(loc='upper right')
@@ -1,6 +1,8 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 
+from analytical_geometry.layouts import cached_layout
+
 # Create a new directed graph for the flow chart.
 F = nx.DiGraph()
 
@@ -33,8 +35,10 @@ flow_edges = [
 
 F.add_edges_from(flow_edges)
 
-# Use a shell layout so that nodes appear in order.
-pos = nx.shell_layout(F)
+# Use a shell layout so that nodes appear in order.  The positions are cached
+# on disk by graph structure; when steps are added, the existing ones keep
+# their place.
+pos = cached_layout(F, "shell", name="derivation_flowchart")
 
 # Draw the flow chart nodes & edges with labels.
 plt.figure(figsize=(12,8))
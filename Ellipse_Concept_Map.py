@@ -1,6 +1,8 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 
+from analytical_geometry.layouts import cached_layout
+
 # Create a directed graph for the concept map.
 G = nx.DiGraph()
 
@@ -47,7 +49,8 @@ edges = [
 G.add_edges_from(edges)
 
 # Choose a layout for the concept map
-pos = nx.spring_layout(G, k=1.0, seed=42)  # using spring layout for better spacing
+# (spring layout for better spacing, cached on disk by graph structure)
+pos = cached_layout(G, "spring", name="ellipse_concept_map", k=1.0, seed=42)
 
 # Draw nodes and edges
 plt.figure(figsize=(10,10))
@@ -2,6 +2,9 @@ import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
 
+from analytical_geometry.conic import eval_conic_grid
+from analytical_geometry.grid import get_grid
+
 # We work with the standard ellipse: x^2/a^2 + y^2/b^2 = 1. 
 # Recall: Latus rectum L = 2b^2/a, minor axis = 2b.
 # We require: 2b^2/a = b  --> a = 2b.
@@ -20,13 +23,12 @@ x, y = sp.symbols('x y', real=True)
 ellipse_eq = sp.Eq(x**2/a_val**2 + y**2/b_val**2, 1)
 
 # --- Plot the ellipse and label foci, minor axis, and latus rectum.
-X = np.linspace(-2.5, 2.5, 400)
-Y = np.linspace(-1.5, 1.5, 300)
-Xv, Yv = np.meshgrid(X, Y)
-F = Xv**2/(a_val**2) + Yv**2/(b_val**2) - 1  # zero-contour represents the ellipse
+grid = get_grid((-2.5, 2.5, -1.5, 1.5), (400, 300))
+X, Y = grid.x, grid.y
+F = eval_conic_grid((1/a_val**2, 0, 1/b_val**2, 0, 0, -1), X, Y)  # zero-contour represents the ellipse
 
 plt.figure(figsize=(6,4))
-CS = plt.contour(Xv, Yv, F, levels=[0], colors=['blue'])
+CS = plt.contour(X, Y, F, levels=[0], colors=['blue'])
 plt.clabel(CS, inline=1, fontsize=10)
 plt.title("Example 10: Ellipse x²/4 + y² = 1")
 plt.xlabel("x"), plt.ylabel("y")
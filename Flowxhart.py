@@ -1,5 +1,7 @@
 from graphviz import Digraph
 
+from analytical_geometry.concept_maps import render_cached
+
 # Create a new directed graph
 dot = Digraph(comment='Flowchart for Sections 0.4.1, 0.4.2, 0.4.3')
 
@@ -16,5 +18,6 @@ dot.edge('A', 'B', label='Next: Find tangent & normal')
 dot.edge('B', 'C', label='Then enforce tangency')
 
 # Render the graph to a PNG file and open it
-# This creates 'flowchart_04.png' in your working directory.
-dot.render('flowchart_04', format='png', view=True)
+# This creates 'flowchart_04.png' in your working directory (unless it is
+# already up to date).
+render_cached(dot, 'flowchart_04', format='png', view=True)
@@ -1,10 +1,9 @@
-import matplotlib
-matplotlib.use("TkAgg")  # You can try this if needed
-
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 
+from analytical_geometry.planning import simulate_potential_field
+
 # ------------------------------------------------
 # Program 2: Robotics Path Planning Using Potential Fields
 # (Animation Duration: 15 seconds)
@@ -14,17 +13,6 @@ import matplotlib.animation as animation
 a_obs = 3   # semi-axis along x of obstacle
 b_obs = 2   # semi-axis along y of obstacle
 
-def f_obs(x, y, a, b):
-    """Compute the ellipse implicit function value.
-       f = (x^2)/(a^2) + (y^2)/(b^2) (f = 1 on the obstacle boundary)."""
-    return (x**2)/(a**2) + (y**2)/(b**2)
-
-def grad_f_obs(x, y, a, b):
-    """Compute the gradient of f_obs at (x, y)."""
-    dfdx = 2 * x / (a**2)
-    dfdy = 2 * y / (b**2)
-    return np.array([dfdx, dfdy])
-
 # Start and goal positions.
 start = np.array([-7.0, -7.0])
 goal  = np.array([7.0, 7.0])
@@ -35,39 +23,16 @@ k_rep  = 10.0      # Repulsive gain: pushes the robot away from the obstacle.
 d0     = 1.5       # Threshold: repulsion is activated when f_obs(x,y) < d0.
 # (f_obs(x,y) = 1 along the elliptical obstacle boundary.)
 
-def attractive_force(pos):
-    """Return the attractive force vector toward the goal."""
-    return k_attr * (goal - pos)
-
-def repulsive_force(pos):
-    """Compute the repulsive force vector if the robot is close to the obstacle."""
-    x, y = pos
-    f_val = f_obs(x, y, a_obs, b_obs)
-    if f_val < d0:
-        # Compute repulsive force magnitude factor.
-        factor = k_rep * (1.0/f_val - 1.0/d0) * (1.0 / (f_val**2))
-        # Repulsion is directed along the gradient of f_obs.
-        return factor * grad_f_obs(x, y, a_obs, b_obs)
-    else:
-        return np.array([0.0, 0.0])
-
 # Simulation parameters.
 dt = 0.05       # Time step (seconds)
 num_steps = 300 # Fixed simulation steps for 15-second animation
 
-# Initialize the robot's position.
-pos = start.copy()
-trajectory = [pos.copy()]
-
-# Euler integration for potential field path planning.
-for _ in range(num_steps):
-    F_attr = attractive_force(pos)
-    F_rep  = repulsive_force(pos)
-    F_total = F_attr + F_rep
-    pos = pos + dt * F_total
-    trajectory.append(pos.copy())
-
-trajectory = np.array(trajectory)
+# Euler integration for potential field path planning (the simulator advances
+# any number of robots at once; here there is a single one).
+trajectory, _ = simulate_potential_field(start, goal, a_obs, b_obs,
+                                         k_attr=k_attr, k_rep=k_rep, d0=d0,
+                                         dt=dt, num_steps=num_steps)
+trajectory = trajectory[:, 0, :]
 
 # ------------------------------------------------
 # Set up the animation plot.
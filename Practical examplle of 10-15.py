@@ -1,132 +1,19 @@
-import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
 
-# ***********************
-# THEORETICAL METHODS 
-# ***********************
-
-class EllipseTheory:
-    @staticmethod
-    def compute_eccentricity_from_latus(b):
-        """
-        Example 10:
-        For an ellipse: x²/a² + y²/b² = 1 with Latus rectum L = 2b²/a.
-        The condition "latus rectum is half the minor axis" means:
-            L = (1/2)*(2b) = b.
-        Hence, 2b²/a = b  ==>  a = 2b.
-        Then eccentricity: e = sqrt(1 - (b²/a²)).
-        """
-        a = 2 * b
-        e = np.sqrt(1 - (b**2) / (a**2))
-        return a, e
-
-    @staticmethod
-    def plot_ellipse(a, b, title="Ellipse", color="blue", show=True):
-        """Utility function to plot an ellipse x²/a² + y²/b² = 1."""
-        theta = np.linspace(0, 2*np.pi, 400)
-        x = a * np.cos(theta)
-        y = b * np.sin(theta)
-        plt.plot(x, y, color=color, label=title)
-        plt.axis('equal')
-        if show:
-            plt.show()
-
-    @staticmethod
-    def fit_ellipse_through_points(p1, p2):
-        """
-        Example 11:
-        Finds ellipse parameters (a, b) such that
-           x²/a² + y²/b² = 1
-        holds for two given points p1 = (x1, y1) and p2 = (x2, y2).
-        By noting that if we set X = 1/a² and Y = 1/b² then:
-            x1²*X + y1²*Y = 1   and   x2²*X + y2²*Y = 1.
-        Returns a and b.
-        """
-        x1, y1 = p1
-        x2, y2 = p2
-        X, Y = sp.symbols('X Y', positive=True)
-        eq1 = sp.Eq(x1**2 * X + y1**2 * Y, 1)
-        eq2 = sp.Eq(x2**2 * X + y2**2 * Y, 1)
-        sol = sp.solve([eq1, eq2], (X, Y), dict=True)[0]
-        a_sq = 1 / sol[X]
-        b_sq = 1 / sol[Y]
-        return sp.sqrt(a_sq), sp.sqrt(b_sq)
-    
-    @staticmethod
-    def ellipse_from_minor_and_focal(b, focal_distance):
-        """
-        Example 12:
-        For an ellipse with minor axis length 2b and foci at (±ae, 0) such that
-           focal separation = 2ae,
-        we have e = (focal_distance)/(2a) and the relation:
-           b² = a² (1 - e²).
-        In Example 12, with b = 2 and focal_distance = 2, we recover a² = 5.
-        Returns a, b, and e.
-        """
-        # Use: b^2 = a^2 - (focal_distance^2)/4  ==>  a^2 = b^2 + (focal_distance^2)/4.
-        a = np.sqrt(b**2 + (focal_distance**2) / 4)
-        e = focal_distance / (2 * a)
-        return a, b, e
-
-    @staticmethod
-    def ellipse_from_latus_and_ecc(L, e):
-        """
-        Example 13:
-        For an ellipse, the latus rectum L = 2b²/a and b² = a²(1-e²).
-        Thus, L = 2a(1-e²). Then a = L/(2(1-e²)) and b = a*sqrt(1-e²).
-        Returns a, b, and e.
-        """
-        a = L / (2 * (1 - e**2))
-        b = a * np.sqrt(1 - e**2)
-        return a, b, e
-
-    @staticmethod
-    def ellipse_from_focal_perp(a):
-        """
-        Example 14:
-        If the line segments from the focus S=(ae,0) to the minor-axis endpoint (0,b)
-        are perpendicular then b² = a²e². Also, b² = a²(1-e²). Equate to get:
-            e² = 1 - e²   ->   e = 1/√2.
-        Then b = a*sqrt(1 - e²).
-        Here a is provided (from major-axis 2a).
-        Returns a, b, and e.
-        """
-        e = 1 / np.sqrt(2)
-        b = a * np.sqrt(1 - e**2)
-        return a, b, e
-
-    @staticmethod
-    def rational_parametrization(a, b, t):
-        """
-        Example 15:
-        Returns the point (x,y) by the rational parametrization:
-            x = a(1-t²)/(1+t²),   y = (2b*t)/(1+t²).
-        """
-        x = a * (1 - t**2) / (1 + t**2)
-        y = 2 * b * t / (1 + t**2)
-        return x, y
-
-    @staticmethod
-    def verify_rational_parametrization(a, b):
-        """
-        Example 15:
-        Symbolically verify that x²/a² + y²/b² = 1 when
-            x = a(1-t²)/(1+t²),   y = 2b*t/(1+t²).
-        Returns the symbolic expression (should simplify to 1).
-        """
-        t = sp.symbols('t', real=True)
-        x_expr = a * (1 - t**2) / (1 + t**2)
-        y_expr = 2 * b * t / (1 + t**2)
-        expr = sp.simplify(x_expr**2 / a**2 + y_expr**2 / b**2)
-        return expr
+from analytical_geometry import report
+# The theoretical methods (EllipseTheory) live in analytical_geometry.theory.
+from analytical_geometry.theory import EllipseTheory
 
 # *******************************
 # DEMONSTRATION FOR EXAMPLES 10-15
 # *******************************
+# Every example prints its results, draws its figure and returns its numbers;
+# run with --report DIR to write all figures and results without windows.
 
-if __name__ == "__main__":
-    # ------- Example 10 -------
+
+def example_10():
+    """Example 10: eccentricity when the latus rectum equals b."""
     print("=== Example 10 ===")
     # Compute the eccentricity when Latus rectum L = b (i.e. latus rectum is half the minor axis)
     b_ex10 = 1.0
@@ -151,9 +38,11 @@ if __name__ == "__main__":
     plt.legend()
     plt.grid(True)
     plt.axis("equal")
-    plt.show()
-    
-    # ------- Example 11 -------
+    return {"a": a_ex10, "b": b_ex10, "e": e_ex10}
+
+
+def example_11():
+    """Example 11: ellipse through the points (2, 2) and (1, 4)."""
     print("\n=== Example 11 ===")
     # Fit an ellipse through points (2,2) and (1,4)
     p1 = (2, 2)
@@ -174,9 +63,11 @@ if __name__ == "__main__":
     plt.legend()
     plt.grid(True)
     plt.axis("equal")
-    plt.show()
-    
-    # ------- Example 12 -------
+    return {"a": a_fit, "b": b_fit, "points": [p1, p2]}
+
+
+def example_12():
+    """Example 12: ellipse from the minor axis and the focal separation."""
     print("\n=== Example 12 ===")
     # Given minor axis length = 4 (so b = 2) and focal separation = 2.
     b_ex12 = 2
@@ -197,9 +88,11 @@ if __name__ == "__main__":
     plt.legend()
     plt.grid(True)
     plt.axis("equal")
-    plt.show()
-    
-    # ------- Example 13 -------
+    return {"a": a_ex12, "b": b_ex12, "e": e_ex12}
+
+
+def example_13():
+    """Example 13: ellipse from the latus rectum and the eccentricity."""
     print("\n=== Example 13 ===")
     # Given latus rectum L = 3 and eccentricity e = 1/√2.
     L_ex13 = 3
@@ -217,9 +110,11 @@ if __name__ == "__main__":
     plt.legend()
     plt.grid(True)
     plt.axis("equal")
-    plt.show()
-    
-    # ------- Example 14 -------
+    return {"L": L_ex13, "a": a_ex13, "b": b_ex13, "e": e_ex13}
+
+
+def example_14():
+    """Example 14: ellipse whose focus-to-minor-vertex lines are perpendicular."""
     print("\n=== Example 14 ===")
     # If the vectors from the focus to the minor-axis endpoint are perpendicular then e = 1/√2.
     # Given major axis: 2a = 2√2, so a = √2.
@@ -241,9 +136,11 @@ if __name__ == "__main__":
     plt.legend()
     plt.grid(True)
     plt.axis("equal")
-    plt.show()
-    
-    # ------- Example 15 -------
+    return {"a": a_ex14, "b": b_ex14, "e": e_ex14}
+
+
+def example_15():
+    """Example 15: rational parametrization of the ellipse."""
     print("\n=== Example 15 ===")
     # Verify the rational parametrization: x = a(1-t²)/(1+t²), y = 2b*t/(1+t²)
     a_ex15, b_ex15 = 3, 2
@@ -266,4 +163,10 @@ if __name__ == "__main__":
     plt.legend()
     plt.grid(True)
     plt.axis("equal")
-    plt.show()
\ No newline at end of file
+    return {"a": a_ex15, "b": b_ex15, "verification": expr_check}
+
+
+EXAMPLES = [example_10, example_11, example_12, example_13, example_14, example_15]
+
+if __name__ == "__main__":
+    report.main(EXAMPLES, title="Practical examples 10-15")
\ No newline at end of file
@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+
+from analytical_geometry.animation import frame_animation, precompute
 
 # Improved Program 2: Robotics & Path Planning using Quiver
 # Ellipse parameters (describing a planned trajectory)
@@ -9,23 +10,28 @@ b = 3.0   # semi-minor axis
 
 def robot_properties(theta):
     """
-    For a given theta, compute:
+    For an array of angles theta, compute per angle:
       - P: position on the ellipse, P = (a*cos(theta), b*sin(theta))
       - d: unit tangent (heading) direction at P
          We use the fact that the tangent direction is orthogonal to 
          u = [cos(theta)/a, sin(theta)/b], so we can choose d = (-u[1], u[0])
+    Both are returned as (n, 2) arrays.
     """
-    x0 = a * np.cos(theta)
-    y0 = b * np.sin(theta)
-    P = np.array([x0, y0])
+    P = np.column_stack([a * np.cos(theta), b * np.sin(theta)])
     # u is used to define the tangent line in linear form:
-    u = np.array([np.cos(theta)/a, np.sin(theta)/b])
-    d = np.array([-u[1], u[0]])  # Not normalized yet.
-    norm_d = np.linalg.norm(d)
-    if norm_d > 1e-9:
-        d = d / norm_d
+    u = np.column_stack([np.cos(theta)/a, np.sin(theta)/b])
+    d = np.column_stack([-u[:, 1], u[:, 0]])  # Not normalized yet.
+    norm_d = np.linalg.norm(d, axis=1, keepdims=True)
+    d = np.divide(d, norm_d, out=d, where=norm_d > 1e-9)
     return P, d
 
+def robot_geometry(theta):
+    P, d = robot_properties(theta)
+    return {"P": P, "d": d}
+
+# Positions and headings of all frames, computed before rendering.
+geometry = precompute(robot_geometry, np.linspace(0, 2*np.pi, 200))
+
 # Set up the figure and axis.
 fig2, ax2 = plt.subplots(figsize=(8,8))
 theta_vals = np.linspace(0, 2*np.pi, 400)
@@ -49,18 +55,17 @@ heading_quiver = ax2.quiver(0, 0, 0, 0, angles='xy', scale_units='xy',
 
 ax2.legend(loc='upper right')
 
-def update_robot(theta):
-    P, d = robot_properties(theta)
+def update_robot(frame):
+    P, d = geometry.P[frame], geometry.d[frame]
     # Update robot position
-    robot_point.set_data([P[0]], [P[1]])
+    robot_point.set_data(P[:1], P[1:])
     # Update heading arrow using quiver: set_offsets and set_UVC to update the vector.
     heading_quiver.set_offsets(P.reshape(1,2))
     heading_quiver.set_UVC(arrow_length * d[0], arrow_length * d[1])
     return robot_point, heading_quiver
 
-# Use FuncAnimation with the update function and a range of theta values.
-anim2 = FuncAnimation(fig2, update_robot,
-                      frames=np.linspace(0, 2*np.pi, 200),
-                      interval=50, blit=True)
+# Animate over the precomputed frames.
+anim2 = frame_animation(fig2, geometry, update_robot,
+                        interval=50, blit=True)
 
 plt.show()
\ No newline at end of file
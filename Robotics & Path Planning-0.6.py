@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+
+from analytical_geometry.animation import frame_animation, precompute
 
 # Program 2: Robotics & Path Planning
 # Ellipse parameters represent a planned trajectory
@@ -9,17 +10,25 @@ b = 3.0
 
 def robot_properties(theta):
     """
-    Given theta, compute:
+    Given an array of angles theta, compute per angle:
       - P: Robot position on the ellipse.
       - d: Unit tangent vector (robot's intended heading).
+    Both are returned as (n, 2) arrays.
     """
-    P = np.array([a * np.cos(theta), b * np.sin(theta)])
+    P = np.column_stack([a * np.cos(theta), b * np.sin(theta)])
     # Compute tangent direction vector: u = (cos(theta)/a, sin(theta)/b)
-    u = np.array([np.cos(theta)/a, np.sin(theta)/b])
-    d = np.array([-u[1], u[0]])   # d is perpendicular to u.
-    d = d / np.linalg.norm(d) if np.linalg.norm(d) != 0 else d
+    u = np.column_stack([np.cos(theta)/a, np.sin(theta)/b])
+    d = np.column_stack([-u[:, 1], u[:, 0]])   # d is perpendicular to u.
+    norm_d = np.linalg.norm(d, axis=1, keepdims=True)
+    d = np.divide(d, norm_d, out=d, where=norm_d != 0)
     return P, d
 
+def robot_geometry(theta):
+    P, d = robot_properties(theta)
+    return {"P": P, "d": d}
+
+geometry = precompute(robot_geometry, np.linspace(0, 2*np.pi, 200))
+
 fig2, ax2 = plt.subplots(figsize=(8,8))
 theta_vals = np.linspace(0, 2*np.pi, 400)
 x_ellipse = a * np.cos(theta_vals)
@@ -31,25 +40,23 @@ ax2.set_aspect('equal')
 ax2.grid(True)
 ax2.set_title("Program 2 (Robotics): Elliptical Trajectory & Heading Direction")
 
-# Robot as point P and heading arrow.
+# Robot as point P and heading arrow.  The arrow is one persistent quiver
+# that is moved every frame, so the animation can blit.
 robot_point, = ax2.plot([], [], 'ro', markersize=8, label="Robot Position")
-heading_arrow = None  # We will update this object dynamically.
+arrow_length = 2.0  # arrow scaling factor (heading in visualization)
+heading_arrow = ax2.quiver(0, 0, 0, 0, angles='xy', scale_units='xy', scale=1,
+                           color='r', width=0.006, headwidth=4, headlength=5)
 
-def update_robot(theta):
-    global heading_arrow
-    P, d = robot_properties(theta)
-    robot_point.set_data([P[0]], [P[1]])
-    # Remove the previous arrow if it exists:
-    if heading_arrow is not None:
-        heading_arrow.remove()
-    # Draw new arrow from P in direction d (scaled for visualization)
-    arrow_length = 2.0
-    heading_arrow = ax2.arrow(P[0], P[1], arrow_length*d[0], arrow_length*d[1],
-                              head_width=0.3, head_length=0.5, fc='r', ec='r')
+def update_robot(frame):
+    P, d = geometry.P[frame], geometry.d[frame]
+    robot_point.set_data(P[:1], P[1:])
+    # Move the arrow to P and point it along d (scaled for visualization)
+    heading_arrow.set_offsets(P.reshape(1, 2))
+    heading_arrow.set_UVC(arrow_length*d[0], arrow_length*d[1])
     return robot_point, heading_arrow
 
-anim2 = FuncAnimation(fig2, update_robot, frames=np.linspace(0, 2*np.pi, 200),
-                      interval=50, blit=False)  # blit False since arrow is redrawn
+anim2 = frame_animation(fig2, geometry, update_robot,
+                        interval=50, blit=True)
 
 plt.legend(loc='upper right')
 plt.show()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+
+from analytical_geometry.animation import frame_animation, precompute
 
 # Program 3: Structural Engineering & Architecture
 # Example: Elliptical arch with a = 8 m and b = 6 m.
@@ -9,31 +10,45 @@ b = 6.0
 
 def arch_properties(theta):
     """
-    Compute for a given angle theta:
-      - P: point on the ellipse (arch)
+    Compute for an array of angles theta:
+      - P: points on the ellipse (arch)
       - Tangent intersections T (x-axis) and t (y-axis)
       - Projections: N = (a*cos(theta), 0) and M = (0, b*sin(theta))
       Returns:
-         P, T, t, CN, CT, CM, Ct.
+         P, T, t, CN, CT, CM, Ct  (points as (n, 2) arrays).
     """
     x0 = a * np.cos(theta)
     y0 = b * np.sin(theta)
-    P = np.array([x0, y0])
-    u = np.array([np.cos(theta)/a, np.sin(theta)/b])
-    T = np.array([1/u[0], 0]) if np.abs(u[0]) > 1e-9 else np.array([np.nan, np.nan])
-    t_pt = np.array([0, 1/u[1]]) if np.abs(u[1]) > 1e-9 else np.array([np.nan, np.nan])
-    
-    # Projection vectors onto axes
-    N = np.array([x0, 0])
-    M = np.array([0, y0])
+    P = np.column_stack([x0, y0])
+    u = np.column_stack([np.cos(theta)/a, np.sin(theta)/b])
+    # Tangents parallel to an axis never meet it.
+    with np.errstate(divide="ignore"):
+        inv = np.where(np.abs(u) > 1e-9, 1 / u, np.nan)
+    T = np.column_stack([inv[:, 0], np.where(np.isnan(inv[:, 0]), np.nan, 0)])
+    t_pt = np.column_stack([np.where(np.isnan(inv[:, 1]), np.nan, 0), inv[:, 1]])
     
     CN = np.abs(x0)
-    CT = np.abs(T[0])
+    CT = np.abs(T[:, 0])
     CM = np.abs(y0)
-    Ct = np.abs(t_pt[1])
+    Ct = np.abs(t_pt[:, 1])
     
     return P, T, t_pt, CN, CT, CM, Ct
 
+def arch_geometry(theta):
+    """All per-frame artist data of the arch animation."""
+    P, T, t_pt, CN, CT, CM, Ct = arch_properties(theta)
+    # Tangent direction vector, perpendicular to u = (cos/a, sin/b):
+    d = np.column_stack([-np.sin(theta)/b, np.cos(theta)/a])
+    t_range = np.linspace(-10, 10, 100)
+    tangent = T[:, None, :] + t_range[:, None] * d[:, None, :]
+    prod_major = CN * CT   # should equal a^2
+    prod_minor = CM * Ct   # should equal b^2
+    labels = [f"CN·CT = {pm:.1f} (a² = {a**2:.1f})\nCM·Ct = {pn:.1f} (b² = {b**2:.1f})"
+              for pm, pn in zip(prod_major, prod_minor)]
+    return {"P": P, "T": T, "t": t_pt, "tangent": tangent, "label": labels}
+
+geometry = precompute(arch_geometry, np.linspace(0, 2*np.pi, 200))
+
 fig3, ax3 = plt.subplots(figsize=(8,8))
 theta_vals = np.linspace(0, 2*np.pi, 400)
 x_arch = a * np.cos(theta_vals)
@@ -54,31 +69,23 @@ line_perp_x, = ax3.plot([], [], 'k--', lw=1, label="Projection: Perp to x-axis")
 line_perp_y, = ax3.plot([], [], 'k-.', lw=1, label="Projection: Perp to y-axis")
 prod_text = ax3.text(-a, a-1, "", fontsize=12, color="purple")
 
-def update_arch(theta):
-    P, T, t_pt, CN, CT, CM, Ct = arch_properties(theta)
-    point_P.set_data([P[0]], [P[1]])
-    int_T.set_data([T[0]], [T[1]])
-    int_t.set_data([t_pt[0]], [t_pt[1]])
-    
-    u = np.array([np.cos(theta)/a, np.sin(theta)/b])
-    # Tangent direction vector, perpendicular to u:
-    d = np.array([-u[1], u[0]])
-    t_range = np.linspace(-10, 10, 100)
-    tangent_pts = T.reshape(2,1) + np.outer(d, t_range)
-    tangent_line.set_data(tangent_pts[0,:], tangent_pts[1,:])
+def update_arch(frame):
+    g = geometry
+    P, T, t_pt = g.P[frame], g.T[frame], g.t[frame]
+    point_P.set_data(P[:1], P[1:])
+    int_T.set_data(T[:1], T[1:])
+    int_t.set_data(t_pt[:1], t_pt[1:])
+    tangent_line.set_data(g.tangent[frame, :, 0], g.tangent[frame, :, 1])
     
     # Draw perpendicular lines from P onto the x and y axes:
     line_perp_x.set_data([P[0], P[0]], [P[1], 0])
     line_perp_y.set_data([P[0], 0], [P[1], P[1]])
     
-    prod_major = CN * CT   # should equal a^2
-    prod_minor = CM * Ct   # should equal b^2
-    prod_text.set_text(f"CN·CT = {prod_major:.1f} (a² = {a**2:.1f})\nCM·Ct = {prod_minor:.1f} (b² = {b**2:.1f})")
+    prod_text.set_text(g.label[frame])
     
     return point_P, tangent_line, int_T, int_t, line_perp_x, line_perp_y, prod_text
 
-anim3 = FuncAnimation(fig3, update_arch,
-                      frames=np.linspace(0, 2*np.pi, 200),
-                      interval=50, blit=True)
+anim3 = frame_animation(fig3, geometry, update_arch,
+                        interval=50, blit=True)
 ax3.legend(loc='upper right')
 plt.show()
\ No newline at end of file
@@ -1,6 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from analytical_geometry.conic import eval_conic_grid
+from analytical_geometry.grid import get_grid
+
 def translate_coordinates(points, new_origin):
     """
     Translate the origin of coordinates to a new origin.
@@ -61,19 +64,18 @@ F_new = F + A * h**2 + C * k**2 + B * h * k + D * h + E * k
 print(f"Transformed equation: X^2 - Y^2 + ({D_new})*X + ({E_new})*Y + ({F_new}) = 0")
 
 # Plot the original and transformed equations
-x = np.linspace(-5, 5, 400)
-y = np.linspace(-5, 5, 400)
-X, Y = np.meshgrid(x, y)
+grid = get_grid((-5, 5, -5, 5), 400)
+x, y = grid.x, grid.y
 
 # Original equation: x^2 - y^2 + 2*x + 4*y = 0
-original_eq = X**2 - Y**2 + 2*X + 4*Y
+original_eq = eval_conic_grid((A, B, C, D, E, F), x, y)
 
 # Transformed equation: X^2 - Y^2 + D_new*X + E_new*Y + F_new = 0
-transformed_eq = X**2 - Y**2 + D_new*X + E_new*Y + F_new
+transformed_eq = eval_conic_grid((A, B, C, D_new, E_new, F_new), x, y)
 
 plt.figure(figsize=(10, 8))
-plt.contour(X, Y, original_eq, levels=[0], colors='blue', label='Original Equation')
-plt.contour(X, Y, transformed_eq, levels=[0], colors='red', label='Transformed Equation')
+plt.contour(x, y, original_eq, levels=[0], colors='blue', label='Original Equation')
+plt.contour(x, y, transformed_eq, levels=[0], colors='red', label='Transformed Equation')
 
 plt.axhline(0, color='black', linewidth=0.5)
 plt.axvline(0, color='black', linewidth=0.5)
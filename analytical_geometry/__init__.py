@@ -0,0 +1,63 @@
+"""
+Reusable geometry kernels for the Analytical-Geometry scripts.
+
+The top-level scripts in this repository are demonstrations; the modules in
+this package hold the numerical pieces they share so that the same code can be
+imported, vectorized and reused outside of a plotting session.
+
+Importing the package loads nothing but this file.  The names below are
+resolved on first access, each importing only its own submodule; the kernels
+need NumPy alone, while matplotlib (animation, render) and sympy (the exact
+EllipseTheory methods) are imported only by the code that uses them.
+"""
+import importlib
+
+_EXPORTS = {
+    "theory": ["EllipseTheory"],
+    "kernels": ["POSITION_INSIDE", "POSITION_ON", "POSITION_OUTSIDE", "POSITION_NAMES",
+                "ellipse_power", "position_of_point", "is_inside_ellipse", "point_at",
+                "tangent_at", "tangent_slope", "normal_slope", "tangent_intercept",
+                "line_intersections", "chord_line", "rotate_points"],
+    "conic": ["eval_conic", "eval_conic_grid", "rotate_conic", "translate_conic"],
+    "grid": ["OpenGrid", "get_grid", "clear_grid_cache"],
+    "ellipses": ["EllipseBatch", "ellipse_distance_local"],
+    "scene": ["EllipseScene"],
+    "planning": ["f_obs", "grad_f_obs", "attractive_force", "repulsive_force",
+                 "potential_force", "scene_repulsive_force", "simulate_potential_field",
+                 "plan_adaptive"],
+    "integrate": ["AdaptiveResult", "integrate_adaptive"],
+    "collision": ["swept_disc_contact", "first_contact", "PathCollisions", "path_collisions",
+                  "ellipses_overlap", "ellipses_overlap_matrix"],
+    "intersect": ["ellipse_intersections"],
+    "visibility": ["VisibilityGraph", "bitangents", "point_tangents"],
+    "broadphase": ["SweepAndPrune"],
+    "polygons": ["offset_polygon", "ellipse_polygon", "place_polygon", "inflated_contains",
+                 "convex_polygons_overlap", "ellipses_polygon_overlap"],
+    "animation": ["FrameData", "FrameTimer", "precompute", "frame_animation",
+                  "profile_animation"],
+    "render": ["export_animation", "render_frames"],
+    "instrument": ["instrumented", "profiling"],
+    "runner": ["run_all", "run_script"],
+    "concept_maps": ["render_cached"],
+    "layouts": ["LayoutCache", "cached_layout", "graph_hash"],
+    "report": ["run_report"],
+    "geodesy": ["EARTH_RADIUS_KM", "haversine", "pair_distances", "track_lengths", "distance_matrix", "slerp",
+                "great_circle_path"],
+}
+_LOCATION = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LOCATION)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name not in _LOCATION:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_LOCATION[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_EXPORTS))
@@ -0,0 +1,314 @@
+import json
+import os
+from contextlib import contextmanager
+from time import perf_counter
+
+import numpy as np
+from matplotlib.animation import AbstractMovieWriter, FuncAnimation
+
+# =============================================================================
+# Precompute-then-render animations
+# =============================================================================
+# The animation scripts used to evaluate their geometry from a scalar angle
+# inside every FuncAnimation callback.  Here the geometry of all frames is
+# evaluated once, vectorized over the frame parameter, into arrays whose first
+# axis is the frame index; the callbacks only index those arrays and hand the
+# values to the artists.  The arrays can also be saved, reloaded or scrubbed
+# without touching matplotlib.
+#
+# With blit=True the static layer (curves, axes, foci, directrices, ...) is
+# rendered once into a cached background and each frame only redraws the
+# artists returned by the callback, so those must be created once and updated
+# in place (e.g. a quiver instead of re-created arrows).  A rotating 3D camera
+# changes the static layer as well; frame_animation then falls back to full
+# redraws.
+
+
+class FrameData:
+    """
+    Frame-indexed geometry of an animation.
+
+    `frames` holds the per-frame parameter (angle, time, ...) and every other
+    array has one row per frame.  Arrays are reachable as attributes, e.g.
+    ``data.P[i]`` is the point P in frame i.
+    """
+
+    def __init__(self, frames, **arrays):
+        self.precompute_ms = 0.0
+        self.frames = np.asarray(frames)
+        n = len(self.frames)
+        self.arrays = {}
+        for name, value in arrays.items():
+            value = np.asarray(value)
+            if value.shape[:1] != (n,):
+                raise ValueError(f"{name!r} has shape {value.shape}, expected {n} frames first")
+            self.arrays[name] = value
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["arrays"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, i):
+        """All values of frame i as a dict."""
+        return {name: value[i] for name, value in self.arrays.items()}
+
+    def index_of(self, value):
+        """Index of the frame whose parameter is closest to `value` (scrubbing)."""
+        return int(np.argmin(np.abs(self.frames - value)))
+
+    @property
+    def nbytes(self):
+        return self.frames.nbytes + sum(v.nbytes for v in self.arrays.values())
+
+    def save(self, path):
+        """Write all arrays to an .npz file."""
+        np.savez(path, frames=self.frames, **self.arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as f:
+            arrays = {name: f[name] for name in f.files}
+        return cls(arrays.pop("frames"), **arrays)
+
+    def __repr__(self):
+        names = ", ".join(self.arrays)
+        return f"FrameData({len(self)} frames: {names})"
+
+
+def precompute(geometry, frames):
+    """
+    Evaluate the geometry of every frame in one vectorized call.
+
+    :param geometry: Function of the 1-D array of frame parameters returning a
+                     dict of arrays with one row per frame.
+    :param frames: Frame parameters.
+    :return: FrameData; its `precompute_ms` is the time spent here.
+    """
+    frames = np.asarray(frames)
+    start = perf_counter()
+    data = FrameData(frames, **geometry(frames))
+    data.precompute_ms = 1e3 * (perf_counter() - start)
+    return data
+
+
+def frame_animation(fig, data, draw, **kwargs):
+    """
+    FuncAnimation over the frames of `data`; draw(i) receives the frame index.
+
+    If `data` has per-frame camera angles "elev" and/or "azim", they are
+    applied to every 3D axes of the figure before draw(i); when they change
+    over the animation, blitting is turned off because the cached background
+    would show the previous view.
+
+    The callback is timed by a FrameTimer, kept as `anim.frame_timer`, for
+    profile_animation.  The figure, the untimed callback, the init function
+    and the blit flag are kept as `anim.frame_figure`, `anim.frame_draw`,
+    `anim.frame_init` and `anim.frame_blit` for render.py.
+
+    :param fig: Figure to animate.
+    :param data: FrameData.
+    :param draw: Callback that sets artist data from frame i and returns the
+                 changed artists.
+    :param kwargs: Passed on to FuncAnimation (interval, blit, init_func, ...).
+    """
+    timer = FrameTimer()
+    callback = draw
+    camera = [name for name in ("elev", "azim") if name in data.arrays]
+    if camera:
+        axes3d = [ax for ax in fig.axes if ax.name == "3d"]
+        if any(np.ptp(data.arrays[name]) > 0 for name in camera):
+            kwargs["blit"] = False
+
+        def draw_with_camera(i):
+            view = {name: data.arrays[name][i] for name in camera}
+            for ax in axes3d:
+                ax.view_init(**view)
+            return draw(i)
+        callback = draw_with_camera
+
+    anim = FuncAnimation(fig, timer.wrap(callback), frames=len(data), **kwargs)
+    anim.frame_data = data
+    anim.frame_timer = timer
+    anim.frame_figure = fig
+    anim.frame_draw = callback
+    anim.frame_init = kwargs.get("init_func")
+    anim.frame_blit = bool(kwargs.get("blit", False))
+    return anim
+
+
+def segment(start, end):
+    """Stack per-frame endpoints (n, 2) into segments (n, 2, 2) for set_data."""
+    return np.stack(np.broadcast_arrays(start, end), axis=1)
+
+
+def chord_geometry(a, b, phi1, phi_offset):
+    """
+    Chord of the ellipse x²/a² + y²/b² = 1 joining the points of eccentric
+    angles phi1 and phi1 + phi_offset, vectorized over phi1 (one row per frame).
+
+    :return: Dict with the ellipse points P1, P2, the matching points A1, A2
+             of the auxiliary circle (radius a) and the chord segment.
+    """
+    phi1 = np.asarray(phi1, dtype=float)
+    phi2 = (phi1 + phi_offset) % (2 * np.pi)
+    P1 = np.column_stack([a * np.cos(phi1), b * np.sin(phi1)])
+    P2 = np.column_stack([a * np.cos(phi2), b * np.sin(phi2)])
+    A1 = np.column_stack([a * np.cos(phi1), a * np.sin(phi1)])
+    A2 = np.column_stack([a * np.cos(phi2), a * np.sin(phi2)])
+    return {"P1": P1, "P2": P2, "A1": A1, "A2": A2, "chord": segment(P1, P2)}
+
+
+# =============================================================================
+# Frame timing
+# =============================================================================
+# profile_animation drives an animation frame by frame through
+# Animation.save with a writer that writes nothing, so without an event loop
+# and with full redraws (save does not blit), and splits every frame into
+# geometry, artist-update and canvas-draw time.  The callback is timed when it
+# was wrapped with FrameTimer.wrap (frame_animation does this); geometry is
+# whatever it runs inside `with timer.geometry():` (plus the one-off
+# precompute time of animations made by frame_animation) and the rest of the
+# callback counts as artist updates.  Draw time runs from the end of the
+# callback to the canvas's draw_event; for a callback that is not wrapped the
+# whole frame counts as draw.  A frame that takes longer than the animation's
+# interval drops one tick per extra interval.
+
+_PHASES = ("geometry", "artists", "draw", "total")
+
+
+class FrameTimer:
+    """
+    Per-frame timings in milliseconds.
+
+    Attributes
+      interval      requested frame interval (ms), None if unknown.
+      precompute_ms time spent in precompute for this animation.
+      records       one dict per frame: frame, geometry, artists, draw, total.
+    """
+
+    def __init__(self, interval=None):
+        self.interval = interval
+        self.precompute_ms = 0.0
+        self.records = []
+        self._geometry = 0.0
+        self._start = None
+        self._end = None
+
+    @contextmanager
+    def geometry(self):
+        """Mark geometry work done inside an update callback."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._geometry += perf_counter() - start
+
+    def wrap(self, func):
+        """Time a FuncAnimation callback; results go to the current frame."""
+        def timed(*args):
+            self._geometry = 0.0
+            self._start = perf_counter()
+            result = func(*args)
+            self._end = perf_counter()
+            return result
+        return timed
+
+    def dropped(self, total):
+        if not self.interval:
+            return 0
+        return max(int(np.ceil(total / self.interval)) - 1, 0)
+
+    @property
+    def dropped_frames(self):
+        return sum(self.dropped(r["total"]) for r in self.records)
+
+    def summary(self):
+        """Mean, median, 95th percentile and maximum of every phase."""
+        out = {"frames": len(self.records), "interval_ms": self.interval,
+               "precompute_ms": self.precompute_ms, "dropped_frames": self.dropped_frames}
+        for phase in _PHASES:
+            values = np.array([r[phase] for r in self.records]) if self.records else np.zeros(1)
+            out[phase] = {"mean": float(values.mean()), "p50": float(np.percentile(values, 50)),
+                          "p95": float(np.percentile(values, 95)), "max": float(values.max())}
+        return out
+
+    def table(self):
+        s = self.summary()
+        lines = [f"{s['frames']} frames, interval {s['interval_ms']} ms, "
+                 f"precompute {s['precompute_ms']:.2f} ms, dropped {s['dropped_frames']}",
+                 f"{'phase':<10}{'mean':>10}{'p50':>10}{'p95':>10}{'max':>10}"]
+        for phase in _PHASES:
+            v = s[phase]
+            lines.append(f"{phase:<10}{v['mean']:>10.3f}{v['p50']:>10.3f}{v['p95']:>10.3f}{v['max']:>10.3f}")
+        return "\n".join(lines)
+
+    def to_json(self, path=None):
+        """Summary and per-frame records as JSON; written to `path` if given."""
+        text = json.dumps({"summary": self.summary(), "frames": self.records}, indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+
+class _TimingWriter(AbstractMovieWriter):
+    """Movie writer that writes nothing and records a FrameTimer row per frame."""
+
+    def __init__(self, timer):
+        super().__init__()
+        self.timer = timer
+
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi)
+        self._cid = fig.canvas.mpl_connect("draw_event", self._on_draw)
+        self._last = perf_counter()
+
+    def _on_draw(self, event):
+        self._drawn = perf_counter()
+
+    def grab_frame(self, **savefig_kwargs):
+        now = perf_counter()
+        timer = self.timer
+        if timer._start is not None:
+            start = timer._start
+            callback = 1e3 * (timer._end - start)
+            geometry = 1e3 * timer._geometry
+            draw = 1e3 * (self._drawn - timer._end)
+        else:
+            start = self._last
+            callback = geometry = 0.0
+            draw = 1e3 * (self._drawn - start)
+        timer.records.append({"frame": len(timer.records), "geometry": geometry,
+                              "artists": callback - geometry, "draw": draw,
+                              "total": 1e3 * (now - start)})
+        timer._start = None
+        self._last = now
+
+    def finish(self):
+        self.fig.canvas.mpl_disconnect(self._cid)
+
+
+def profile_animation(anim, timer=None):
+    """
+    Render every frame of an animation synchronously and time it.
+
+    :param anim: Animation (its figure should use a non-interactive or idle
+                 canvas, e.g. Agg).
+    :param timer: FrameTimer whose wrap() timed the callback (default: the
+                  frame_timer of frame_animation, else a new one).
+    :return: The FrameTimer.
+    """
+    if timer is None:
+        timer = getattr(anim, "frame_timer", None) or FrameTimer()
+    if timer.interval is None:
+        timer.interval = anim.event_source.interval
+    data = getattr(anim, "frame_data", None)
+    if data is not None:
+        timer.precompute_ms += data.precompute_ms
+    anim.save(os.devnull, writer=_TimingWriter(timer))
+    return timer
@@ -0,0 +1,244 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# =============================================================================
+# Benchmark suite for the geometry kernels
+# =============================================================================
+# Every benchmark is a setup function registered under a name: given a
+# problem size n and a random generator it builds the inputs and returns a
+# zero-argument callable that processes n elements.  The runner times that
+# callable repeatedly (at least `min_time` seconds, at least three times),
+# measures peak traced memory in one extra run under tracemalloc (NumPy
+# reports its buffers to it), and reports throughput and latency
+# percentiles.  Results are plain JSON so they can be stored as baselines
+# and compared against later runs:
+#
+#     python -m analytical_geometry.bench --save baseline.json
+#     python -m analytical_geometry.bench --compare baseline.json --threshold 0.2
+#
+# The comparison exits with status 1 when a median latency regresses by more
+# than the threshold, which is what an upgrade gate needs.
+
+DEFAULT_SIZES = (10, 1000, 100_000, 10_000_000)
+
+_BENCHMARKS = {}
+
+
+def register(name, max_size=None):
+    """Register setup(n, rng) -> callable as benchmark `name`; sizes above
+    max_size are skipped."""
+    def wrap(setup):
+        _BENCHMARKS[name] = (setup, max_size)
+        return setup
+    return wrap
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+A, B = 5.0, 3.0
+
+
+@register("position_of_point")
+def _bench_position(n, rng):
+    from analytical_geometry.kernels import position_of_point
+    points = rng.uniform(-6, 6, (n, 2))
+    return lambda: position_of_point(A, B, points)
+
+
+@register("is_inside_ellipse")
+def _bench_inside(n, rng):
+    from analytical_geometry.kernels import is_inside_ellipse
+    x, y = rng.uniform(-6, 6, (2, n))
+    return lambda: is_inside_ellipse(x, y, A, B)
+
+
+@register("tangent_at")
+def _bench_tangent_at(n, rng):
+    from analytical_geometry.kernels import tangent_at
+    theta = rng.uniform(0, 2 * np.pi, n)
+    return lambda: tangent_at(A, B, theta)
+
+
+@register("tangent_slope")
+def _bench_tangent_slope(n, rng):
+    from analytical_geometry.kernels import point_at, tangent_slope
+    x, y = point_at(A, B, rng.uniform(0, 2 * np.pi, n)).T
+    return lambda: tangent_slope(A, B, x, y)
+
+
+@register("line_intersections")
+def _bench_line_intersections(n, rng):
+    from analytical_geometry.kernels import line_intersections
+    m = rng.uniform(-2, 2, n)
+    c = rng.uniform(-6, 6, n)
+    return lambda: line_intersections(A, B, m, c)
+
+
+@register("rotate_points")
+def _bench_rotate(n, rng):
+    from analytical_geometry.kernels import rotate_points
+    points = rng.uniform(-6, 6, (n, 2))
+    return lambda: rotate_points(points, 0.7, pivot=np.array([1.0, -2.0]))
+
+
+@register("simulate_potential_field", max_size=100_000)
+def _bench_planning(n, rng):
+    """n robots for 50 Euler steps of the PAth Planning.py field."""
+    from analytical_geometry.planning import simulate_potential_field
+    start = rng.uniform(-8, -5, (n, 2))
+    goal = np.array([7.0, 7.0])
+    out = np.empty((51, n, 2))
+    return lambda: simulate_potential_field(start, goal, 3, 2, k_attr=1.0, k_rep=10.0, d0=1.5,
+                                            dt=0.05, num_steps=50, out=out)
+
+
+@register("pair_distances")
+def _bench_pair_distances(n, rng):
+    from analytical_geometry.geodesy import pair_distances
+    lat1, lat2 = rng.uniform(-90, 90, (2, n))
+    lon1, lon2 = rng.uniform(-180, 180, (2, n))
+    out = np.empty(n)
+    return lambda: pair_distances(lat1, lon1, lat2, lon2, out=out)
+
+
+@register("slerp", max_size=1_000_000)
+def _bench_slerp(n, rng):
+    from analytical_geometry.geodesy import slerp
+    lat1, lat2 = rng.uniform(-90, 90, (2, n))
+    lon1, lon2 = rng.uniform(-180, 180, (2, n))
+    fraction = rng.uniform(0, 1, n)
+    return lambda: slerp(lat1, lon1, lat2, lon2, fraction)
+
+
+@register("distance_matrix", max_size=4000)
+def _bench_distance_matrix(n, rng):
+    """n points against themselves (n² distances)."""
+    from analytical_geometry.geodesy import distance_matrix
+    lat = rng.uniform(-90, 90, n)
+    lon = rng.uniform(-180, 180, n)
+    out = np.empty((n, n))
+    return lambda: distance_matrix(lat, lon, out=out)
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+def _time_one(func, min_time, max_repeats):
+    func()  # warm-up (first-call allocations, lazy imports)
+    samples = []
+    begin = time.perf_counter()
+    while len(samples) < 3 or (time.perf_counter() - begin < min_time and len(samples) < max_repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return np.array(samples)
+
+
+def _peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(names=None, sizes=DEFAULT_SIZES, min_time=0.2, max_repeats=200, seed=0):
+    """
+    Run the registered benchmarks.
+
+    :param names: Benchmarks to run (default: all).
+    :param sizes: Problem sizes (elements per call).
+    :param min_time: Minimum timed seconds per benchmark and size.
+    :param max_repeats: Upper bound on timed calls per benchmark and size.
+    :param seed: Seed of the input generator.
+    :return: JSON-compatible dict {"meta": ..., "results": {name: {size: stats}}}.
+    """
+    names = list(_BENCHMARKS) if names is None else list(names)
+    results = {}
+    for name in names:
+        setup, max_size = _BENCHMARKS[name]
+        results[name] = {}
+        for n in sizes:
+            if max_size is not None and n > max_size:
+                continue
+            func = setup(int(n), np.random.default_rng(seed))
+            samples = _time_one(func, min_time, max_repeats)
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+            results[name][str(n)] = {
+                "repeats": len(samples),
+                "p50_ms": 1e3 * p50, "p95_ms": 1e3 * p95, "p99_ms": 1e3 * p99,
+                "min_ms": 1e3 * samples.min(),
+                "throughput_per_s": n / p50,
+                "peak_bytes": _peak_memory(func),
+            }
+    meta = {"python": platform.python_version(), "numpy": np.__version__,
+            "platform": platform.platform(), "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    return {"meta": meta, "results": results}
+
+
+def compare(current, baseline, threshold=0.1):
+    """
+    Median-latency regressions of `current` against `baseline`.
+
+    :param threshold: Allowed relative slow-down (0.1 = 10 %).
+    :return: List of (name, size, baseline_ms, current_ms, ratio), worst first.
+    """
+    regressions = []
+    for name, by_size in current["results"].items():
+        for size, stats in by_size.items():
+            base = baseline["results"].get(name, {}).get(size)
+            if base is None:
+                continue
+            ratio = stats["p50_ms"] / base["p50_ms"]
+            if ratio > 1 + threshold:
+                regressions.append((name, size, base["p50_ms"], stats["p50_ms"], ratio))
+    return sorted(regressions, key=lambda r: -r[4])
+
+
+def format_results(report):
+    lines = [f"{'benchmark':<26}{'n':>10}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}"
+             f"{'elem/s':>12}{'peak MB':>10}"]
+    for name, by_size in report["results"].items():
+        for size, s in by_size.items():
+            lines.append(f"{name:<26}{size:>10}{s['p50_ms']:>12.4f}{s['p95_ms']:>12.4f}"
+                         f"{s['p99_ms']:>12.4f}{s['throughput_per_s']:>12.3g}"
+                         f"{s['peak_bytes'] / 2**20:>10.2f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the geometry kernels.")
+    parser.add_argument("--only", nargs="+", choices=sorted(_BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--save", metavar="JSON", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="baseline to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="allowed relative slow-down of the median (default 0.1)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.only, args.sizes, args.min_time)
+    print(format_results(report))
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for name, size, before, after, ratio in regressions:
+            print(f"REGRESSION {name} n={size}: {before:.4f} ms -> {after:.4f} ms ({ratio:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
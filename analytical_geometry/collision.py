@@ -0,0 +1,333 @@
+import numpy as np
+
+from analytical_geometry.ellipses import EllipseBatch, ellipse_distance_local
+from analytical_geometry.scene import EllipseScene
+
+# =============================================================================
+# Continuous collision detection for a disc robot against ellipses
+# =============================================================================
+# A disc of radius r centred at c(t) = p0 + t (p1 - p0) touches an ellipse when
+# the signed distance d(t) from c(t) to the ellipse equals r.  The signed
+# distance to a convex set is convex, so along a segment d(t) is convex in t
+# and {t : d(t) <= r} is a single interval.  Newton's method started at t = 0
+# on a convex, decreasing function never overshoots its first root, which
+# gives the exact time of first contact in a few iterations; a non-negative
+# slope before the root proves that the disc never reaches the ellipse.
+
+
+def _as_batch(obstacles):
+    if isinstance(obstacles, EllipseBatch):
+        return obstacles
+    return EllipseBatch.from_array(obstacles)
+
+
+def _segment_candidates(p0, p1, r, obstacles, chunk):
+    """(segment, obstacle) pairs whose r-inflated AABBs overlap."""
+    box = np.column_stack(obstacles.aabb())
+    lo = np.minimum(p0, p1) - r[:, None]
+    hi = np.maximum(p0, p1) + r[:, None]
+    seg, obs = [], []
+    step = max(1, chunk // len(obstacles))
+    for start in range(0, len(p0), step):
+        sl = slice(start, start + step)
+        overlap = ((lo[sl, None, 0] <= box[None, :, 2]) & (hi[sl, None, 0] >= box[None, :, 0]) &
+                   (lo[sl, None, 1] <= box[None, :, 3]) & (hi[sl, None, 1] >= box[None, :, 1]))
+        s, k = np.nonzero(overlap)
+        seg.append(s + start)
+        obs.append(k)
+    return np.concatenate(seg), np.concatenate(obs)
+
+
+def swept_disc_contact(p0, p1, r, obstacles, tol=1e-10, max_iter=50,
+                       chunk=1 << 20):
+    """
+    First contact of discs swept along segments p0 -> p1 with ellipses.
+
+    :param p0: (S, 2) segment starts.
+    :param p1: (S, 2) segment ends.
+    :param r: Disc radius, scalar or (S,).
+    :param obstacles: EllipseBatch or (n, 5) array of (cx, cy, a, b, phi).
+    :param tol: Convergence tolerance on d(t) - r.
+    :param max_iter: Newton iteration cap.
+    :param chunk: Approximate number of segment-obstacle pairs per AABB block.
+    :return: Tuple (t, point, obstacle): contact parameter in [0, 1] (inf if
+             the disc stays clear), contact point on the ellipse boundary
+             ((S, 2), NaN if clear) and obstacle index (-1 if clear).  A disc
+             already touching at p0 reports t = 0.
+    """
+    obstacles = _as_batch(obstacles)
+    p0 = np.asarray(p0, dtype=float).reshape(-1, 2)
+    p1 = np.asarray(p1, dtype=float).reshape(-1, 2)
+    S = len(p0)
+    r = np.broadcast_to(np.asarray(r, dtype=float), (S,))
+    t_hit = np.full(S, np.inf)
+    point = np.full((S, 2), np.nan)
+    which = np.full(S, -1)
+    if S == 0 or len(obstacles) == 0:
+        return t_hit, point, which
+
+    seg, obs = _segment_candidates(p0, p1, r, obstacles, chunk)
+    c, s = np.cos(obstacles.phi[obs]), np.sin(obstacles.phi[obs])
+    a, b = obstacles.a[obs], obstacles.b[obs]
+    # Segment in each obstacle's local frame: x(t) = x0 + t * vx.
+    dx0 = p0[seg, 0] - obstacles.cx[obs]
+    dy0 = p0[seg, 1] - obstacles.cy[obs]
+    x0, y0 = dx0 * c + dy0 * s, -dx0 * s + dy0 * c
+    ux, uy = p1[seg, 0] - p0[seg, 0], p1[seg, 1] - p0[seg, 1]
+    vx, vy = ux * c + uy * s, -ux * s + uy * c
+    rr = r[seg]
+
+    t = np.zeros(len(seg))
+    hit = np.zeros(len(seg), dtype=bool)
+    qx, qy = np.full(len(seg), np.nan), np.full(len(seg), np.nan)
+    live = np.arange(len(seg))
+    for _ in range(max_iter):
+        if live.size == 0:
+            break
+        px = x0[live] + t[live] * vx[live]
+        py = y0[live] + t[live] * vy[live]
+        d, cx_, cy_ = ellipse_distance_local(a[live], b[live], px, py)
+        gap = d - rr[live]
+        touching = gap <= tol
+        hit[live[touching]] = True
+        qx[live[touching]], qy[live[touching]] = cx_[touching], cy_[touching]
+        # Slope of d along the segment: outward unit normal dotted with velocity.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = ((px - cx_) * vx[live] + (py - cy_) * vy[live]) / d
+        step = np.where(slope < 0, -gap / slope, np.inf)
+        t_next = t[live] + step
+        going = ~touching & (t_next <= 1.0)
+        t[live[going]] = t_next[going]
+        live = live[going]
+
+    if hit.any():
+        idx = np.nonzero(hit)[0]
+        # Earliest contact per segment over all its obstacles.
+        order = np.lexsort((t[idx], seg[idx]))
+        idx = idx[order]
+        first = np.ones(len(idx), dtype=bool)
+        first[1:] = seg[idx][1:] != seg[idx][:-1]
+        idx = idx[first]
+        k = seg[idx]
+        t_hit[k] = t[idx]
+        which[k] = obs[idx]
+        cc, ss = c[idx], s[idx]
+        point[k, 0] = obstacles.cx[obs[idx]] + qx[idx] * cc - qy[idx] * ss
+        point[k, 1] = obstacles.cy[obs[idx]] + qx[idx] * ss + qy[idx] * cc
+    return t_hit, point, which
+
+
+def first_contact(paths, r, obstacles, **kwargs):
+    """
+    First contact of a disc robot following polyline paths.
+
+    :param paths: (N, 2) path or (P, N, 2) batch of paths.
+    :param r: Robot radius, scalar or (P,).
+    :param obstacles: EllipseBatch or (n, 5) array of (cx, cy, a, b, phi).
+    :param kwargs: Passed on to swept_disc_contact.
+    :return: Tuple (time, point, obstacle) per path: time is the fractional
+             vertex index k + t of first contact on segment k (inf if the
+             path is clear), with contact point and obstacle index as in
+             swept_disc_contact.
+    """
+    paths = np.asarray(paths, dtype=float)
+    single = paths.ndim == 2
+    paths = np.atleast_3d(paths) if not single else paths[None]
+    P, N = paths.shape[:2]
+    r = np.broadcast_to(np.asarray(r, dtype=float), (P,))
+    if N == 1:
+        paths = np.concatenate([paths, paths], axis=1)
+        N = 2
+    p0 = paths[:, :-1].reshape(-1, 2)
+    p1 = paths[:, 1:].reshape(-1, 2)
+    t, pts, obs = swept_disc_contact(p0, p1, np.repeat(r, N - 1), obstacles, **kwargs)
+    t = (t + np.tile(np.arange(N - 1), P)).reshape(P, N - 1)
+    k = np.argmin(t, axis=1)
+    rows = np.arange(P)
+    time = t[rows, k]
+    point = pts.reshape(P, N - 1, 2)[rows, k]
+    which = obs.reshape(P, N - 1)[rows, k]
+    if single:
+        return time[0], point[0], which[0]
+    return time, point, which
+
+
+# =============================================================================
+# Discrete path validation
+# =============================================================================
+class PathCollisions:
+    """
+    Output of path_collisions (P = 1 for a single (N, 2) path).
+
+    Attributes
+      first_index (P,) first pose whose disc overlaps an obstacle, -1 if none.
+      depth       (P,) penetration depth r - d at that pose, 0 if clear.
+      obstacle    (P,) obstacle hit at that pose, -1 if clear.
+      clearance   (P, N) signed distance minus r per pose (inf far from all
+                  obstacles, negative when penetrating).
+    """
+
+    def __init__(self, paths, first_index, depth, obstacle, clearance):
+        self.paths = paths
+        self.first_index = first_index
+        self.depth = depth
+        self.obstacle = obstacle
+        self.clearance = clearance
+
+    @property
+    def colliding(self):
+        """(P, N) boolean mask of colliding poses (touching included)."""
+        return self.clearance <= 0
+
+    def prefix(self, p=0):
+        """Collision-free prefix of path p (the whole path if it is clear)."""
+        k = self.first_index[p]
+        return self.paths[p] if k < 0 else self.paths[p, :k]
+
+    def __repr__(self):
+        clear = int(np.count_nonzero(self.first_index < 0))
+        return f"PathCollisions(P={self.first_index.size}, clear={clear})"
+
+
+def path_collisions(paths, r, obstacles):
+    """
+    Validate the poses of whole paths for a disc robot in one vectorized pass.
+
+    Only the listed poses are checked; use first_contact for the continuous
+    motion between them.
+
+    :param paths: (N, 2) path or (P, N, 2) batch of paths.
+    :param r: Robot radius, scalar or (P,).
+    :param obstacles: EllipseScene, EllipseBatch or (n, 5) array.
+    :return: PathCollisions.
+    """
+    paths = np.asarray(paths, dtype=float)
+    if paths.ndim == 2:
+        paths = paths[None]
+    P, N = paths.shape[:2]
+    r = np.broadcast_to(np.asarray(r, dtype=float), (P,))
+    scene = obstacles if isinstance(obstacles, EllipseScene) else EllipseScene(_as_batch(obstacles))
+
+    qi, oi, dist = scene.near(paths.reshape(-1, 2), r.max())
+    clearance = np.full(P * N, np.inf)
+    np.minimum.at(clearance, qi, dist - r[qi // N])
+    clearance = clearance.reshape(P, N)
+
+    hit = clearance <= 0
+    first = np.where(hit.any(axis=1), np.argmax(hit, axis=1), -1)
+    depth = np.zeros(P)
+    obstacle = np.full(P, -1)
+    rows = np.flatnonzero(first >= 0)
+    if len(rows):
+        depth[rows] = -clearance[rows, first[rows]]
+        # Deepest obstacle at the first colliding pose.
+        q = rows * N + first[rows]
+        sel = np.isin(qi, q)
+        gap = dist[sel] - r[qi[sel] // N]
+        order = np.lexsort((gap, qi[sel]))
+        qs, os = qi[sel][order], oi[sel][order]
+        lead = np.r_[True, qs[1:] != qs[:-1]]
+        obstacle[qs[lead] // N] = os[lead]
+    return PathCollisions(paths, first, depth, obstacle, clearance)
+
+
+# =============================================================================
+# Ellipse-ellipse overlap from the characteristic polynomial
+# =============================================================================
+# With ellipses written as symmetric 3x3 matrices A, B (X^T A X < 0 inside,
+# X = (x, y, 1)), the characteristic polynomial f(λ) = det(λA - B) is a cubic
+# with one positive root, and the two elliptic disks are separated exactly
+# when f has two distinct negative roots (Choi, Wang, Liu, Kim, "Continuous
+# collision detection for two moving elliptic disks", IEEE T-RO 2006).
+#
+# Scaling A and B to determinant -1 turns -f into the monic cubic
+#     g(λ) = λ³ + t1 λ² - t2 λ - 1,   t1 = tr(adj(A) B),  t2 = tr(A adj(B)).
+# The product of its roots is 1, so with three distinct real roots (positive
+# discriminant) there are either two negative roots or none; by Descartes'
+# rule (exact when every root is real) there are none precisely when the
+# coefficients alternate in sign, i.e. t1 < 0 and t2 < 0.  No roots are ever
+# computed, so the test is a fixed, branch-free sequence of array operations.
+
+
+def _unit_det_conics(batch):
+    """
+    Matrix entries scaled to determinant -1, as two (n, 6) arrays: the entries
+    (a11, a22, a33, a12, a13, a23) and the matching adjugate entries with the
+    off-diagonal ones doubled, so that tr(adj(M) N) = adj_M @ entries_N.
+    """
+    A, B, C, D, E, F = batch.conic_coefficients()
+    k = (batch.a * batch.b)**(2/3)
+    m11, m22, m33 = A * k, C * k, F * k
+    m12, m13, m23 = 0.5 * B * k, 0.5 * D * k, 0.5 * E * k
+    entries = np.column_stack([m11, m22, m33, m12, m13, m23])
+    adj = np.column_stack([m22 * m33 - m23**2,
+                           m11 * m33 - m13**2,
+                           m11 * m22 - m12**2,
+                           2 * (m13 * m23 - m12 * m33),
+                           2 * (m12 * m23 - m13 * m22),
+                           2 * (m12 * m13 - m11 * m23)])
+    return entries, adj
+
+
+def _separated(t1, t2):
+    """Separation test from t1 = tr(adj(A) B) and t2 = tr(A adj(B))."""
+    # Discriminant of λ³ + p λ² + q λ + r with p = t1, q = -t2, r = -1:
+    #     -18 p q + 4 p³ + p² q² - 4 q³ - 27
+    #   = t1² (4 t1 + t2²) + t2 (4 t2² + 18 t1) - 27   (evaluated in place)
+    sq = t2 * t2
+    disc = np.multiply(t1, 4.0)
+    disc += sq
+    disc *= t1
+    disc *= t1
+    sq *= 4.0
+    sq += 18.0 * t1
+    sq *= t2
+    disc += sq
+    separated = disc > 27.0
+    separated &= (t1 >= 0) | (t2 >= 0)
+    return separated
+
+
+def ellipses_overlap(first, second, pairs=None):
+    """
+    Overlap test for pairs of ellipses.  Touching or nested ellipses count as
+    overlapping.
+
+    Without `pairs`, the batches are compared element-wise (equal lengths, or
+    one of them a single ellipse).  With `pairs` = (i, j), e.g. the candidate
+    pairs of a broad phase, first[i[k]] is tested against second[j[k]]; the
+    per-ellipse matrices are then built once per ellipse, not once per pair.
+
+    :param first: EllipseBatch or (n, 5) array of (cx, cy, a, b, phi).
+    :param second: EllipseBatch or (m, 5) array.
+    :param pairs: Optional tuple of index arrays (i, j).
+    :return: Boolean array, True where the pair overlaps.
+    """
+    m, adj_m = _unit_det_conics(_as_batch(first))
+    n, adj_n = _unit_det_conics(_as_batch(second))
+    if pairs is not None:
+        i, j = pairs
+        m, adj_m, n, adj_n = m[i], adj_m[i], n[j], adj_n[j]
+    t1 = np.einsum("ij,ij->i", *np.broadcast_arrays(adj_m, n))
+    t2 = np.einsum("ij,ij->i", *np.broadcast_arrays(m, adj_n))
+    return ~_separated(t1, t2)
+
+
+def ellipses_overlap_matrix(first, second, chunk=1 << 22):
+    """
+    All-pairs overlap test.  The traces for every pair come from two small
+    matrix products, so the per-pair work is only the sign logic.
+
+    :param first: EllipseBatch (n ellipses) or (n, 5) array.
+    :param second: EllipseBatch (m ellipses) or (m, 5) array.
+    :param chunk: Approximate number of pairs evaluated per block.
+    :return: Boolean (n, m) array.
+    """
+    m, adj_m = _unit_det_conics(_as_batch(first))
+    n, adj_n = _unit_det_conics(_as_batch(second))
+    out = np.empty((len(m), len(n)), dtype=bool)
+    step = max(1, chunk // max(len(n), 1))
+    for start in range(0, len(m), step):
+        sl = slice(start, start + step)
+        out[sl] = ~_separated(adj_m[sl] @ n.T, m[sl] @ adj_n.T)
+    return out
@@ -0,0 +1,185 @@
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import runpy
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# =============================================================================
+# Content-hashed rendering of the graphviz concept maps
+# =============================================================================
+# The concept-map scripts build a graphviz Digraph and hand it to
+# render_cached instead of calling dot.render(..., view=True).  The output is
+# identified by the SHA-256 of the DOT source, the layout engine and the
+# format; a manifest (.graphviz-cache.json) in the output directory records
+# the digest each output was rendered from, and an output whose digest still
+# matches is not laid out again.
+#
+# Build mode runs the scripts only to collect their graphs (building a
+# Digraph is cheap, the layout is not), then renders the stale ones in
+# parallel processes and never opens a viewer:
+#
+#     python -m analytical_geometry.concept_maps --outdir docs/maps
+#
+# graphviz (the Python package and the `dot` executable) is only needed to
+# render.
+
+MANIFEST = ".graphviz-cache.json"
+
+# While collect() runs a script, render_cached appends its jobs here instead
+# of rendering.
+_COLLECTING = None
+
+
+def graph_digest(source, engine="dot", format="png"):
+    """SHA-256 identifying the rendering of a DOT source."""
+    return hashlib.sha256(f"{engine}\0{format}\0{source}".encode()).hexdigest()
+
+
+def _load_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+class RenderJob:
+    """One graph to render: DOT source, output name (without extension), format and engine."""
+
+    def __init__(self, source, filename, format="png", engine="dot"):
+        self.source = source
+        self.filename = filename
+        self.format = format
+        self.engine = engine
+
+    @property
+    def output(self):
+        return f"{self.filename}.{self.format}"
+
+    @property
+    def digest(self):
+        return graph_digest(self.source, self.engine, self.format)
+
+    def is_current(self, directory, manifest):
+        return (manifest.get(self.output) == self.digest
+                and os.path.exists(os.path.join(directory, self.output)))
+
+    def __repr__(self):
+        return f"RenderJob({self.output!r}, engine={self.engine!r})"
+
+
+def _render(job, directory):
+    import graphviz
+    graphviz.Source(job.source, engine=job.engine).render(
+        job.filename, directory=directory, format=job.format, view=False)
+    return job.output
+
+
+def render_cached(dot, filename, format="png", directory=".", view=False):
+    """
+    Render a graphviz graph unless its output is already up to date.
+
+    :param dot: graphviz Graph/Digraph/Source.
+    :param filename: Output name without extension (the DOT source is
+                     written under this name, as dot.render does).
+    :param format: Output format.
+    :param directory: Output directory.
+    :param view: Open the output in a viewer (never in build mode).
+    :return: Path of the output file.
+    """
+    job = RenderJob(dot.source, filename, format, getattr(dot, "engine", "dot"))
+    if _COLLECTING is not None:
+        _COLLECTING.append(job)
+        return os.path.join(directory, job.output)
+    manifest = _load_manifest(directory)
+    if not job.is_current(directory, manifest):
+        _render(job, directory)
+        manifest[job.output] = job.digest
+        _save_manifest(directory, manifest)
+    path = os.path.join(directory, job.output)
+    if view:
+        import graphviz
+        graphviz.view(path)
+    return path
+
+
+def collect(script):
+    """Run `script` and return the RenderJobs it requests, without rendering."""
+    folder = os.path.dirname(os.path.abspath(script))
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    # Under `python -m` this file is __main__; the scripts call render_cached
+    # of the imported package module, so collect through that one.
+    module = importlib.import_module("analytical_geometry.concept_maps")
+    module._COLLECTING = jobs = []
+    try:
+        runpy.run_path(script, run_name="__main__")
+        return jobs
+    finally:
+        module._COLLECTING = None
+
+
+def discover(root="."):
+    """Top-level scripts of `root` that render through render_cached."""
+    scripts = []
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if name.endswith(".py") and os.path.isfile(path):
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                if "render_cached(" in f.read():
+                    scripts.append(path)
+    return scripts
+
+
+def build(scripts, directory=".", workers=None, force=False):
+    """
+    Render the graphs of `scripts` whose outputs are missing or out of date.
+
+    :param scripts: Concept-map scripts.
+    :param directory: Output directory.
+    :param workers: Process count (default: CPU count).
+    :param force: Render every graph regardless of the manifest.
+    :return: Dict {"rendered": [outputs], "current": [outputs]}.
+    """
+    os.makedirs(directory, exist_ok=True)
+    jobs = [job for script in scripts for job in collect(script)]
+    manifest = _load_manifest(directory)
+    stale = [job for job in jobs if force or not job.is_current(directory, manifest)]
+    if stale:
+        workers = min(workers or os.cpu_count() or 1, len(stale))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_render, stale, [directory] * len(stale)))
+        manifest.update({job.output: job.digest for job in stale})
+        _save_manifest(directory, manifest)
+    rendered = {job.output for job in stale}
+    return {"rendered": sorted(rendered),
+            "current": sorted(job.output for job in jobs if job.output not in rendered)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the concept maps that changed.")
+    parser.add_argument("scripts", nargs="*", help="scripts (default: every render_cached script)")
+    parser.add_argument("--root", default=".", help="directory holding the scripts")
+    parser.add_argument("--outdir", default=".", help="output directory")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="render every map")
+    args = parser.parse_args(argv)
+    result = build(args.scripts or discover(args.root), args.outdir, args.workers, args.force)
+    for output in result["rendered"]:
+        print(f"rendered  {output}")
+    for output in result["current"]:
+        print(f"current   {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import importlib.util
+from functools import lru_cache
+
+import numpy as np
+
+# numba is optional (the NumPy path is always available) and slow to import,
+# so only its presence is checked here; it is imported on first use.
+_HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+# =============================================================================
+# General conic:  A x² + B xy + C y² + D x + E y + F = 0
+# =============================================================================
+# Coefficients are passed around as a 6-tuple (A, B, C, D, E, F), the same
+# ordering used in "Transformation of corrdiantes.py" (B is the full xy term).
+#
+# Evaluation uses the factored (Horner) form
+#     f(x, y) = ((A x + D) + B y) * x + ((C y + E) * y + F)
+# so that every term depending on a single axis is computed on that axis only.
+# For open grids (x of shape (1, N), y of shape (M, 1)) this means the only
+# (M, N) array ever allocated is the output itself.
+
+
+def rotate_conic(coeffs, theta):
+    """
+    Coefficients of g(x, y) = f(x cosθ - y sinθ, x sinθ + y cosθ).
+
+    Evaluating the returned conic on an unrotated grid gives the same values as
+    evaluating the original conic on a grid rotated by theta, without ever
+    building the rotated grids.
+
+    :param coeffs: Tuple (A, B, C, D, E, F).
+    :param theta: Rotation angle in radians.
+    :return: Tuple (A', B', C', D', E', F').
+    """
+    A, B, C, D, E, F = coeffs
+    c, s = np.cos(theta), np.sin(theta)
+    A_new = A*c**2 + B*c*s + C*s**2
+    B_new = 2*(C - A)*c*s + B*(c**2 - s**2)
+    C_new = A*s**2 - B*c*s + C*c**2
+    D_new = D*c + E*s
+    E_new = -D*s + E*c
+    return A_new, B_new, C_new, D_new, E_new, F
+
+
+def translate_conic(coeffs, h, k):
+    """
+    Coefficients of g(x, y) = f(x + h, y + k), i.e. the conic written in
+    parallel axes through the point (h, k).
+
+    :param coeffs: Tuple (A, B, C, D, E, F).
+    :param h: x coordinate of the new origin.
+    :param k: y coordinate of the new origin.
+    :return: Tuple (A, B, C, D', E', F').
+    """
+    A, B, C, D, E, F = coeffs
+    D_new = D + 2*A*h + B*k
+    E_new = E + 2*C*k + B*h
+    F_new = A*h**2 + B*h*k + C*k**2 + D*h + E*k + F
+    return A, B, C, D_new, E_new, F_new
+
+
+def eval_conic(coeffs, x, y, out=None):
+    """
+    Evaluate A x² + B xy + C y² + D x + E y + F for broadcastable x and y.
+
+    x and y may be dense arrays of the same shape or open grids such as those
+    returned by np.ogrid / np.meshgrid(..., sparse=True). Every per-axis term is
+    computed on the (small) input arrays, and the result is accumulated in place
+    into `out`, which is allocated only if the caller does not supply one.
+
+    :param coeffs: Tuple (A, B, C, D, E, F).
+    :param x: x coordinates (array-like).
+    :param y: y coordinates (array-like), broadcastable against x.
+    :param out: Optional float array with the broadcast shape of x and y.
+    :return: The evaluated conic (the `out` array when given).
+    """
+    A, B, C, D, E, F = coeffs
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    shape = np.broadcast_shapes(x.shape, y.shape)
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+
+    # Per-axis pieces: size of x and size of y respectively.
+    x_part = A * x + D
+    y_part = (C * y + E) * y + F
+
+    # out = ((B y + x_part) * x) + y_part, one in-place pass per operation.
+    np.multiply(y, B, out=out)
+    np.add(out, x_part, out=out)
+    np.multiply(out, x, out=out)
+    np.add(out, y_part, out=out)
+    return out
+
+
+def _eval_conic_grid_loop(A, B, C, D, E, F, x, y, out):
+    for i in range(y.shape[0]):
+        yi = y[i]
+        x_shift = B * yi + D
+        y_part = (C * yi + E) * yi + F
+        for j in range(x.shape[0]):
+            xj = x[j]
+            out[i, j] = (A * xj + x_shift) * xj + y_part
+    return out
+
+
+@lru_cache(maxsize=None)
+def _eval_conic_grid_jit():
+    import numba
+    return numba.njit(cache=True)(_eval_conic_grid_loop)
+
+
+def eval_conic_grid(coeffs, x, y, out=None, use_jit=None):
+    """
+    Evaluate a conic on the grid spanned by 1-D axes x (columns) and y (rows).
+
+    The result matches evaluating on np.meshgrid(x, y) (shape (len(y), len(x)))
+    but no coordinate grids are built. With numba installed the evaluation is a
+    single fused pass over the output; otherwise it falls back to eval_conic on
+    the open grid.
+
+    :param coeffs: Tuple (A, B, C, D, E, F).
+    :param x: 1-D array of x values.
+    :param y: 1-D array of y values.
+    :param out: Optional float array of shape (len(y), len(x)).
+    :param use_jit: Force (True) or disable (False) the numba kernel.
+                    Defaults to using it whenever numba is available.
+    :return: The evaluated conic (the `out` array when given).
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if use_jit is None:
+        use_jit = _HAVE_NUMBA
+    if use_jit:
+        if not _HAVE_NUMBA:
+            raise RuntimeError("use_jit=True requires numba to be installed")
+        if out is None:
+            out = np.empty((y.size, x.size))
+        elif out.shape != (y.size, x.size):
+            raise ValueError(f"out has shape {out.shape}, expected {(y.size, x.size)}")
+        A, B, C, D, E, F = (float(v) for v in coeffs)
+        return _eval_conic_grid_jit()(A, B, C, D, E, F, x, y, out)
+    return eval_conic(coeffs, x[None, :], y[:, None], out=out)
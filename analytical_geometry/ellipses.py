@@ -0,0 +1,204 @@
+import numpy as np
+
+# =============================================================================
+# Batches of rotated, translated ellipses
+# =============================================================================
+# An ellipse with centre (cx, cy), semi-axes a (along its own x' axis) and b,
+# rotated by phi radians is the set of points whose local coordinates
+#     x' =  (x - cx) cos(phi) + (y - cy) sin(phi)
+#     y' = -(x - cx) sin(phi) + (y - cy) cos(phi)
+# satisfy x'²/a² + y'²/b² = 1.  EllipseBatch stores many such ellipses as
+# parallel 1-D arrays so that every query below runs as one NumPy pass.
+
+
+class EllipseBatch:
+    """
+    A batch of n ellipses stored as arrays cx, cy, a, b, phi of length n.
+
+    Scalars are broadcast, so EllipseBatch(0, 0, 3, 2) is a single ellipse
+    equivalent to the obstacle used in "Collision detection.py".
+    """
+
+    def __init__(self, cx, cy, a, b, phi=0.0):
+        cx, cy, a, b, phi = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (cx, cy, a, b, phi)))
+        if cx.ndim != 1:
+            raise ValueError("EllipseBatch parameters must be scalars or 1-D arrays")
+        if np.any(a <= 0) or np.any(b <= 0):
+            raise ValueError("semi-axes a and b must be positive")
+        self.cx, self.cy = cx.copy(), cy.copy()
+        self.a, self.b, self.phi = a.copy(), b.copy(), phi.copy()
+
+    @classmethod
+    def from_array(cls, params):
+        """Build a batch from an (n, 5) array of rows (cx, cy, a, b, phi)."""
+        params = np.asarray(params, dtype=float).reshape(-1, 5)
+        return cls(*params.T)
+
+    def as_array(self):
+        """Return the batch as an (n, 5) array of rows (cx, cy, a, b, phi)."""
+        return np.column_stack([self.cx, self.cy, self.a, self.b, self.phi])
+
+    def __len__(self):
+        return self.cx.size
+
+    def __getitem__(self, idx):
+        return EllipseBatch(self.cx[idx], self.cy[idx], self.a[idx],
+                            self.b[idx], self.phi[idx])
+
+    def __repr__(self):
+        return f"EllipseBatch(n={len(self)})"
+
+    @property
+    def centers(self):
+        """Centres as an (n, 2) array."""
+        return np.column_stack([self.cx, self.cy])
+
+    def aabb(self):
+        """
+        Tight axis-aligned bounding boxes.
+
+        :return: Tuple (xmin, ymin, xmax, ymax) of arrays of length n.
+        """
+        c, s = np.cos(self.phi), np.sin(self.phi)
+        hx = np.sqrt((self.a * c)**2 + (self.b * s)**2)
+        hy = np.sqrt((self.a * s)**2 + (self.b * c)**2)
+        return self.cx - hx, self.cy - hy, self.cx + hx, self.cy + hy
+
+    def to_local(self, points, idx=None):
+        """
+        Express points in the local frame of ellipses.
+
+        :param points: Array of shape (..., 2).
+        :param idx: Optional ellipse indices broadcastable against points[..., 0];
+                    by default points are paired with the ellipses one-to-one.
+        :return: Tuple (x', y') of local coordinates.
+        """
+        points = np.asarray(points, dtype=float)
+        sel = slice(None) if idx is None else idx
+        dx = points[..., 0] - self.cx[sel]
+        dy = points[..., 1] - self.cy[sel]
+        c, s = np.cos(self.phi[sel]), np.sin(self.phi[sel])
+        return dx * c + dy * s, -dx * s + dy * c
+
+    def implicit(self, points, idx=None):
+        """Implicit value x'²/a² + y'²/b² (1 on the boundary) for paired points."""
+        sel = slice(None) if idx is None else idx
+        xl, yl = self.to_local(points, idx)
+        return (xl / self.a[sel])**2 + (yl / self.b[sel])**2
+
+    def contains(self, points, idx=None):
+        """True where a point lies inside (or on) its paired ellipse."""
+        return self.implicit(points, idx) <= 1
+
+    def signed_distance(self, points, idx=None, return_closest=False):
+        """
+        Euclidean signed distance from points to their paired ellipses
+        (negative inside).
+
+        :param points: Array of shape (..., 2).
+        :param idx: Optional ellipse indices, as in to_local.
+        :param return_closest: Also return the closest boundary points.
+        :return: Distances, or (distances, closest points of shape (..., 2)).
+        """
+        sel = slice(None) if idx is None else idx
+        xl, yl = self.to_local(points, idx)
+        a, b = np.broadcast_arrays(self.a[sel], self.b[sel])
+        d, qx, qy = ellipse_distance_local(a, b, xl, yl)
+        if not return_closest:
+            return d
+        c, s = np.cos(self.phi[sel]), np.sin(self.phi[sel])
+        closest = np.stack([self.cx[sel] + qx * c - qy * s,
+                            self.cy[sel] + qx * s + qy * c], axis=-1)
+        return d, closest
+
+    def conic_coefficients(self):
+        """
+        World-frame conic coefficients (A, B, C, D, E, F) of every ellipse,
+        normalized to F(x, y) = -1 at the centre (negative inside).  The
+        tuple layout matches analytical_geometry.conic.
+        """
+        c, s = np.cos(self.phi), np.sin(self.phi)
+        ia, ib = 1 / self.a**2, 1 / self.b**2
+        q11 = c**2 * ia + s**2 * ib
+        q12 = c * s * (ia - ib)
+        q22 = s**2 * ia + c**2 * ib
+        D = -2 * (q11 * self.cx + q12 * self.cy)
+        E = -2 * (q12 * self.cx + q22 * self.cy)
+        F = q11 * self.cx**2 + 2 * q12 * self.cx * self.cy + q22 * self.cy**2 - 1
+        return q11, 2 * q12, q22, D, E, F
+
+    def boundary(self, num_points=400):
+        """Boundary polylines, shape (n, num_points, 2), for plotting."""
+        t = np.linspace(0, 2*np.pi, num_points)
+        xl = self.a[:, None] * np.cos(t)
+        yl = self.b[:, None] * np.sin(t)
+        c, s = np.cos(self.phi)[:, None], np.sin(self.phi)[:, None]
+        return np.stack([self.cx[:, None] + xl * c - yl * s,
+                         self.cy[:, None] + xl * s + yl * c], axis=-1)
+
+
+def ellipse_distance_local(a, b, x, y, iterations=64):
+    """
+    Signed distance from (x, y) to the axis-aligned ellipse x²/a² + y²/b² = 1.
+
+    Uses the bisection formulation of D. Eberly ("Distance from a Point to an
+    Ellipse, an Ellipsoid, or a Hyperellipsoid"), run on whole arrays with a
+    fixed number of iterations so that every element costs the same.
+
+    :param a: Semi-axes along x (array-like).
+    :param b: Semi-axes along y (array-like).
+    :param x: Local x coordinates.
+    :param y: Local y coordinates.
+    :param iterations: Bisection steps (64 reaches double precision).
+    :return: Tuple (distance, qx, qy): signed distance (negative inside) and
+             the closest boundary point in the same local frame.
+    """
+    a, b, x, y = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, x, y)))
+    # Work in the first quadrant with e0 >= e1; undo the reflections at the end.
+    swap = a < b
+    e0 = np.where(swap, b, a)
+    e1 = np.where(swap, a, b)
+    p0 = np.abs(np.where(swap, y, x))
+    p1 = np.abs(np.where(swap, x, y))
+
+    z0 = p0 / e0
+    z1 = p1 / e1
+    g = z0**2 + z1**2 - 1
+    r0 = (e0 / e1)**2
+    # Eberly bisects on s; we bisect on u = s + 1, which keeps full relative
+    # precision when the root approaches s = -1 (points near the major axis).
+    u_lo = z1
+    u_hi = np.where(g < 0, 1.0, np.hypot(r0 * z0, z1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(iterations):
+            u = 0.5 * (u_lo + u_hi)
+            n0 = r0 * z0 / (u - 1 + r0)
+            n1 = z1 / u
+            above = n0**2 + n1**2 - 1 > 0
+            u_lo = np.where(above, u, u_lo)
+            u_hi = np.where(above, u_hi, u)
+        u = 0.5 * (u_lo + u_hi)
+        q0 = r0 * p0 / (u - 1 + r0)
+        q1 = p1 / u
+
+    # Points on (or within rounding of) the major axis need the closed form;
+    # the bisection bracket degenerates there.
+    on_major = z1 < 1e-10
+    if np.any(on_major):
+        denom = e0**2 - e1**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xde0 = np.where(denom > 0, e0 * p0 / denom, np.inf)
+        inner = xde0 < 1
+        m0 = np.where(inner, e0 * xde0, e0)
+        m1 = np.where(inner, e1 * np.sqrt(np.clip(1 - xde0**2, 0, None)), 0.0)
+        q0 = np.where(on_major, m0, q0)
+        q1 = np.where(on_major, m1, q1)
+
+    d = np.hypot(q0 - p0, q1 - p1)
+    d = np.where(g < 0, -d, d)
+    q0 = np.copysign(q0, np.where(swap, y, x))
+    q1 = np.copysign(q1, np.where(swap, x, y))
+    qx = np.where(swap, q1, q0)
+    qy = np.where(swap, q0, q1)
+    return d, qx, qy
@@ -0,0 +1,152 @@
+import numpy as np
+
+# =============================================================================
+# Great-circle distances and geodesic interpolation on a spherical Earth
+# =============================================================================
+# Vectorized counterparts of the haversine helper in "movement path.py".
+# Coordinates are in degrees and broadcast like NumPy arrays; distances are in
+# the unit of `radius` (km by default).
+#
+# Long lists of pairs and all-pairs matrices are processed in chunks, so the
+# temporaries stay bounded whatever N is; results can be written into a
+# preallocated (e.g. memory-mapped, float32) array.
+#
+# Interpolation between waypoints is spherical-linear (slerp) on the unit
+# vectors of the points, i.e. it follows the great circle instead of a
+# straight line in latitude/longitude.
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def to_unit_vectors(lat, lon):
+    """Unit vectors (..., 3) of points given by latitude and longitude in degrees."""
+    phi, lam = np.radians(lat), np.radians(lon)
+    cos_phi = np.cos(phi)
+    return np.stack(np.broadcast_arrays(cos_phi * np.cos(lam), cos_phi * np.sin(lam),
+                                        np.sin(phi)), axis=-1)
+
+
+def from_unit_vectors(v):
+    """Latitude and longitude in degrees of (not necessarily unit) vectors (..., 3)."""
+    v = np.asarray(v, dtype=float)
+    lat = np.degrees(np.arctan2(v[..., 2], np.hypot(v[..., 0], v[..., 1])))
+    lon = np.degrees(np.arctan2(v[..., 1], v[..., 0]))
+    return lat, lon
+
+
+def haversine(lat1, lon1, lat2, lon2, radius=EARTH_RADIUS_KM):
+    """
+    Great-circle distance between the points (lat1, lon1) and (lat2, lon2),
+    element-wise over broadcast arrays.
+    """
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    dphi = phi2 - phi1
+    dl = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dphi/2)**2 + np.cos(phi1)*np.cos(phi2)*np.sin(dl/2)**2
+    return 2*radius*np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def pair_distances(lat1, lon1, lat2, lon2, radius=EARTH_RADIUS_KM, chunk_size=1 << 20,
+                   out=None):
+    """
+    haversine over 1-D arrays of point pairs, chunk_size pairs at a time so
+    that the temporaries stay bounded for millions of pairs.
+
+    :param out: Optional preallocated (N,) result.
+    :return: (N,) array of distances.
+    """
+    lat1, lon1, lat2, lon2 = (np.ravel(v) for v in np.broadcast_arrays(lat1, lon1, lat2, lon2))
+    if out is None:
+        out = np.empty(len(lat1))
+    for start in range(0, len(lat1), chunk_size):
+        rows = slice(start, start + chunk_size)
+        out[rows] = haversine(lat1[rows], lon1[rows], lat2[rows], lon2[rows], radius)
+    return out
+
+
+def track_lengths(lat, lon, radius=EARTH_RADIUS_KM):
+    """Lengths of the legs of a track (distances between consecutive points), shape (N-1,)."""
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    return pair_distances(lat[:-1], lon[:-1], lat[1:], lon[1:], radius)
+
+
+def distance_matrix(lat1, lon1, lat2=None, lon2=None, radius=EARTH_RADIUS_KM,
+                    chunk_size=2048, out=None, dtype=float):
+    """
+    All-pairs great-circle distances.
+
+    :param lat1: Latitudes of the N row points.
+    :param lon1: Longitudes of the N row points.
+    :param lat2: Latitudes of the M column points (default: the row points).
+    :param lon2: Longitudes of the M column points.
+    :param radius: Sphere radius.
+    :param chunk_size: Rows computed at a time.
+    :param out: Optional preallocated (N, M) array (e.g. np.memmap).
+    :param dtype: dtype of a newly allocated result.
+    :return: (N, M) array of distances.
+    """
+    phi1 = np.radians(np.ravel(lat1))
+    lam1 = np.radians(np.ravel(lon1))
+    if lat2 is None:
+        phi2, lam2 = phi1, lam1
+    else:
+        phi2 = np.radians(np.ravel(lat2))
+        lam2 = np.radians(np.ravel(lon2))
+    cos1, cos2 = np.cos(phi1), np.cos(phi2)
+    if out is None:
+        out = np.empty((len(phi1), len(phi2)), dtype=dtype)
+    for start in range(0, len(phi1), chunk_size):
+        rows = slice(start, start + chunk_size)
+        a = np.sin((phi2 - phi1[rows, None]) / 2)**2
+        a += cos1[rows, None] * cos2 * np.sin((lam2 - lam1[rows, None]) / 2)**2
+        np.clip(a, 0.0, 1.0, out=a)
+        out[rows] = 2 * radius * np.arcsin(np.sqrt(a, out=a), out=a)
+    return out
+
+
+def slerp(lat1, lon1, lat2, lon2, fraction):
+    """
+    Points a fraction of the way along the great circle from (lat1, lon1) to
+    (lat2, lon2) (fraction 0 -> start, 1 -> end), element-wise over
+    broadcast arrays.
+
+    :return: Tuple (lat, lon) in degrees.
+    """
+    p = to_unit_vectors(lat1, lon1)
+    q = to_unit_vectors(lat2, lon2)
+    t = np.asarray(fraction, dtype=float)[..., None]
+    sin_omega = np.linalg.norm(np.cross(p, q), axis=-1)[..., None]
+    omega = np.arctan2(sin_omega, np.sum(p * q, axis=-1)[..., None])
+    # Coincident points: fall back to linear weights (the limit of slerp).
+    small = sin_omega < 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wp = np.where(small, 1 - t, np.sin((1 - t) * omega) / sin_omega)
+        wq = np.where(small, t, np.sin(t * omega) / sin_omega)
+    return from_unit_vectors(wp * p + wq * q)
+
+
+def great_circle_path(lat, lon, step=None, points_per_segment=None, radius=EARTH_RADIUS_KM):
+    """
+    Densify a waypoint track along great circles.
+
+    :param lat: Waypoint latitudes, shape (N,).
+    :param lon: Waypoint longitudes, shape (N,).
+    :param step: Maximum spacing of the output points (unit of `radius`).
+    :param points_per_segment: Fixed number of points per leg instead of `step`.
+    :return: Tuple (lat, lon) of the densified track; waypoints are included.
+    """
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    if len(lat) < 2:
+        return lat.copy(), lon.copy()
+    if points_per_segment is not None:
+        counts = np.full(len(lat) - 1, int(points_per_segment))
+    elif step is not None:
+        counts = np.maximum(np.ceil(track_lengths(lat, lon, radius) / step), 1).astype(int)
+    else:
+        raise ValueError("give step or points_per_segment")
+    segment = np.repeat(np.arange(len(counts)), counts)
+    first = np.cumsum(counts) - counts
+    fraction = (np.arange(counts.sum()) - first[segment]) / counts[segment]
+    path_lat, path_lon = slerp(lat[segment], lon[segment], lat[segment + 1], lon[segment + 1],
+                               fraction)
+    return np.append(path_lat, lat[-1]), np.append(path_lon, lon[-1])
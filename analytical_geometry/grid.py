@@ -0,0 +1,97 @@
+from functools import lru_cache
+
+import numpy as np
+
+# =============================================================================
+# Shared coordinate grids
+# =============================================================================
+# Most field plots in this repository evaluate an implicit function on a
+# rectangular grid.  np.meshgrid builds two dense (ny, nx) coordinate arrays for
+# that, although every row of X (and every column of Y) is identical.  The
+# grids handed out here keep only the two 1-D axes and expose them as
+# broadcastable open grids; the dense arrays are built on request only.
+
+
+class OpenGrid:
+    """
+    A rectangular grid over `extent` = (xmin, xmax, ymin, ymax) with `nx`
+    samples along x and `ny` along y.
+
+    Instances are shared through get_grid, so every array they hand out is
+    read-only.  Use `x`, `y` (1-D axes) with plotting functions such as
+    contour, `open` for NumPy broadcasting, and `dense()` only when a consumer
+    really needs full coordinate arrays.
+    """
+
+    def __init__(self, extent, nx, ny):
+        xmin, xmax, ymin, ymax = (float(v) for v in extent)
+        self.extent = (xmin, xmax, ymin, ymax)
+        self.nx = int(nx)
+        self.ny = int(ny)
+        self.x = np.linspace(xmin, xmax, self.nx)
+        self.y = np.linspace(ymin, ymax, self.ny)
+        self.x.flags.writeable = False
+        self.y.flags.writeable = False
+        self._dense = None
+
+    @property
+    def shape(self):
+        """Shape (ny, nx) of any field evaluated on the grid."""
+        return self.ny, self.nx
+
+    @property
+    def open(self):
+        """Views (X, Y) of shapes (1, nx) and (ny, 1), like np.ogrid."""
+        return self.x[None, :], self.y[:, None]
+
+    def dense(self):
+        """Dense (X, Y) arrays as returned by np.meshgrid(x, y), built once."""
+        if self._dense is None:
+            X, Y = np.meshgrid(self.x, self.y)
+            X.flags.writeable = False
+            Y.flags.writeable = False
+            self._dense = (X, Y)
+        return self._dense
+
+    def empty(self):
+        """A new, writable output buffer for a field on this grid."""
+        return np.empty(self.shape)
+
+    @property
+    def nbytes(self):
+        """Bytes currently held for coordinates (axes plus any dense copy)."""
+        total = self.x.nbytes + self.y.nbytes
+        if self._dense is not None:
+            total += self._dense[0].nbytes + self._dense[1].nbytes
+        return total
+
+    def __repr__(self):
+        return f"OpenGrid(extent={self.extent}, nx={self.nx}, ny={self.ny})"
+
+
+@lru_cache(maxsize=64)
+def _cached_grid(extent, nx, ny):
+    return OpenGrid(extent, nx, ny)
+
+
+def get_grid(extent, resolution):
+    """
+    Return the shared OpenGrid for an extent and resolution.
+
+    :param extent: (xmin, xmax, ymin, ymax).
+    :param resolution: Number of samples per axis, or a pair (nx, ny).
+    :return: OpenGrid, cached by (extent, resolution).
+    """
+    if np.ndim(resolution) == 0:
+        nx = ny = int(resolution)
+    else:
+        nx, ny = (int(n) for n in resolution)
+    extent = tuple(float(v) for v in extent)
+    if len(extent) != 4:
+        raise ValueError("extent must be (xmin, xmax, ymin, ymax)")
+    return _cached_grid(extent, nx, ny)
+
+
+def clear_grid_cache():
+    """Drop every cached grid (and any dense arrays they materialized)."""
+    _cached_grid.cache_clear()
@@ -0,0 +1,150 @@
+import functools
+import os
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+import numpy as np
+
+# =============================================================================
+# Switchable kernel instrumentation
+# =============================================================================
+# Kernels decorated with @instrumented("name") record, while instrumentation
+# is enabled, per kernel:
+#
+#   calls     number of calls,
+#   elements  number of elements processed (largest array argument, or what
+#             the kernel's `elements` function says),
+#   seconds   cumulative wall time (inclusive of nested instrumented kernels),
+#   bytes     bytes of the arrays the kernel returned.
+#
+# Disabled (the default) the wrapper costs one flag test per call.  Enable it
+# with enable(), the profiling() context manager or the environment variable
+# ANALYTICAL_GEOMETRY_PROFILE=1, and read the counters with stats(), report()
+# or prometheus() (text exposition format).
+
+_ENABLED = os.environ.get("ANALYTICAL_GEOMETRY_PROFILE", "") not in ("", "0")
+_LOCK = threading.Lock()
+_STATS = {}
+_FIELDS = ("calls", "elements", "seconds", "bytes")
+
+
+def _default_elements(args, kwargs):
+    sizes = [np.size(v) for v in (*args, *kwargs.values()) if isinstance(v, np.ndarray)]
+    return max(sizes, default=1)
+
+
+def _result_bytes(result):
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (tuple, list)):
+        return sum(_result_bytes(v) for v in result)
+    return 0
+
+
+def point_count(points, *args, **kwargs):
+    """`elements` function for kernels whose first argument is an (..., 2) point array."""
+    return np.size(points) // 2
+
+
+def instrumented(name, elements=None):
+    """
+    Decorator recording calls, elements, time and returned bytes under `name`.
+
+    :param name: Counter name, e.g. "kernels.position_of_point".
+    :param elements: Optional function of the kernel's arguments returning the
+                     number of elements processed.
+    """
+    def wrap(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            result = func(*args, **kwargs)
+            seconds = perf_counter() - start
+            n = elements(*args, **kwargs) if elements else _default_elements(args, kwargs)
+            with _LOCK:
+                entry = _STATS.setdefault(name, [0, 0, 0.0, 0])
+                entry[0] += 1
+                entry[1] += int(n)
+                entry[2] += seconds
+                entry[3] += _result_bytes(result)
+            return result
+        return wrapper
+    return wrap
+
+
+def instrument_methods(cls, prefix=None):
+    """Instrument every public static method of `cls` as "<prefix>.<method>"."""
+    prefix = prefix or cls.__name__
+    for attr, value in list(vars(cls).items()):
+        if isinstance(value, staticmethod) and not attr.startswith("_"):
+            setattr(cls, attr, staticmethod(instrumented(f"{prefix}.{attr}")(value.__func__)))
+    return cls
+
+
+def enable():
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable():
+    global _ENABLED
+    _ENABLED = False
+
+
+def is_enabled():
+    return _ENABLED
+
+
+def reset():
+    with _LOCK:
+        _STATS.clear()
+
+
+@contextmanager
+def profiling(clear=True):
+    """Enable instrumentation inside a with-block (optionally clearing the counters first)."""
+    if clear:
+        reset()
+    previous = _ENABLED
+    enable()
+    try:
+        yield
+    finally:
+        if not previous:
+            disable()
+
+
+def stats():
+    """Counters as {name: {"calls", "elements", "seconds", "bytes"}}, slowest first."""
+    with _LOCK:
+        items = [(name, dict(zip(_FIELDS, entry))) for name, entry in _STATS.items()]
+    return dict(sorted(items, key=lambda item: -item[1]["seconds"]))
+
+
+def report():
+    """Plain-text table of the counters, sorted by cumulative time."""
+    lines = [f"{'kernel':<40}{'calls':>10}{'elements':>14}{'total ms':>12}"
+             f"{'us/call':>10}{'MB out':>10}"]
+    for name, s in stats().items():
+        lines.append(f"{name:<40}{s['calls']:>10}{s['elements']:>14}{1e3 * s['seconds']:>12.3f}"
+                     f"{1e6 * s['seconds'] / s['calls']:>10.1f}{s['bytes'] / 2**20:>10.2f}")
+    return "\n".join(lines)
+
+
+def prometheus(namespace="analytical_geometry"):
+    """Counters in the Prometheus text exposition format."""
+    metrics = (("calls", "calls_total", "Kernel calls."),
+               ("elements", "elements_total", "Elements processed by the kernel."),
+               ("seconds", "seconds_total", "Cumulative wall time spent in the kernel."),
+               ("bytes", "output_bytes_total", "Bytes of the arrays returned by the kernel."))
+    rows = stats()
+    lines = []
+    for field, suffix, help_text in metrics:
+        metric = f"{namespace}_kernel_{suffix}"
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        for name, s in rows.items():
+            lines.append(f'{metric}{{kernel="{name}"}} {s[field]}')
+    return "\n".join(lines) + "\n"
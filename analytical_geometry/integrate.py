@@ -0,0 +1,193 @@
+import numpy as np
+
+# =============================================================================
+# Adaptive Runge-Kutta integration of x' = F(x) for batches of robots
+# =============================================================================
+# Dormand-Prince 5(4) with error control, advanced for R independent
+# trajectories at once.  Every robot carries its own time and step size; each
+# loop iteration attempts one step for all robots that are still running and
+# accepts or rejects it per robot.  Robots stop as soon as one of the events
+# below fires, so no force evaluations are spent after arrival.
+
+EVENT_NONE = 0        # still running
+EVENT_GOAL = 1        # within goal_tol of the goal
+EVENT_COLLISION = 2   # collision(pos) became true
+EVENT_STALL = 3       # force magnitude fell below stall_tol away from the goal
+EVENT_TIME = 4        # reached t_max
+EVENT_BUDGET = 5      # the output buffers (max_points) are full
+EVENT_ERROR = 6       # step size fell below h_min (e.g. force returned NaN/inf)
+EVENT_NAMES = ("none", "goal", "collision", "stall", "time", "budget", "error")
+
+# Dormand-Prince tableau (the last stage is evaluated at the new point and
+# reused as the first stage of the next step).
+_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+# Difference between the 5th- and embedded 4th-order weights.
+_E = _B - np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+
+class AdaptiveResult:
+    """
+    Output of integrate_adaptive.
+
+    Attributes
+      t        (max_points, R) accepted times; rows past n_points[r] are NaN.
+      pos      (max_points, R, 2) accepted positions; same padding.
+      n_points (R,) number of valid rows per robot.
+      event    (R,) EVENT_* code that stopped each robot.
+      nfev     (R,) force evaluations spent per robot.
+    """
+
+    def __init__(self, t, pos, n_points, event, nfev):
+        self.t = t
+        self.pos = pos
+        self.n_points = n_points
+        self.event = event
+        self.nfev = nfev
+
+    def trajectory(self, r):
+        """Times and positions of robot r without padding."""
+        n = self.n_points[r]
+        return self.t[:n, r], self.pos[:n, r]
+
+    def event_name(self, r):
+        return EVENT_NAMES[self.event[r]]
+
+    def __repr__(self):
+        counts = np.bincount(self.event, minlength=len(EVENT_NAMES))
+        summary = ", ".join(f"{name}={c}" for name, c in zip(EVENT_NAMES, counts) if c)
+        return f"AdaptiveResult(R={self.event.size}, {summary})"
+
+
+def integrate_adaptive(force, start, goal, t_max=15.0, rtol=1e-4, atol=1e-6,
+                       h0=0.05, h_max=1.0, goal_tol=0.05, collision=None,
+                       stall_tol=1e-3, max_points=2000, h_min=1e-10):
+    """
+    Integrate x' = force(x) for R robots with adaptive Dormand-Prince steps.
+
+    :param force: Callable force(pos, idx) -> (len(idx), 2), where pos holds
+                  the positions of the robots with indices idx.
+    :param start: Start positions (R, 2) (or a single point).
+    :param goal: Goals (R, 2) or a single point; used for the goal event.
+    :param t_max: Final time.
+    :param rtol: Relative error tolerance per step.
+    :param atol: Absolute error tolerance per step.
+    :param h0: Initial step size.
+    :param h_max: Largest allowed step size.
+    :param goal_tol: Arrival distance for EVENT_GOAL.
+    :param collision: Optional callable collision(pos, idx) -> bool array.
+    :param stall_tol: Force magnitude below which a robot away from its goal
+                      is considered stuck in a local minimum.
+    :param max_points: Capacity of the output buffers (accepted steps + 1).
+    :param h_min: Smallest step size; a robot whose step shrinks below it
+                  stops with EVENT_ERROR.
+    :return: AdaptiveResult.
+    """
+    start = np.atleast_2d(np.asarray(start, dtype=float))
+    goal = np.atleast_2d(np.asarray(goal, dtype=float))
+    R = max(start.shape[0], goal.shape[0])
+    start = np.broadcast_to(start, (R, 2))
+    goal = np.broadcast_to(goal, (R, 2))
+
+    t_out = np.full((max_points, R), np.nan)
+    pos_out = np.full((max_points, R, 2), np.nan)
+    t_out[0] = 0.0
+    pos_out[0] = start
+    n_points = np.ones(R, dtype=int)
+    event = np.zeros(R, dtype=int)
+    nfev = np.zeros(R, dtype=int)
+
+    idx = np.arange(R)
+    y = start.copy()
+    t = np.zeros(R)
+    h = np.full(R, float(h0))
+    k_first = force(y, idx)
+    nfev += 1
+
+    def stop(mask, code):
+        """Mark robots idx[mask] as finished with the given event."""
+        nonlocal idx, y, t, h, k_first
+        event[idx[mask]] = code
+        keep = ~mask
+        idx, y, t, h, k_first = idx[keep], y[keep], t[keep], h[keep], k_first[keep]
+
+    # Events can already hold at the start point.
+    _check_events(idx, y, k_first, goal, goal_tol, collision, stall_tol, stop)
+
+    while idx.size:
+        h = np.minimum(h, t_max - t)
+        hc = h[:, None]
+        k = [k_first]
+        for i in range(1, 7):
+            y_stage = y + hc * sum(a * k[j] for j, a in enumerate(_A[i]) if a)
+            k.append(force(y_stage, idx))
+        y_new = y_stage  # the last stage is evaluated at the 5th-order solution
+        nfev[idx] += 6
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            err = hc * sum(e * k[i] for i, e in enumerate(_E) if e)
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+            err_norm = np.sqrt(np.mean((err / scale)**2, axis=1))
+        # A non-finite force anywhere in the step is a rejection with the
+        # largest shrink; repeated failures end in EVENT_ERROR below.
+        finite = np.isfinite(err_norm) & np.isfinite(y_new).all(axis=1)
+        accept = finite & (err_norm <= 1.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.clip(0.9 * err_norm**(-1/5), 0.2, 5.0)
+        factor = np.where(accept, factor, np.minimum(factor, 1.0))
+        factor = np.where(finite, factor, 0.2)
+
+        y = np.where(accept[:, None], y_new, y)
+        t = np.where(accept, t + h, t)
+        k_first = np.where(accept[:, None], k[6], k_first)
+        h = np.minimum(h * factor, h_max)
+
+        if accept.any():
+            rows = idx[accept]
+            n = n_points[rows]
+            t_out[n, rows] = t[accept]
+            pos_out[n, rows] = y[accept]
+            n_points[rows] += 1
+
+            # Events are only checked on accepted steps.
+            moved = np.zeros(idx.size, dtype=bool)
+            moved[accept] = True
+            _check_events(idx, y, k_first, goal, goal_tol, collision, stall_tol,
+                          stop, moved)
+        if idx.size:
+            stop(t >= t_max, EVENT_TIME)
+        if idx.size:
+            stop(n_points[idx] >= max_points, EVENT_BUDGET)
+        if idx.size:
+            stop(h < h_min, EVENT_ERROR)
+    return AdaptiveResult(t_out, pos_out, n_points, event, nfev)
+
+
+def _check_events(idx, y, k_first, goal, goal_tol, collision, stall_tol, stop,
+                  moved=None):
+    """Apply the goal, collision and stall events to the running robots."""
+    if moved is None:
+        moved = np.ones(idx.size, dtype=bool)
+    diff = goal[idx] - y
+    at_goal = moved & (np.einsum("ij,ij->i", diff, diff) < goal_tol**2)
+    hit = np.zeros_like(at_goal)
+    if collision is not None:
+        hit = moved & ~at_goal & np.asarray(collision(y, idx), dtype=bool)
+    stalled = (moved & ~at_goal & ~hit &
+               (np.einsum("ij,ij->i", k_first, k_first) < stall_tol**2))
+    # stop() compacts the running arrays, so apply each event with masks
+    # computed against the current layout, in one combined pass.
+    code = np.where(at_goal, EVENT_GOAL,
+                    np.where(hit, EVENT_COLLISION,
+                             np.where(stalled, EVENT_STALL, EVENT_NONE)))
+    stop(code != EVENT_NONE, code[code != EVENT_NONE])
@@ -0,0 +1,161 @@
+import numpy as np
+
+from analytical_geometry.conic import translate_conic
+from analytical_geometry.ellipses import EllipseBatch
+
+# =============================================================================
+# Intersection points of two general ellipses
+# =============================================================================
+# The first ellipse is parametrized by its eccentric angle θ,
+#     p(θ) = c + a cosθ u + b sinθ v,
+# and substituted into the conic of the second one.  The result is a real
+# trigonometric polynomial of degree two,
+#     f(θ) = k0 + k1 cosθ + k2 sinθ + k3 cos2θ + k4 sin2θ,
+# and with z = e^{iθ}, z² f(θ) is a complex quartic whose roots on the unit
+# circle are the intersections.  Unlike the tan(θ/2) substitution this has no
+# root at infinity for θ = π.  The quartics of all pairs are solved together
+# through batched companion-matrix eigenvalues, and every root is polished
+# with Newton's method on the real function f(θ).
+
+_ON_CIRCLE = 1e-3     # | |z| - 1 | accepted before polishing
+_RESIDUAL = 1e-8      # |f(θ)| accepted after polishing, relative to scale
+_MERGE = 1e-5         # roots closer than this (radians) are one point
+_TANGENT = 1e-5       # |f'(θ)| below this (relative) flags tangency
+
+
+def _trig_coefficients(first, second):
+    """(P, 5) coefficients k0..k4 of f(θ) for paired ellipses."""
+    A, B, C, D, E, F = second.conic_coefficients()
+    k = (second.a * second.b)**(2/3)  # scale the conic to determinant -1
+    # Conic of the second ellipse in coordinates centred on the first one.
+    A, B, C, D, E, F = translate_conic((A * k, B * k, C * k, D * k, E * k, F * k),
+                                       first.cx, first.cy)
+    c, s = np.cos(first.phi), np.sin(first.phi)
+    ax, ay = first.a * c, first.a * s      # a u
+    bx, by = -first.b * s, first.b * c     # b v
+    cos2 = A * ax**2 + B * ax * ay + C * ay**2
+    sin2 = A * bx**2 + B * bx * by + C * by**2
+    sincos = 2 * A * ax * bx + B * (ax * by + ay * bx) + 2 * C * ay * by
+    return np.column_stack([0.5 * (cos2 + sin2) + F,
+                            D * ax + E * ay,
+                            D * bx + E * by,
+                            0.5 * (cos2 - sin2),
+                            0.5 * sincos])
+
+
+def _f(k, t):
+    return (k[:, 0:1] + k[:, 1:2] * np.cos(t) + k[:, 2:3] * np.sin(t)
+            + k[:, 3:4] * np.cos(2 * t) + k[:, 4:5] * np.sin(2 * t))
+
+
+def _df(k, t):
+    return (-k[:, 1:2] * np.sin(t) + k[:, 2:3] * np.cos(t)
+            - 2 * k[:, 3:4] * np.sin(2 * t) + 2 * k[:, 4:5] * np.cos(2 * t))
+
+
+def _d2f(k, t):
+    return (-k[:, 1:2] * np.cos(t) - k[:, 2:3] * np.sin(t)
+            - 4 * k[:, 3:4] * np.cos(2 * t) - 4 * k[:, 4:5] * np.sin(2 * t))
+
+
+def ellipse_intersections(first, second, newton_steps=4):
+    """
+    Intersection points of paired ellipses first[k] and second[k].
+
+    :param first: EllipseBatch or (P, 5) array of (cx, cy, a, b, phi).
+    :param second: EllipseBatch or (P, 5) array (same length, or a single
+                   ellipse tested against every ellipse of `first`).
+    :param newton_steps: Newton iterations used to polish each root.
+    :return: Tuple (points, count, multiplicity, tangent):
+             points (P, 4, 2), NaN beyond count[k];
+             count (P,) number of distinct points, or -1 for coincident ellipses;
+             multiplicity (P, 4) 1 for crossings, 2 for touching points;
+             tangent (P, 4) True where the ellipses touch rather than cross.
+    """
+    first = first if isinstance(first, EllipseBatch) else EllipseBatch.from_array(first)
+    second = second if isinstance(second, EllipseBatch) else EllipseBatch.from_array(second)
+    P = max(len(first), len(second))
+    if len(first) != P:
+        first = first[np.zeros(P, dtype=int)]
+    if len(second) != P:
+        second = second[np.zeros(P, dtype=int)]
+
+    k = _trig_coefficients(first, second)
+    scale = np.abs(k).sum(axis=1)
+    coincident = np.abs(k).max(axis=1) <= 1e-12 * np.maximum(first.a, first.b)**2
+
+    # z^2 f(θ) = c4 z^4 + c3 z^3 + c2 z^2 + c1 z + c0 (self-inversive).
+    c4 = 0.5 * (k[:, 3] - 1j * k[:, 4])
+    c3 = 0.5 * (k[:, 1] - 1j * k[:, 2])
+    c2 = k[:, 0].astype(complex)
+    # A vanishing leading coefficient only means roots at 0 and infinity,
+    # which are never on the unit circle; nudge it to keep the matrix finite.
+    tiny = np.abs(c4) < 1e-14 * scale
+    c4 = np.where(tiny, 1e-14 * scale, c4)
+    c4 = np.where(coincident, 1.0, c4)
+    comp = np.zeros((P, 4, 4), dtype=complex)
+    comp[:, 1:, :3] = np.eye(3)
+    comp[:, 0, 0] = -c3 / c4
+    comp[:, 0, 1] = -c2 / c4
+    comp[:, 0, 2] = -np.conj(c3) / c4
+    comp[:, 0, 3] = -np.conj(c4) / c4
+    comp[coincident, 0] = 0.0
+    z = np.linalg.eigvals(comp)
+
+    theta = np.angle(z)
+    near = np.abs(np.abs(z) - 1) < _ON_CIRCLE
+    for _ in range(newton_steps):
+        d = _df(k, theta)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = _f(k, theta) / d
+        theta = np.where(np.isfinite(step) & (np.abs(step) < 0.1), theta - step, theta)
+    residual = np.abs(_f(k, theta))
+    slope = np.abs(_df(k, theta))
+    ok = near & (residual <= _RESIDUAL * scale[:, None]) & ~coincident[:, None]
+
+    # Merge roots that describe the same point (double roots of tangency).
+    theta = np.where(ok, np.mod(theta, 2*np.pi), np.inf)
+    order = np.argsort(theta, axis=1)
+    theta = np.take_along_axis(theta, order, axis=1)
+    slope = np.take_along_axis(slope, order, axis=1)
+    ok = np.isfinite(theta)
+    dup = np.zeros_like(ok)
+    last = ok.sum(axis=1) - 1
+    rows = np.arange(P)
+    with np.errstate(invalid="ignore"):
+        dup[:, 1:] = ok[:, 1:] & (np.diff(theta, axis=1) < _MERGE)
+        # Wrap-around: the last root may coincide with the first.
+        wrap = (last > 0) & (theta[rows, 0] + 2*np.pi
+                             - theta[rows, np.maximum(last, 0)] < _MERGE)
+    dup[rows[wrap], last[wrap]] = True
+
+    keep = ok & ~dup
+    multiplicity = np.zeros((P, 4), dtype=int)
+    # Every duplicate adds one to the multiplicity of the root it merges into.
+    owner = np.maximum.accumulate(np.where(keep, np.arange(4), -1), axis=1)
+    owner[rows[wrap], last[wrap]] = 0
+    for j in range(4):
+        np.add.at(multiplicity, (rows[ok[:, j]], owner[ok[:, j], j]), 1)
+
+    count = keep.sum(axis=1)
+    slot = np.argsort(~keep, axis=1, kind="stable")
+    theta = np.take_along_axis(np.where(keep, theta, np.nan), slot, axis=1)
+    multiplicity = np.take_along_axis(multiplicity * keep, slot, axis=1)
+    slope = np.take_along_axis(slope, slot, axis=1)
+    tangent = (multiplicity >= 2) | ((multiplicity == 1) & (slope < _TANGENT * scale[:, None]))
+    multiplicity = np.where(tangent & (multiplicity == 1), 2, multiplicity)
+    # Newton on f converges only linearly at a double root; a touching point
+    # is a simple root of f', so polish those there instead.
+    for _ in range(newton_steps):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = _df(k, theta) / _d2f(k, theta)
+        theta = np.where(tangent & np.isfinite(step) & (np.abs(step) < 0.1),
+                         theta - step, theta)
+
+    c, s = np.cos(first.phi)[:, None], np.sin(first.phi)[:, None]
+    xl = first.a[:, None] * np.cos(theta)
+    yl = first.b[:, None] * np.sin(theta)
+    points = np.stack([first.cx[:, None] + xl * c - yl * s,
+                       first.cy[:, None] + xl * s + yl * c], axis=-1)
+    count = np.where(coincident, -1, count)
+    return points, count, multiplicity, tangent
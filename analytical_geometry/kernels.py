@@ -0,0 +1,164 @@
+import numpy as np
+
+from analytical_geometry.instrument import instrumented, point_count
+
+# =============================================================================
+# NumPy-only ellipse kernels
+# =============================================================================
+# Vectorized versions of the point, tangent, chord, line-intersection and
+# rotation formulas the scripts evaluate one scalar at a time.  All functions
+# refer to the standard ellipse x²/a² + y²/b² = 1 and broadcast over their
+# array arguments.
+
+POSITION_INSIDE = -1
+POSITION_ON = 0
+POSITION_OUTSIDE = 1
+POSITION_NAMES = {POSITION_INSIDE: "Inside", POSITION_ON: "On the ellipse",
+                  POSITION_OUTSIDE: "Outside"}
+
+
+def ellipse_power(a, b, x, y):
+    """Value x²/a² + y²/b² - 1 (negative inside, zero on the ellipse)."""
+    return (x / a)**2 + (y / b)**2 - 1
+
+
+@instrumented("kernels.position_of_point",
+              elements=lambda a, b, points, tol=0.0: np.size(points) // 2)
+def position_of_point(a, b, points, tol=0.0):
+    """
+    Position of points relative to the ellipse.
+
+    :param a: Semi-axis along x.
+    :param b: Semi-axis along y.
+    :param points: Array of shape (..., 2).
+    :param tol: Points with |value| <= tol count as on the ellipse.
+    :return: Tuple (position, value): POSITION_* codes and x²/a² + y²/b² - 1.
+    """
+    points = np.asarray(points, dtype=float)
+    value = ellipse_power(a, b, points[..., 0], points[..., 1])
+    position = np.where(np.abs(value) <= tol, POSITION_ON, np.sign(value)).astype(np.int8)
+    return position, value
+
+
+@instrumented("kernels.is_inside_ellipse")
+def is_inside_ellipse(x, y, a, b):
+    """
+    Returns True if point (x,y) lies inside (or on) the ellipse:
+        (x/a)^2 + (y/b)^2 <= 1.
+    Works element-wise on arrays.
+    """
+    return (x**2)/(a**2) + (y**2)/(b**2) <= 1
+
+
+@instrumented("kernels.point_at")
+def point_at(a, b, theta):
+    """Points (a cosθ, b sinθ) for eccentric angles theta, shape (..., 2)."""
+    theta = np.asarray(theta, dtype=float)
+    return np.stack([a * np.cos(theta), b * np.sin(theta)], axis=-1)
+
+
+@instrumented("kernels.tangent_at")
+def tangent_at(a, b, theta):
+    """
+    Tangent geometry at the eccentric angles theta.
+
+    The tangent at P = (x0, y0) is u·X = 1 with u = (x0/a², y0/b²); it meets
+    the x-axis at T = (1/u[0], 0) and the y-axis at t = (0, 1/u[1]).
+
+    :return: Tuple (P, T, t) of (..., 2) arrays; T or t is NaN where the
+             tangent is parallel to that axis.
+    """
+    P = point_at(a, b, theta)
+    u = P / np.array([a**2, b**2])
+    with np.errstate(divide="ignore"):
+        inv = np.where(np.abs(u) > 1e-9, 1 / u, np.nan)
+    zero = np.zeros_like(inv[..., 0])
+    T = np.stack([inv[..., 0], np.where(np.isnan(inv[..., 0]), np.nan, zero)], axis=-1)
+    t = np.stack([np.where(np.isnan(inv[..., 1]), np.nan, zero), inv[..., 1]], axis=-1)
+    return P, T, t
+
+
+@instrumented("kernels.tangent_slope")
+def tangent_slope(a, b, x, y):
+    """
+    Slope dy/dx = -(b² x)/(a² y) of the tangent at points (x, y) of the
+    ellipse (±inf where the tangent is vertical).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return -(b**2 * np.asarray(x, dtype=float)) / (a**2 * np.asarray(y, dtype=float))
+
+
+@instrumented("kernels.normal_slope")
+def normal_slope(a, b, x, y):
+    """Slope of the normal at points (x, y) of the ellipse (±inf where vertical)."""
+    with np.errstate(divide="ignore"):
+        return -1 / tangent_slope(a, b, x, y)
+
+
+@instrumented("kernels.tangent_intercept")
+def tangent_intercept(a, b, m):
+    """Intercept c > 0 making y = m x ± c tangent to the ellipse: c² = a² m² + b²."""
+    return np.sqrt(a**2 * np.asarray(m, dtype=float)**2 + b**2)
+
+
+@instrumented("kernels.line_intersections")
+def line_intersections(a, b, m, c, atol=1e-7):
+    """
+    Intersections of the lines y = m x + c with the ellipse.
+
+    Substituting the line gives A x² + B x + C = 0 with A = 1/a² + m²/b²,
+    B = 2 m c / b², C = c²/b² - 1.
+
+    :param m: Slopes.
+    :param c: Intercepts (broadcast against m).
+    :param atol: Discriminants within atol of zero count as tangency.
+    :return: Tuple (points, count): points has shape (..., 2, 2) with NaN rows
+             for missing intersections, count is 0, 1 (tangent) or 2.
+    """
+    m, c = np.broadcast_arrays(np.asarray(m, dtype=float), np.asarray(c, dtype=float))
+    A = 1/(a**2) + (m**2)/(b**2)
+    B = 2 * m * c / (b**2)
+    C = (c**2)/(b**2) - 1
+    disc = B**2 - 4*A*C
+    tangent = np.isclose(disc, 0, atol=atol)
+    count = np.where(tangent, 1, np.where(disc > 0, 2, 0))
+    root = np.sqrt(np.where(count == 2, disc, 0))
+    x = np.stack([(-B + root) / (2*A), (-B - root) / (2*A)], axis=-1)
+    x[count == 0] = np.nan
+    x[..., 1][count == 1] = np.nan
+    points = np.stack([x, m[..., None] * x + c[..., None]], axis=-1)
+    return points, count
+
+
+@instrumented("kernels.chord_line")
+def chord_line(a, b, phi1, phi2):
+    """
+    Line A x + B y + C = 0 through the ellipse points with eccentric angles
+    phi1 and phi2:
+        (x/a) cos((φ1+φ2)/2) + (y/b) sin((φ1+φ2)/2) = cos((φ1-φ2)/2).
+
+    :return: (..., 3) array of (A, B, C).
+    """
+    half_sum = 0.5 * (np.asarray(phi1, dtype=float) + phi2)
+    half_diff = 0.5 * (np.asarray(phi1, dtype=float) - phi2)
+    return np.stack(np.broadcast_arrays(np.cos(half_sum) / a, np.sin(half_sum) / b,
+                                        -np.cos(half_diff)), axis=-1)
+
+
+@instrumented("kernels.rotate_points", elements=point_count)
+def rotate_points(points, theta, pivot=None):
+    """
+    Rotate an array of 2D points by an angle theta (in radians).
+    If pivot is provided, rotate about that point; otherwise, rotate about the origin.
+
+    :param points: NumPy array of shape (N, 2).
+    :param theta: Rotation angle in radians.
+    :param pivot: Optional point (array-like of shape (2,)).
+    :return: Rotated points as a NumPy array.
+    """
+    R = np.array([[np.cos(theta), -np.sin(theta)],
+                  [np.sin(theta),  np.cos(theta)]])
+    if pivot is not None:
+        return (points - pivot) @ R.T + pivot
+    else:
+        return points @ R.T
@@ -0,0 +1,137 @@
+import hashlib
+import inspect
+import json
+import os
+from time import perf_counter
+
+import numpy as np
+
+# =============================================================================
+# Persistent networkx layouts
+# =============================================================================
+# A layout depends only on the graph structure (node order, edges,
+# directedness), the layout function and its arguments, so it is stored on
+# disk under a hash of exactly those and reused on the next run: an unchanged
+# flowchart costs no layout time at all.
+#
+# Graphs that grow between runs are laid out incrementally.  Every layout is
+# also remembered under a graph name; when a new structure of that name
+# appears, the nodes it shares with the previous layout keep their positions
+# (they are passed as pos= and fixed= to layout functions that take both, such
+# as spring_layout) and only the new nodes are placed.  Layout functions
+# without those arguments lay the graph out afresh.
+#
+# The directory defaults to .layout-cache (or $ANALYTICAL_GEOMETRY_LAYOUT_CACHE).
+
+
+def graph_hash(G):
+    """SHA-256 of a graph's structure: directedness, node order and edge set."""
+    directed = G.is_directed()
+    edges = sorted((repr(u), repr(v)) if directed else tuple(sorted((repr(u), repr(v))))
+                   for u, v in G.edges())
+    payload = json.dumps([directed, [repr(n) for n in G.nodes()], edges])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _layout_function(method):
+    if callable(method):
+        return method, f"{method.__module__}.{method.__qualname__}"
+    import networkx as nx
+    return getattr(nx, f"{method}_layout"), method
+
+
+class LayoutCache:
+    """
+    Disk cache of node positions.
+
+    Attributes
+      directory  where the .npz files live.
+      hits       layouts served from disk.
+      misses     layouts computed (fully or incrementally).
+      layout_s   seconds spent computing layouts.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.environ.get("ANALYTICAL_GEOMETRY_LAYOUT_CACHE",
+                                                     ".layout-cache")
+        self.hits = 0
+        self.misses = 0
+        self.layout_s = 0.0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _read(self, key):
+        try:
+            with np.load(self._path(key)) as f:
+                return list(f["nodes"]), f["pos"]
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _write(self, key, G, pos):
+        os.makedirs(self.directory, exist_ok=True)
+        nodes = list(G.nodes())
+        path = self._path(key)
+        with open(path + ".tmp", "wb") as f:
+            np.savez(f, nodes=np.array([repr(n) for n in nodes]),
+                     pos=np.array([pos[n] for n in nodes], dtype=float))
+        os.replace(path + ".tmp", path)
+
+    def layout(self, G, method="spring", name=None, incremental=True, **kwargs):
+        """
+        Node positions of G, from disk when its structure was laid out before.
+
+        :param G: networkx graph.
+        :param method: Layout name ("spring", "shell", "kamada_kawai", ...)
+                       or a layout function taking G and keyword arguments.
+        :param name: Graph name for incremental layout (default: no
+                     incremental layout).
+        :param incremental: Pin nodes kept from the last layout stored under
+                            `name` and place only the new ones (for layout
+                            functions taking pos and fixed).
+        :param kwargs: Passed on to the layout function (seed, k, ...).
+        :return: Dict node -> (x, y) array.
+        """
+        func, label = _layout_function(method)
+        spec = json.dumps([label, sorted((k, repr(v)) for k, v in kwargs.items())])
+        key = hashlib.sha256(f"{graph_hash(G)}\0{spec}".encode()).hexdigest()
+        nodes = list(G.nodes())
+        cached = self._read(key)
+        if cached is not None:
+            self.hits += 1
+            return dict(zip(nodes, cached[1]))
+
+        self.misses += 1
+        start = perf_counter()
+        previous = self._read(f"name-{name}") if name is not None and incremental else None
+        if previous is not None:
+            known = dict(zip(previous[0], previous[1]))
+            fixed = [n for n in nodes if repr(n) in known]
+        else:
+            fixed = []
+        params = inspect.signature(func).parameters
+        if fixed and "pos" in params and "fixed" in params:
+            pos = func(G, **dict(kwargs, pos={n: known[repr(n)] for n in fixed}, fixed=fixed))
+        else:
+            pos = func(G, **kwargs)
+        self.layout_s += perf_counter() - start
+        pos = {n: np.asarray(pos[n], dtype=float) for n in nodes}
+        self._write(key, G, pos)
+        if name is not None:
+            self._write(f"name-{name}", G, pos)
+        return pos
+
+    def __repr__(self):
+        return (f"LayoutCache({self.directory!r}, hits={self.hits}, misses={self.misses}, "
+                f"layout_s={self.layout_s:.3f})")
+
+
+_DEFAULT = None
+
+
+def cached_layout(G, method="spring", name=None, incremental=True, **kwargs):
+    """LayoutCache.layout with the default cache directory."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = LayoutCache()
+    return _DEFAULT.layout(G, method, name, incremental, **kwargs)
@@ -0,0 +1,231 @@
+import numpy as np
+
+from analytical_geometry.instrument import instrumented, point_count
+from analytical_geometry.integrate import integrate_adaptive
+
+# =============================================================================
+# Potential-field path planning around an elliptical obstacle
+# =============================================================================
+# Vectorized counterparts of the helpers in "PAth Planning.py".  Positions are
+# (R, 2) arrays holding one row per robot; goals and gains may be shared
+# scalars / points or per-robot arrays of length R.
+
+
+def f_obs(x, y, a, b):
+    """Compute the ellipse implicit function value.
+       f = (x^2)/(a^2) + (y^2)/(b^2) (f = 1 on the obstacle boundary)."""
+    return (x**2)/(a**2) + (y**2)/(b**2)
+
+
+def grad_f_obs(x, y, a, b):
+    """Compute the gradient of f_obs at (x, y); the last axis holds (dfdx, dfdy)."""
+    return np.stack([2 * x / (a**2), 2 * y / (b**2)], axis=-1)
+
+
+@instrumented("planning.attractive_force", elements=point_count)
+def attractive_force(pos, goal, k_attr=1.0):
+    """
+    Attractive force k_attr * (goal - pos) for every robot.
+
+    :param pos: Positions, shape (R, 2).
+    :param goal: Goal point (2,) or per-robot goals (R, 2).
+    :param k_attr: Scalar gain or per-robot gains (R,).
+    :return: Forces, shape (R, 2).
+    """
+    return np.asarray(k_attr)[..., None] * (goal - pos)
+
+
+@instrumented("planning.repulsive_force", elements=point_count)
+def repulsive_force(pos, a_obs, b_obs, k_rep=10.0, d0=1.5):
+    """
+    Repulsive force of the obstacle x²/a² + y²/b² = 1 for every robot.
+
+    Repulsion is active where f_obs < d0 and is directed along grad f_obs with
+    magnitude factor k_rep * (1/f - 1/d0) / f².
+
+    :param pos: Positions, shape (R, 2).
+    :param a_obs: Obstacle semi-axis along x.
+    :param b_obs: Obstacle semi-axis along y.
+    :param k_rep: Scalar gain or per-robot gains (R,).
+    :param d0: Scalar threshold or per-robot thresholds (R,).
+    :return: Forces, shape (R, 2).
+    """
+    x, y = pos[..., 0], pos[..., 1]
+    f_val = f_obs(x, y, a_obs, b_obs)
+    active = f_val < d0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = k_rep * (1.0/f_val - 1.0/d0) * (1.0 / (f_val**2))
+    factor = np.where(active, factor, 0.0)
+    return factor[..., None] * grad_f_obs(x, y, a_obs, b_obs)
+
+
+@instrumented("planning.potential_force", elements=point_count)
+def potential_force(pos, goal, a_obs, b_obs, k_attr=1.0, k_rep=10.0, d0=1.5):
+    """Total (attractive + repulsive) force for every robot, shape (R, 2)."""
+    return (attractive_force(pos, goal, k_attr)
+            + repulsive_force(pos, a_obs, b_obs, k_rep, d0))
+
+
+@instrumented("planning.simulate_potential_field", elements=point_count)
+def simulate_potential_field(start, goal, a_obs, b_obs, k_attr=1.0, k_rep=10.0,
+                             d0=1.5, dt=0.05, num_steps=300, goal_tol=None,
+                             out=None):
+    """
+    Advance R robots through the potential field with explicit Euler steps.
+
+    All robots are integrated together as an (R, 2) array.  When `goal_tol` is
+    given, a robot closer than that to its goal is frozen (its remaining
+    trajectory rows repeat its final position), and the loop stops as soon as
+    every robot has arrived.
+
+    :param start: Start point (2,) or per-robot starts (R, 2).
+    :param goal: Goal point (2,) or per-robot goals (R, 2).
+    :param a_obs: Obstacle semi-axis along x.
+    :param b_obs: Obstacle semi-axis along y.
+    :param k_attr: Attractive gain, scalar or (R,).
+    :param k_rep: Repulsive gain, scalar or (R,).
+    :param d0: Repulsion threshold on f_obs, scalar or (R,).
+    :param dt: Time step.
+    :param num_steps: Maximum number of Euler steps.
+    :param goal_tol: Optional arrival distance for early exit.
+    :param out: Optional preallocated trajectory buffer (num_steps + 1, R, 2).
+    :return: Tuple (trajectory, steps) where trajectory has shape
+             (num_steps + 1, R, 2) and steps[r] is the number of steps robot r
+             actually moved.
+    """
+    start = np.atleast_2d(np.asarray(start, dtype=float))
+    goal = np.atleast_2d(np.asarray(goal, dtype=float))
+    R = max(start.shape[0], goal.shape[0],
+            np.size(k_attr), np.size(k_rep), np.size(d0))
+    start = np.broadcast_to(start, (R, 2))
+    goal = np.broadcast_to(goal, (R, 2))
+    k_attr = np.broadcast_to(np.asarray(k_attr, dtype=float), (R,))
+    k_rep = np.broadcast_to(np.asarray(k_rep, dtype=float), (R,))
+    d0 = np.broadcast_to(np.asarray(d0, dtype=float), (R,))
+
+    shape = (num_steps + 1, R, 2)
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+
+    out[0] = start
+    steps = np.full(R, num_steps)
+    # Compact per-robot state for the robots still moving; it is only
+    # re-gathered when some robots arrive, not on every step.
+    idx = np.arange(R)
+    p, g = start.copy(), goal.copy()
+    ka, kr, dd = k_attr, k_rep, d0
+    for step in range(1, num_steps + 1):
+        if goal_tol is not None:
+            diff = g - p
+            arrived = np.einsum("ij,ij->i", diff, diff) < goal_tol**2
+            if arrived.any():
+                done = idx[arrived]
+                steps[done] = step - 1
+                out[step:, done] = p[arrived]
+                keep = ~arrived
+                idx, p, g = idx[keep], p[keep], g[keep]
+                ka, kr, dd = ka[keep], kr[keep], dd[keep]
+                if idx.size == 0:
+                    break
+        F_total = potential_force(p, g, a_obs, b_obs, ka, kr, dd)
+        p += dt * F_total
+        if idx.size == R:
+            out[step] = p
+        else:
+            out[step, idx] = p
+    return out, steps
+
+
+@instrumented("planning.scene_repulsive_force", elements=point_count)
+def scene_repulsive_force(pos, scene, k_rep=10.0, d0=1.5):
+    """
+    Summed repulsive force of every obstacle in an EllipseScene.
+
+    Each obstacle contributes the same term as repulsive_force, computed from
+    its implicit value in its own frame.  Only obstacles returned by the
+    scene's broad phase are evaluated: f < d0 means the point lies inside the
+    obstacle scaled by sqrt(d0), so its AABB inflated by
+    (sqrt(d0) - 1) * max(a, b) is a safe candidate region.
+
+    :param pos: Positions, shape (R, 2).
+    :param scene: EllipseScene of obstacles.
+    :param k_rep: Scalar repulsive gain.
+    :param d0: Scalar threshold on the implicit value.
+    :return: Forces, shape (R, 2).
+    """
+    pos = np.atleast_2d(np.asarray(pos, dtype=float))
+    obs = scene.obstacles
+    margin = max(np.sqrt(d0) - 1.0, 0.0) * float(np.max(np.maximum(obs.a, obs.b)))
+    qi, oi = scene.candidates(pos, margin=margin)
+    xl, yl = obs.to_local(pos[qi], oi)
+    a, b = obs.a[oi], obs.b[oi]
+    f_val = f_obs(xl, yl, a, b)
+    active = f_val < d0
+    qi, oi, xl, yl, a, b, f_val = (v[active] for v in (qi, oi, xl, yl, a, b, f_val))
+
+    factor = k_rep * (1.0/f_val - 1.0/d0) * (1.0 / (f_val**2))
+    gx, gy = 2 * xl / (a**2), 2 * yl / (b**2)
+    c, s = np.cos(obs.phi[oi]), np.sin(obs.phi[oi])
+    force = np.zeros_like(pos)
+    force[:, 0] = np.bincount(qi, factor * (gx * c - gy * s), minlength=len(pos))
+    force[:, 1] = np.bincount(qi, factor * (gx * s + gy * c), minlength=len(pos))
+    return force
+
+
+@instrumented("planning.plan_adaptive", elements=point_count)
+def plan_adaptive(start, goal, a_obs, b_obs, k_attr=1.0, k_rep=10.0, d0=1.5,
+                  scene=None, t_max=15.0, rtol=1e-4, atol=1e-6, goal_tol=0.05,
+                  stall_tol=1e-3, stop_on_collision=True, max_points=2000):
+    """
+    Potential-field planning with the adaptive integrator.
+
+    Same field as simulate_potential_field (or, when `scene` is given, the
+    summed field of every obstacle in that EllipseScene), integrated with
+    error-controlled Dormand-Prince steps instead of fixed Euler steps.  Each
+    robot stops at the first goal, collision or stall event.
+
+    :param start: Start point (2,) or per-robot starts (R, 2).
+    :param goal: Goal point (2,) or per-robot goals (R, 2).
+    :param a_obs: Obstacle semi-axis along x (ignored when scene is given).
+    :param b_obs: Obstacle semi-axis along y (ignored when scene is given).
+    :param k_attr: Attractive gain, scalar or (R,).
+    :param k_rep: Repulsive gain (scalar when scene is given, else scalar or (R,)).
+    :param d0: Repulsion threshold (scalar when scene is given, else scalar or (R,)).
+    :param scene: Optional EllipseScene of obstacles.
+    :param t_max: Time horizon (15 s matches the 300 Euler steps of dt = 0.05).
+    :param stop_on_collision: Stop robots that enter an obstacle.  The field
+                              is finite on the boundary, so with the default
+                              gains a robot can cut through an obstacle.
+    :return: integrate.AdaptiveResult.
+    """
+    start = np.atleast_2d(np.asarray(start, dtype=float))
+    goal = np.atleast_2d(np.asarray(goal, dtype=float))
+    R = max(start.shape[0], goal.shape[0], np.size(k_attr))
+    goal = np.broadcast_to(goal, (R, 2))
+    k_attr = np.broadcast_to(np.asarray(k_attr, dtype=float), (R,))
+
+    if scene is None:
+        k_rep = np.broadcast_to(np.asarray(k_rep, dtype=float), (R,))
+        d0 = np.broadcast_to(np.asarray(d0, dtype=float), (R,))
+
+        def force(pos, idx):
+            return potential_force(pos, goal[idx], a_obs, b_obs,
+                                   k_attr[idx], k_rep[idx], d0[idx])
+
+        def collision(pos, idx):
+            return f_obs(pos[:, 0], pos[:, 1], a_obs, b_obs) <= 1
+    else:
+        def force(pos, idx):
+            return (attractive_force(pos, goal[idx], k_attr[idx])
+                    + scene_repulsive_force(pos, scene, k_rep, d0))
+
+        def collision(pos, idx):
+            return scene.containing(pos) >= 0
+
+    return integrate_adaptive(force, np.broadcast_to(start, (R, 2)), goal,
+                              t_max=t_max, rtol=rtol, atol=atol,
+                              goal_tol=goal_tol,
+                              collision=collision if stop_on_collision else None,
+                              stall_tol=stall_tol, max_points=max_points)
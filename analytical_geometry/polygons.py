@@ -0,0 +1,285 @@
+from functools import lru_cache
+
+import numpy as np
+
+# =============================================================================
+# Error-bounded polygons for ellipses and their offset curves
+# =============================================================================
+# The offset of x²/a² + y²/b² = 1 by a distance r >= 0 is
+#     O(θ) = (a cosθ, b sinθ) + r n(θ),   n(θ) = (b cosθ, a sinθ) / |(b cosθ, a sinθ)|,
+# a convex curve (but not an ellipse) whose curvature is κ / (1 + r κ), κ being
+# the curvature of the ellipse.  A chord spanning an arc of length s whose
+# curvature never exceeds k deviates from the arc by at most
+#     (1 - cos(k s / 2)) / k,
+# so vertices are placed greedily along the curve, each chord as long as
+# that bound allows.  Within a quadrant the curvature is monotone (largest at
+# the end of the major axis), so the curvature at the start of every step
+# bounds the whole step.  One quadrant is built and mirrored.
+#
+# "inner" polygons have their vertices on the curve (inscribed; Hausdorff
+# error <= tol).  "outer" polygons push every edge of an inscribed polygon
+# with sagitta bound h out by h; the curve then lies within h of the edges and
+# each vertex moves by h / cos(β/2) (β the turning angle there), so h is
+# shrunk until that stays <= tol.
+
+_GAUSS_X, _GAUSS_W = np.polynomial.legendre.leggauss(16)
+_MIN_QUADRANT_STEPS = 2
+
+
+def _curvature(a, b, t):
+    return a * b / (a**2 * np.sin(t)**2 + b**2 * np.cos(t)**2)**1.5
+
+
+def _normal_angle(a, b, t):
+    return np.arctan2(a * np.sin(t), b * np.cos(t))
+
+
+def _offset_arc_length(a, b, r, t0, t1):
+    """Arc length of the offset curve between parameters t0 < t1."""
+    half = 0.5 * (t1 - t0)
+    t = 0.5 * (t1 + t0) + half * _GAUSS_X
+    ellipse = half * np.dot(np.sqrt((a * np.sin(t))**2 + (b * np.cos(t))**2), _GAUSS_W)
+    # The normal turns by the same angle along the ellipse and its offset.
+    return ellipse + r * (_normal_angle(a, b, t1) - _normal_angle(a, b, t0))
+
+
+def offset_point(a, b, r, t):
+    """Point(s) of the offset curve at eccentric angle(s) t, shape (..., 2)."""
+    t = np.asarray(t, dtype=float)
+    nx, ny = b * np.cos(t), a * np.sin(t)
+    norm = np.hypot(nx, ny)
+    return np.stack([a * np.cos(t) + r * nx / norm,
+                     b * np.sin(t) + r * ny / norm], axis=-1)
+
+
+def _quadrant_parameters(a, b, r, sagitta):
+    """Parameters in [0, π/2] of the vertices for a >= b (major axis along x)."""
+    params = [0.0]
+    t = 0.0
+    while t < 0.5 * np.pi:
+        kappa = _curvature(a, b, t)
+        k = kappa / (1 + r * kappa)
+        if k * sagitta >= 1:
+            s = np.pi / k
+        else:
+            s = 2 / k * np.arccos(1 - k * sagitta)
+        if _offset_arc_length(a, b, r, t, 0.5 * np.pi) <= s:
+            break
+        # Largest step whose arc length is s (arc length is monotone in t).
+        lo, hi = t, 0.5 * np.pi
+        for _ in range(40):
+            mid = 0.5 * (lo + hi)
+            if _offset_arc_length(a, b, r, t, mid) <= s:
+                lo = mid
+            else:
+                hi = mid
+        t = lo
+        params.append(t)
+    params.append(0.5 * np.pi)
+    params = np.array(params)
+    if len(params) < _MIN_QUADRANT_STEPS + 1:
+        params = np.linspace(0, 0.5 * np.pi, _MIN_QUADRANT_STEPS + 1)
+    return params
+
+
+def _mirror(q):
+    """Full CCW parameter list from first-quadrant parameters 0 .. π/2."""
+    return np.concatenate([q[:-1], np.pi - q[::-1][:-1],
+                           np.pi + q[:-1], 2 * np.pi - q[::-1][:-1]])
+
+
+@lru_cache(maxsize=256)
+def _cached_polygon(a, b, r, tol, kind):
+    swap = a < b
+    if swap:
+        a, b = b, a
+    sagitta = tol
+    while True:
+        poly = offset_point(a, b, r, _mirror(_quadrant_parameters(a, b, r, sagitta)))
+        if kind == "inner":
+            break
+        # Push every edge out by the sagitta bound and intersect neighbours.
+        edge = np.roll(poly, -1, axis=0) - poly
+        normal = np.column_stack([edge[:, 1], -edge[:, 0]])
+        normal /= np.hypot(normal[:, 0], normal[:, 1])[:, None]
+        n_prev = np.roll(normal, 1, axis=0)
+        cos_half = np.sqrt(0.5 * (1 + np.einsum("ij,ij->i", normal, n_prev)))
+        if sagitta <= tol * cos_half.min():
+            poly = poly + sagitta * (normal + n_prev) / (2 * cos_half**2)[:, None]
+            break
+        sagitta = 0.999 * tol * cos_half.min()
+    if swap:
+        # Undo the swap by a quarter turn, which keeps the order CCW.
+        poly = np.column_stack([-poly[:, 1], poly[:, 0]])
+    poly.flags.writeable = False
+    return poly
+
+
+def offset_polygon(a, b, offset, tol, kind="outer"):
+    """
+    Polygon approximating the offset curve of x²/a² + y²/b² = 1.
+
+    Results are cached by (a, b, offset, tol, kind) and returned read-only.
+
+    :param a: Semi-axis along x.
+    :param b: Semi-axis along y.
+    :param offset: Non-negative offset distance (e.g. the robot radius).
+    :param tol: Hausdorff error bound between polygon and curve.
+    :param kind: "outer" (encloses the curve) or "inner" (vertices on the curve).
+    :return: (m, 2) array of CCW vertices in the ellipse's own frame.
+    """
+    if kind not in ("inner", "outer"):
+        raise ValueError("kind must be 'inner' or 'outer'")
+    if offset < 0:
+        raise ValueError("offset must be non-negative")
+    if tol <= 0:
+        raise ValueError("tol must be positive")
+    return _cached_polygon(float(a), float(b), float(offset), float(tol), kind)
+
+
+def ellipse_polygon(a, b, tol, kind="outer"):
+    """
+    Polygon with the fewest vertices this construction allows that stays
+    within Hausdorff distance tol of the ellipse x²/a² + y²/b² = 1.
+
+    Shares the bounded LRU cache of offset_polygon (offset 0).
+
+    :param a: Semi-axis along x.
+    :param b: Semi-axis along y.
+    :param tol: Hausdorff error bound.
+    :param kind: "outer" (circumscribed, conservative for collisions) or
+                 "inner" (inscribed).
+    :return: (m, 2) read-only array of CCW vertices.
+    """
+    return offset_polygon(a, b, 0.0, tol, kind)
+
+
+def place_polygon(poly, cx=0.0, cy=0.0, phi=0.0):
+    """Rotate a local-frame polygon by phi and move it to (cx, cy)."""
+    c, s = np.cos(phi), np.sin(phi)
+    return np.column_stack([cx + poly[:, 0] * c - poly[:, 1] * s,
+                            cy + poly[:, 0] * s + poly[:, 1] * c])
+
+
+def polygon_cache_info():
+    """functools cache statistics of offset_polygon / ellipse_polygon."""
+    return _cached_polygon.cache_info()
+
+
+def clear_polygon_cache():
+    """Empty the offset_polygon / ellipse_polygon cache."""
+    _cached_polygon.cache_clear()
+
+
+# =============================================================================
+# Point tests
+# =============================================================================
+def points_in_star_polygon(points, poly):
+    """
+    Inside test for a CCW polygon that is star-shaped about the origin
+    (every polygon above), by binary search over its angular wedges.
+
+    :param points: (..., 2) array in the polygon's frame.
+    :param poly: (m, 2) CCW vertices; the origin must be interior.
+    :return: Boolean array of shape points.shape[:-1] (boundary counts as inside).
+    """
+    points = np.asarray(points, dtype=float)
+    start = np.arctan2(poly[0, 1], poly[0, 0])
+    angles = np.mod(np.arctan2(poly[:, 1], poly[:, 0]) - start, 2 * np.pi)
+    angles[0] = 0.0
+    x, y = points[..., 0], points[..., 1]
+    k = np.searchsorted(angles, np.mod(np.arctan2(y, x) - start, 2 * np.pi), side="right") - 1
+    p = poly[k]
+    q = poly[(k + 1) % len(poly)]
+    return (q[..., 0] - p[..., 0]) * (y - p[..., 1]) - (q[..., 1] - p[..., 1]) * (x - p[..., 0]) >= 0
+
+
+def inflated_contains(points, obstacles, offset, tol):
+    """
+    Which points lie within `offset` of any obstacle, using the cached outer
+    offset polygons (answers can only err towards True, by at most tol).
+
+    :param points: (n, 2) array.
+    :param obstacles: EllipseBatch.
+    :param offset: Inflation distance, e.g. the robot radius.
+    :param tol: Hausdorff tolerance of the inflated outlines.
+    :return: Boolean array (n,).
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    hit = np.zeros(len(points), dtype=bool)
+    xmin, ymin, xmax, ymax = obstacles.aabb()
+    pad = offset + tol
+    for i in range(len(obstacles)):
+        x, y = points[:, 0], points[:, 1]
+        rest = np.flatnonzero(~hit & (x >= xmin[i] - pad) & (x <= xmax[i] + pad)
+                              & (y >= ymin[i] - pad) & (y <= ymax[i] + pad))
+        if len(rest) == 0:
+            continue
+        poly = offset_polygon(obstacles.a[i], obstacles.b[i], offset, tol, "outer")
+        local = np.stack(obstacles.to_local(points[rest], i), axis=-1)
+        hit[rest] = points_in_star_polygon(local, poly)
+    return hit
+
+
+# =============================================================================
+# Separating-axis tests
+# =============================================================================
+def _edge_normals(poly):
+    edge = np.roll(poly, -1, axis=0) - poly
+    return np.column_stack([edge[:, 1], -edge[:, 0]])
+
+
+def convex_polygons_overlap(p, q):
+    """
+    Separating-axis test for two convex polygons; touching counts as overlap.
+
+    :param p: (m, 2) vertices.
+    :param q: (k, 2) vertices.
+    :return: True if the polygons intersect.
+    """
+    axes = np.concatenate([_edge_normals(p), _edge_normals(q)])
+    proj_p = p @ axes.T
+    proj_q = q @ axes.T
+    return not np.any((proj_p.max(axis=0) < proj_q.min(axis=0))
+                      | (proj_q.max(axis=0) < proj_p.min(axis=0)))
+
+
+def _ellipse_touches_polygon(a, b, local):
+    """Exact test in the ellipse frame: scaled to the unit circle, the polygon
+    overlaps it iff it contains the origin or an edge comes within 1 of it."""
+    p = local / np.array([a, b])
+    d = np.roll(p, -1, axis=0) - p
+    cross = d[:, 0] * (-p[:, 1]) - d[:, 1] * (-p[:, 0])
+    if np.all(cross >= 0) or np.all(cross <= 0):
+        return True
+    t = np.clip(-np.einsum("ij,ij->i", p, d) / np.einsum("ij,ij->i", d, d), 0, 1)
+    closest = p + t[:, None] * d
+    return bool(np.min(np.einsum("ij,ij->i", closest, closest)) <= 1)
+
+
+def ellipses_polygon_overlap(obstacles, polygon, tol=1e-2):
+    """
+    Which obstacles intersect a convex polygon (e.g. a robot footprint).
+
+    Outer polygons reject by SAT, inner polygons accept by SAT; only the pairs
+    the two disagree on (the polygon passes within tol of the boundary) get
+    the exact test.
+
+    :param obstacles: EllipseBatch.
+    :param polygon: (k, 2) convex polygon in world coordinates.
+    :param tol: Hausdorff tolerance of the cached ellipse polygons.
+    :return: Boolean array (n,).
+    """
+    polygon = np.asarray(polygon, dtype=float)
+    hit = np.zeros(len(obstacles), dtype=bool)
+    xmin, ymin, xmax, ymax = obstacles.aabb()
+    lo, hi = polygon.min(axis=0), polygon.max(axis=0)
+    near = np.flatnonzero((xmin <= hi[0]) & (xmax >= lo[0]) & (ymin <= hi[1]) & (ymax >= lo[1]))
+    for i in near:
+        local = np.stack(obstacles.to_local(polygon, i), axis=-1)
+        a, b = obstacles.a[i], obstacles.b[i]
+        if not convex_polygons_overlap(ellipse_polygon(a, b, tol, "outer"), local):
+            continue
+        hit[i] = (convex_polygons_overlap(ellipse_polygon(a, b, tol, "inner"), local)
+                  or _ellipse_touches_polygon(a, b, local))
+    return hit
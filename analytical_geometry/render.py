@@ -0,0 +1,190 @@
+import argparse
+import os
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# =============================================================================
+# Headless, parallel export of the animation scripts
+# =============================================================================
+# Every worker process runs the script itself on the Agg backend (show() is a
+# no-op there), picks the requested animation from the script's globals and
+# renders a contiguous block of frames to PNG files.  The frames are then
+# assembled into a GIF (Pillow), an MP4 (ffmpeg) or kept as a PNG sequence.
+#
+# Only animations built with animation.frame_animation can be exported: their
+# figure, callback, init function and blit flag are public attributes
+# (frame_figure, frame_draw, frame_init, frame_blit).
+#
+# Frames are rendered out of order across workers, so this suits callbacks
+# that draw frame i from precomputed data alone (see animation.precompute);
+# a callback that accumulates state over earlier frames only sees the frames
+# of its own block.
+#
+# Blitting animations are exported the way they are displayed: the static
+# layer is drawn once per worker and every frame restores it and draws only
+# the artists the callback returns.
+
+
+def _load_animation(script, index):
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    from matplotlib.animation import Animation
+    # The animations are driven by hand, never through show() or save().
+    warnings.filterwarnings("ignore", "Animation was deleted without rendering")
+    # Like `python script.py`: the script's own directory is importable.
+    folder = os.path.dirname(os.path.abspath(script))
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    namespace = runpy.run_path(script, run_name="__main__")
+    anims = [v for v in namespace.values() if isinstance(v, Animation)]
+    if not anims:
+        raise ValueError(f"{script} defines no animation")
+    return anims[index]
+
+
+def _render_block(script, index, block, outdir, dpi):
+    anim = _load_animation(script, index)
+    if not hasattr(anim, "frame_draw"):
+        raise ValueError(f"animation {index} of {script} was not built with "
+                         "analytical_geometry.animation.frame_animation")
+    fig, draw = anim.frame_figure, anim.frame_draw
+    artists = anim.frame_init() if anim.frame_init is not None else None
+    paths = [os.path.join(outdir, f"frame_{k:05d}.png") for k in block]
+
+    if not anim.frame_blit:
+        for k, path in zip(block, paths):
+            draw(k)
+            # Fast PNG compression: the frames are intermediate files.
+            fig.savefig(path, dpi=dpi, pil_kwargs={"compress_level": 1})
+        return paths
+
+    from PIL import Image
+    fig.set_dpi(dpi)
+    if artists is None:
+        artists = draw(block[0])
+    for artist in artists:
+        artist.set_animated(True)
+    canvas = fig.canvas
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    for k, path in zip(block, paths):
+        canvas.restore_region(background)
+        for artist in sorted(draw(k), key=lambda a: a.get_zorder()):
+            fig.draw_artist(artist)
+        Image.frombuffer("RGBA", canvas.get_width_height(), canvas.buffer_rgba(),
+                         "raw", "RGBA", 0, 1).save(path, compress_level=1)
+    return paths
+
+
+def animation_info(script, index=0):
+    """Frame count and interval (ms) of the index-th animation of `script`."""
+    anim = _load_animation(script, index)
+    return len(list(anim.new_frame_seq())), anim.event_source.interval
+
+
+def render_frames(script, outdir, index=0, workers=None, dpi=100, n_frames=None):
+    """
+    Render every frame of an animation script to PNG files in parallel.
+
+    :param script: Path of the script.
+    :param outdir: Directory receiving frame_00000.png, frame_00001.png, ...
+    :param index: Which animation of the script (in definition order).
+    :param workers: Process count (default: CPU count).
+    :param dpi: Resolution of the frames.
+    :param n_frames: Frame count if already known (saves running the script once).
+    :return: List of frame paths in frame order.
+    """
+    script = os.path.abspath(script)
+    os.makedirs(outdir, exist_ok=True)
+    n = n_frames if n_frames is not None else animation_info(script, index)[0]
+    workers = min(workers or os.cpu_count() or 1, n)
+    blocks = [b.tolist() for b in np.array_split(np.arange(n), workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_render_block, [script] * workers, [index] * workers,
+                           blocks, [outdir] * workers, [dpi] * workers)
+        return [path for paths in results for path in paths]
+
+
+def export_animation(script, output, index=0, workers=None, dpi=100, fps=None):
+    """
+    Render an animation script headlessly to a GIF, MP4 or PNG sequence.
+
+    :param script: Path of the script.
+    :param output: Target file (.gif or .mp4) or a directory for PNG frames.
+    :param index: Which animation of the script (in definition order).
+    :param workers: Process count (default: CPU count).
+    :param dpi: Resolution of the frames.
+    :param fps: Frame rate; by default that of the animation's interval.
+    :return: The output path.
+    """
+    ext = os.path.splitext(output)[1].lower()
+    if ext not in ("", ".gif", ".mp4"):
+        raise ValueError("output must be a .gif, an .mp4 or a directory")
+    if ext == ".mp4" and shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is required for MP4 export")
+    n, interval = animation_info(script, index)
+    if fps is None:
+        fps = 1000.0 / interval
+
+    if ext == "":
+        render_frames(script, output, index, workers, dpi, n)
+        return output
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = render_frames(script, tmp, index, workers, dpi, n)
+        if ext == ".gif":
+            from PIL import Image
+            images = [Image.open(p) for p in paths]
+            images[0].save(output, save_all=True, append_images=images[1:],
+                           duration=int(round(1000 / fps)), loop=0)
+        else:
+            subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-framerate", str(fps),
+                            "-i", os.path.join(tmp, "frame_%05d.png"),
+                            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                            "-pix_fmt", "yuv420p", output], check=True)
+    return output
+
+
+def profile_script(script, index=0, json_path=None):
+    """
+    Time every frame of an animation script headlessly (see
+    animation.profile_animation) and print the summary table.
+
+    :return: The FrameTimer.
+    """
+    from analytical_geometry.animation import profile_animation
+    timer = profile_animation(_load_animation(script, index))
+    print(timer.table())
+    if json_path is not None:
+        timer.to_json(json_path)
+    return timer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render an animation script headlessly.")
+    parser.add_argument("script")
+    parser.add_argument("output", nargs="?", help=".gif, .mp4 or a directory for PNG frames")
+    parser.add_argument("--index", type=int, default=0, help="animation index within the script")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--fps", type=float, default=None)
+    parser.add_argument("--profile", metavar="JSON", nargs="?", const="",
+                        help="time every frame instead of exporting (optionally write JSON)")
+    args = parser.parse_args(argv)
+    if args.profile is not None:
+        profile_script(args.script, args.index, args.profile or None)
+    elif args.output is None:
+        parser.error("an output is required unless --profile is given")
+    else:
+        print(export_animation(args.script, args.output, args.index, args.workers, args.dpi, args.fps))
+
+
+if __name__ == "__main__":
+    main()
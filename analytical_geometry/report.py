@@ -0,0 +1,135 @@
+import argparse
+import html
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+import numpy as np
+
+# =============================================================================
+# Batch reports for the worked-example scripts
+# =============================================================================
+# A worked-example script defines one function per example.  Each function
+# prints its commentary, draws its figure(s) with pyplot and returns a dict of
+# its numeric results; it does not call plt.show().  Interactively the script
+# runs the examples one after another and shows each figure; in report mode
+# every example runs in a worker process on the Agg backend, its figures are
+# written to files and its results and printed output are collected into
+# report.json and report.html:
+#
+#     python "Practical examplle of 10-15.py" --report out/examples_10_15
+#
+# The example functions must be defined at module level so that the worker
+# processes can find them.
+
+
+def _jsonable(value):
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return _jsonable(value.tolist())
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+    if value is None or isinstance(value, str):
+        return value
+    # sympy expressions and anything else: their printed form.
+    return str(value)
+
+
+def _run_example(example, outdir, fmt, dpi):
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    import matplotlib.pyplot as plt
+    plt.close("all")
+    output = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        results = example()
+    seconds = time.perf_counter() - start
+    figures = []
+    numbers = plt.get_fignums()
+    for k, num in enumerate(numbers):
+        suffix = "" if len(numbers) == 1 else f"_{k + 1}"
+        name = f"{example.__name__}{suffix}.{fmt}"
+        plt.figure(num).savefig(os.path.join(outdir, name), dpi=dpi)
+        figures.append(name)
+    plt.close("all")
+    doc = (example.__doc__ or example.__name__).strip().splitlines()[0]
+    return {"name": example.__name__, "title": doc, "results": _jsonable(results or {}),
+            "output": output.getvalue(), "figures": figures, "seconds": seconds}
+
+
+def _html(title, entries):
+    parts = [f"<!DOCTYPE html>\n<html><head><meta charset='utf-8'><title>{html.escape(title)}</title>",
+             "<style>body{font-family:sans-serif;max-width:60em;margin:auto}"
+             "td,th{padding:2px 10px;text-align:left}pre{background:#f4f4f4;padding:8px}</style>",
+             f"</head><body><h1>{html.escape(title)}</h1>"]
+    for e in entries:
+        parts.append(f"<h2 id='{e['name']}'>{html.escape(e['title'])}</h2>")
+        rows = "".join(f"<tr><th>{html.escape(k)}</th><td>{html.escape(json.dumps(v))}</td></tr>"
+                       for k, v in e["results"].items())
+        parts.append(f"<table>{rows}</table>")
+        if e["output"].strip():
+            parts.append(f"<pre>{html.escape(e['output'].strip())}</pre>")
+        parts += [f"<img src='{html.escape(f)}' alt='{html.escape(f)}'>" for f in e["figures"]]
+    parts.append("</body></html>\n")
+    return "\n".join(parts)
+
+
+def run_report(examples, outdir, title="Worked examples", workers=None, fmt="png", dpi=100):
+    """
+    Run example functions in parallel and write their figures and results.
+
+    :param examples: Module-level functions returning a dict of results.
+    :param outdir: Directory receiving the figures, report.json and report.html.
+    :param title: Report title.
+    :param workers: Process count (default: CPU count).
+    :param fmt: Figure format ("png", "svg", "pdf", ...).
+    :param dpi: Figure resolution.
+    :return: The report dict (as written to report.json).
+    """
+    os.makedirs(outdir, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, len(examples))
+    start = time.perf_counter()
+    entries = []
+    if examples:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            entries = list(pool.map(_run_example, examples, [outdir] * len(examples),
+                                    [fmt] * len(examples), [dpi] * len(examples)))
+    report = {"title": title, "seconds": time.perf_counter() - start, "examples": entries}
+    with open(os.path.join(outdir, "report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    with open(os.path.join(outdir, "report.html"), "w", encoding="utf-8") as f:
+        f.write(_html(title, entries))
+    return report
+
+
+def main(examples, title="Worked examples", argv=None):
+    """
+    Command line of a worked-example script: show the examples one by one,
+    or write a report with --report DIR.
+    """
+    parser = argparse.ArgumentParser(description=title)
+    parser.add_argument("--report", metavar="DIR", help="write figures and results to DIR")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--format", default="png", help="figure format in report mode")
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args(argv)
+    if args.report:
+        report = run_report(examples, args.report, title, args.workers, args.format, args.dpi)
+        print(f"{len(report['examples'])} examples in {report['seconds']:.2f} s -> "
+              f"{os.path.join(args.report, 'report.html')}")
+        return report
+    import matplotlib.pyplot as plt
+    for example in examples:
+        example()
+        plt.show()
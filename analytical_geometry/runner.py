@@ -0,0 +1,283 @@
+import argparse
+import builtins
+import functools
+import json
+import os
+import re
+import resource
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+# =============================================================================
+# Headless runner for the whole script collection
+# =============================================================================
+# Every script runs in its own Python process (so memory and import costs are
+# not shared between scripts), several processes at a time.  The child
+# process
+#
+#   * uses the Agg backend, so plt.show() returns at once,
+#   * forces view=False on graphviz renders and turns webbrowser.open into a
+#     no-op, so no viewer is ever started,
+#   * runs with a private working directory; every file the script writes
+#     there (PNG/PDF/DOT, HTML maps, ...) is reported as an artifact,
+#
+# and records wall time, CPU time, the time spent in import statements and the
+# peak resident set size of the process.  With `frames=True` the animations a
+# script defines are also driven frame by frame (animation.profile_animation).
+#
+#     python -m analytical_geometry.runner --save baseline.json
+#     python -m analytical_geometry.runner --compare baseline.json
+#
+# The JSON report is the regression baseline of the collection: --compare
+# flags scripts that got slower than the threshold or stopped running.
+
+
+def discover(root="."):
+    """The top-level .py scripts of `root`, sorted by name."""
+    return sorted(os.path.join(root, name) for name in os.listdir(root)
+                  if name.endswith(".py") and os.path.isfile(os.path.join(root, name)))
+
+
+def _slug(script):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", os.path.splitext(os.path.basename(script))[0])
+
+
+# -----------------------------------------------------------------------------
+# Child process
+# -----------------------------------------------------------------------------
+def _no_view(render):
+    @functools.wraps(render)
+    def wrapper(self, *args, **kwargs):
+        kwargs["view"] = False
+        return render(self, *args, **kwargs)
+    return wrapper
+
+
+def _suppress_viewers():
+    """Patch viewers of modules imported so far (called after every import)."""
+    graphviz = sys.modules.get("graphviz")
+    if graphviz is not None and not getattr(graphviz, "_headless", False):
+        for name in ("Graph", "Digraph", "Source"):
+            cls = getattr(graphviz, name, None)
+            if cls is not None and hasattr(cls, "render"):
+                cls.render = _no_view(cls.render)
+        if hasattr(graphviz, "view"):
+            graphviz.view = lambda *args, **kwargs: None
+        graphviz._headless = True
+
+
+class _ImportClock:
+    """Wraps builtins.__import__ and sums the time of outermost imports."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self._depth = 0
+        self._import = builtins.__import__
+
+    def __call__(self, *args, **kwargs):
+        if self._depth:
+            return self._import(*args, **kwargs)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            return self._import(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self._depth -= 1
+            _suppress_viewers()
+
+
+def _profile_frames(namespace):
+    from matplotlib.animation import Animation
+    from analytical_geometry.animation import profile_animation
+    results = []
+    for anim in (v for v in namespace.values() if isinstance(v, Animation)):
+        summary = profile_animation(anim).summary()
+        results.append({"frames": summary["frames"], "mean_ms": summary["total"]["mean"],
+                        "p95_ms": summary["total"]["p95"],
+                        "dropped_frames": summary["dropped_frames"]})
+    return results
+
+
+def _run_child(script, frames):
+    """Run `script` in this process (cwd = its artifact directory) and measure it."""
+    import webbrowser
+    os.environ["MPLBACKEND"] = "Agg"
+    webbrowser.open = lambda *args, **kwargs: False
+    warnings.filterwarnings("ignore", "Animation was deleted without rendering")
+    warnings.filterwarnings("ignore", ".*non-interactive.*cannot be shown")
+    sys.path.insert(0, os.path.dirname(script))
+    sys.argv = [script]
+
+    record = {"status": "ok", "error": None}
+    clock = _ImportClock()
+    builtins.__import__ = clock
+    wall, cpu = time.perf_counter(), time.process_time()
+    namespace = {}
+    try:
+        namespace = runpy.run_path(script, run_name="__main__")
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            record.update(status="error", error=f"SystemExit: {exc.code}")
+    except ModuleNotFoundError as exc:
+        record.update(status="missing-dependency", error=f"{type(exc).__name__}: {exc}")
+    except BaseException as exc:
+        record.update(status="error", error=f"{type(exc).__name__}: {exc}")
+    finally:
+        builtins.__import__ = clock._import
+    record.update(wall_s=time.perf_counter() - wall, cpu_s=time.process_time() - cpu,
+                  import_s=clock.seconds)
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    record["figures"] = len(pyplot.get_fignums()) if pyplot else 0
+    if frames and record["status"] == "ok":
+        record["animations"] = _profile_frames(namespace)
+    # ru_maxrss is in kilobytes on Linux.
+    record["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return record
+
+
+# -----------------------------------------------------------------------------
+# Parent process
+# -----------------------------------------------------------------------------
+def _artifacts(workdir):
+    found = []
+    for folder, _, files in os.walk(workdir):
+        for name in files:
+            path = os.path.join(folder, name)
+            found.append({"path": os.path.relpath(path, workdir), "bytes": os.path.getsize(path)})
+    return sorted(found, key=lambda a: a["path"])
+
+
+def run_script(script, outdir, timeout=600, frames=False):
+    """
+    Run one script headlessly in a fresh process.
+
+    :param script: Path of the script.
+    :param outdir: Parent of the script's artifact directory.
+    :param timeout: Seconds before the process is killed.
+    :param frames: Also time every frame of the script's animations.
+    :return: Dict with status, error, wall_s, cpu_s, import_s, peak_rss_mb,
+             figures, artifacts (and animations with `frames`).
+    """
+    script = os.path.abspath(script)
+    workdir = os.path.abspath(os.path.join(outdir, _slug(script)))
+    os.makedirs(workdir, exist_ok=True)
+    fd, result_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, MPLBACKEND="Agg",
+               PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    cmd = [sys.executable, "-m", "analytical_geometry.runner", "--child", script, result_path]
+    if frames:
+        cmd.append("--frames")
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, cwd=workdir, env=env, capture_output=True, text=True,
+                              timeout=timeout)
+        with open(result_path) as f:
+            text = f.read()
+        if text:
+            record = json.loads(text)
+        else:
+            tail = proc.stderr.strip().splitlines()[-1:] or [f"exit status {proc.returncode}"]
+            record = {"status": "error", "error": tail[0]}
+    except subprocess.TimeoutExpired:
+        record = {"status": "timeout", "error": f"killed after {timeout} s"}
+    finally:
+        os.remove(result_path)
+    record["script"] = os.path.basename(script)
+    record["process_s"] = time.perf_counter() - start
+    record["artifacts"] = _artifacts(workdir)
+    return record
+
+
+def run_all(scripts, outdir, workers=None, timeout=600, frames=False):
+    """
+    Run scripts in parallel processes.
+
+    :return: JSON-compatible report {"meta": ..., "scripts": [record, ...]}.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        records = list(pool.map(lambda s: run_script(s, outdir, timeout, frames), scripts))
+    meta = {"python": sys.version.split()[0], "workers": workers,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    return {"meta": meta, "scripts": records}
+
+
+def compare(current, baseline, threshold=0.25):
+    """
+    Scripts that regressed against `baseline`: wall time above (1 + threshold)
+    times the baseline, or a status other than the baseline's.
+
+    :return: List of (script, message).
+    """
+    before = {r["script"]: r for r in baseline["scripts"]}
+    regressions = []
+    for r in current["scripts"]:
+        b = before.get(r["script"])
+        if b is None:
+            continue
+        if r["status"] != b["status"]:
+            regressions.append((r["script"], f"status {b['status']} -> {r['status']}"))
+        elif r["status"] == "ok" and r["wall_s"] > (1 + threshold) * b["wall_s"]:
+            regressions.append((r["script"], f"wall {b['wall_s']:.2f} s -> {r['wall_s']:.2f} s"))
+    return regressions
+
+
+def format_report(report):
+    lines = [f"{'script':<62}{'status':>20}{'wall s':>9}{'cpu s':>9}{'import s':>10}"
+             f"{'RSS MB':>9}{'files':>7}"]
+    for r in sorted(report["scripts"], key=lambda r: -r.get("wall_s", 0)):
+        lines.append(f"{r['script']:<62}{r['status']:>20}{r.get('wall_s', 0):>9.2f}"
+                     f"{r.get('cpu_s', 0):>9.2f}{r.get('import_s', 0):>10.2f}"
+                     f"{r.get('peak_rss_mb', 0):>9.1f}{len(r['artifacts']):>7}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run every script headlessly and profile it.")
+    parser.add_argument("scripts", nargs="*", help="scripts to run (default: all in --root)")
+    parser.add_argument("--root", default=".", help="directory holding the scripts")
+    parser.add_argument("--outdir", default="runner_artifacts",
+                        help="artifact directories, one per script")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--frames", action="store_true", help="also time every animation frame")
+    parser.add_argument("--save", metavar="JSON", help="write the report as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="baseline to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative wall-time increase (default 0.25)")
+    parser.add_argument("--child", nargs=2, metavar=("SCRIPT", "RESULT"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        script, result_path = args.child
+        record = _run_child(script, args.frames)
+        with open(result_path, "w") as f:
+            json.dump(record, f)
+        return 0
+
+    report = run_all(args.scripts or discover(args.root), args.outdir, args.workers,
+                     args.timeout, args.frames)
+    print(format_report(report))
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for script, message in regressions:
+            print(f"REGRESSION {script}: {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
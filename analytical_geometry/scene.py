@@ -0,0 +1,146 @@
+import numpy as np
+
+from analytical_geometry.ellipses import EllipseBatch
+
+# =============================================================================
+# Scenes of many elliptical obstacles
+# =============================================================================
+# Obstacles are bucketed into a uniform grid by their tight AABBs.  Each cell
+# stores the indices of the obstacles whose box overlaps it (CSR layout:
+# cell_start[c]:cell_start[c + 1] slices cell_items), so a query only looks at
+# obstacles in the handful of cells around each point and its cost follows the
+# local obstacle density rather than the size of the scene.
+
+
+class EllipseScene:
+    """
+    Uniform-grid index over an EllipseBatch of obstacles.
+
+    :param obstacles: EllipseBatch (or an (n, 5) array of (cx, cy, a, b, phi)).
+    :param cell_size: Grid spacing.  Defaults to the mean AABB extent, which
+                      keeps the number of obstacles per cell roughly constant;
+                      it is enlarged when the grid would exceed
+                      MAX_CELLS_PER_OBSTACLE cells per obstacle.
+    """
+
+    MAX_CELLS_PER_OBSTACLE = 4
+
+    def __init__(self, obstacles, cell_size=None):
+        if not isinstance(obstacles, EllipseBatch):
+            obstacles = EllipseBatch.from_array(obstacles)
+        self.obstacles = obstacles
+        self.box = np.column_stack(obstacles.aabb())  # (n, 4): xmin, ymin, xmax, ymax
+        n = len(obstacles)
+        if n == 0:
+            raise ValueError("a scene needs at least one obstacle")
+        if cell_size is None:
+            extent = np.maximum(self.box[:, 2] - self.box[:, 0],
+                                self.box[:, 3] - self.box[:, 1])
+            cell_size = float(np.mean(extent))
+        self.origin = self.box[:, :2].min(axis=0)
+        size = self.box[:, 2:].max(axis=0) - self.origin
+        # Sparse scenes (a few obstacles spread over a large map) would need a
+        # huge dense grid; coarsen it until it has at most MAX_CELLS_PER_OBSTACLE
+        # cells per obstacle.
+        max_cells = max(self.MAX_CELLS_PER_OBSTACLE * n, 64)
+        cell_size = float(cell_size)
+        while np.prod(np.floor(size / cell_size) + 1) > max_cells:
+            cell_size *= max(np.sqrt(np.prod(np.floor(size / cell_size) + 1) / max_cells), 1.01)
+        self.cell_size = cell_size
+        self.shape = tuple(np.floor(size / self.cell_size).astype(int) + 1)
+        self._build()
+
+    def _build(self):
+        nx, ny = self.shape
+        lo = self._cell_of(self.box[:, :2])
+        hi = self._cell_of(self.box[:, 2:])
+        span_x = hi[:, 0] - lo[:, 0] + 1
+        span_y = hi[:, 1] - lo[:, 1] + 1
+        counts = span_x * span_y
+        # One (cell, obstacle) entry for every cell each box overlaps.
+        owner = np.repeat(np.arange(len(self.obstacles)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        ix = lo[owner, 0] + local % span_x[owner]
+        iy = lo[owner, 1] + local // span_x[owner]
+        cell = iy * nx + ix
+        order = np.argsort(cell, kind="stable")
+        self.cell_items = owner[order]
+        self.cell_start = np.searchsorted(cell[order], np.arange(nx * ny + 1))
+
+    def _cell_of(self, points):
+        """Integer (ix, iy) cell coordinates, clipped to the grid."""
+        ij = np.floor((np.asarray(points, dtype=float) - self.origin) / self.cell_size)
+        return np.clip(ij, 0, np.array(self.shape) - 1).astype(np.int64)
+
+    def __len__(self):
+        return len(self.obstacles)
+
+    def __repr__(self):
+        return (f"EllipseScene(n={len(self)}, cell_size={self.cell_size:.3g}, "
+                f"grid={self.shape[0]}x{self.shape[1]})")
+
+    def candidates(self, points, margin=0.0):
+        """
+        Broad phase: pairs (query, obstacle) whose AABB, inflated by `margin`,
+        contains the query point.  Each pair is reported once.
+
+        :param points: Query points, shape (Q, 2).
+        :param margin: Non-negative inflation distance.
+        :return: Tuple (qi, oi) of equal-length index arrays sorted by query.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        nx, ny = self.shape
+        lo = self._cell_of(points - margin)
+        hi = self._cell_of(points + margin)
+        # Inside the grid, expand each query's cell block [lo, hi] into cells.
+        span_x = hi[:, 0] - lo[:, 0] + 1
+        counts = span_x * (hi[:, 1] - lo[:, 1] + 1)
+        q = np.repeat(np.arange(len(points)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell = (lo[q, 1] + local // span_x[q]) * nx + lo[q, 0] + local % span_x[q]
+        start = self.cell_start[cell]
+        n_items = self.cell_start[cell + 1] - start
+        qi = np.repeat(q, n_items)
+        offset = np.arange(n_items.sum()) - np.repeat(np.cumsum(n_items) - n_items, n_items)
+        oi = self.cell_items[np.repeat(start, n_items) + offset]
+
+        box = self.box[oi]
+        p = points[qi]
+        hit = ((p[:, 0] >= box[:, 0] - margin) & (p[:, 0] <= box[:, 2] + margin) &
+               (p[:, 1] >= box[:, 1] - margin) & (p[:, 1] <= box[:, 3] + margin))
+        qi, oi = qi[hit], oi[hit]
+        # An obstacle spanning several visited cells shows up more than once.
+        key = np.unique(qi * len(self) + oi)
+        return key // len(self), key % len(self)
+
+    def near(self, points, d0):
+        """
+        Obstacles within Euclidean distance d0 of each point (including the
+        ones containing it).
+
+        :param points: Query points, shape (Q, 2).
+        :param d0: Distance threshold.
+        :return: Tuple (qi, oi, dist) where dist is the signed distance of
+                 point qi to obstacle oi (negative inside).
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        qi, oi = self.candidates(points, margin=d0)
+        dist = self.obstacles.signed_distance(points[qi], oi)
+        keep = dist <= d0
+        return qi[keep], oi[keep], dist[keep]
+
+    def containing(self, points):
+        """
+        Index of an obstacle containing each point, or -1 for free space.
+        Where obstacles overlap, the lowest index is returned.
+
+        :param points: Query points, shape (Q, 2).
+        :return: Integer array of length Q.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        qi, oi = self.candidates(points)
+        inside = self.obstacles.contains(points[qi], oi)
+        result = np.full(len(points), -1)
+        # Pairs are sorted by (query, obstacle); reverse so the lowest index wins.
+        result[qi[inside][::-1]] = oi[inside][::-1]
+        return result
@@ -0,0 +1,208 @@
+import numpy as np
+
+from analytical_geometry.instrument import instrument_methods
+from analytical_geometry.kernels import POSITION_NAMES, position_of_point
+
+# =============================================================================
+# Theoretical Methods for Ellipse Topics
+# =============================================================================
+# The EllipseTheory helpers of "Position_of_a_point 0.2.5.py" and
+# "Practical examplle of 10-15.py" in one importable class.  Only NumPy is
+# needed to import it: sympy (exact fits and symbolic checks) and matplotlib
+# (the plot helpers) are imported by the methods that use them.
+
+
+@instrument_methods
+class EllipseTheory:
+    @staticmethod
+    def position_of_point(a, b, point):
+        """
+        Determine the position of a point (x1, y1) relative to the ellipse:
+            x²/a² + y²/b² = 1.
+        Returns a tuple (position, value), where position is "Inside", "On", or "Outside"
+        and value = x1²/a² + y1²/b² - 1.
+        (analytical_geometry.kernels.position_of_point classifies whole arrays.)
+        """
+        position, value = position_of_point(float(a), float(b), np.array(point, dtype=float))
+        return POSITION_NAMES[int(position)], float(value)
+
+    @staticmethod
+    def sum_of_focal_distances(a, b, theta_value):
+        """
+        For a point P on the ellipse given in polar form:
+            P = (a cosθ, b sinθ).
+        The foci are at (±ae, 0) where e = sqrt(1 - b²/a²).
+        Returns (sum, d1, d2) where sum is the sum of distances from P to the two foci.
+        (For a point on the ellipse, the sum equals 2a.)
+        """
+        e = np.sqrt(1 - b**2 / a**2)
+        P = np.array([a * np.cos(theta_value), b * np.sin(theta_value)])
+        F1 = np.array([a * e, 0])
+        F2 = np.array([-a * e, 0])
+        d1 = np.linalg.norm(P - F1)
+        d2 = np.linalg.norm(P - F2)
+        return d1 + d2, d1, d2
+
+    @staticmethod
+    def polar_equation(a, b, num_points=200):
+        """
+        Derive the polar equation for the ellipse x²/a² + y²/b² = 1.
+        Using the substitution x = r cosθ, y = r sinθ, we obtain:
+            r = 1/sqrt((cos²θ)/a² + (sin²θ)/b²).
+        Returns: θ array, r values, and (x,y) coordinates for plotting.
+        """
+        theta_vals = np.linspace(0, 2*np.pi, num_points)
+        r_vals = 1/np.sqrt((np.cos(theta_vals)**2)/a**2 + (np.sin(theta_vals)**2)/b**2)
+        x = r_vals * np.cos(theta_vals)
+        y = r_vals * np.sin(theta_vals)
+        return theta_vals, r_vals, x, y
+
+    @staticmethod
+    def plot_auxiliary_circle(a, ax=None):
+        """
+        Plot the auxiliary circle for an ellipse with semi‐major axis a.
+        (The auxiliary circle is: x² + y² = a².)
+        Returns (x_vals, y_vals) for the circle.
+        """
+        theta_vals = np.linspace(0, 2*np.pi, 300)
+        x = a * np.cos(theta_vals)
+        y = a * np.sin(theta_vals)
+        if ax is None:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+        ax.plot(x, y, 'm--', linewidth=2, label="Auxiliary Circle")
+        return x, y
+
+    @staticmethod
+    def plot_eccentric_angle_line(a, b, theta_value, ax=None):
+        """
+        For a point on the ellipse given by (a cosθ, b sinθ),
+        plot the line through the origin (the eccentric angle direction) for the corresponding
+        parameter θ on the auxiliary circle, i.e. (a cosθ, a sinθ).
+        Returns the point on the ellipse and the corresponding point on the auxiliary circle.
+        """
+        if ax is None:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+        P = (a * np.cos(theta_value), b * np.sin(theta_value))
+        aux_pt = (a * np.cos(theta_value), a * np.sin(theta_value))
+        ax.plot([0, aux_pt[0]], [0, aux_pt[1]], 'c--', linewidth=2, label="Eccentric Angle Direction")
+        ax.plot(P[0], P[1], 'ko', markersize=8, label="Point on Ellipse")
+        return P, aux_pt
+
+    @staticmethod
+    def compute_eccentricity_from_latus(b):
+        """
+        Example 10:
+        For an ellipse: x²/a² + y²/b² = 1 with Latus rectum L = 2b²/a.
+        The condition "latus rectum is half the minor axis" means:
+            L = (1/2)*(2b) = b.
+        Hence, 2b²/a = b  ==>  a = 2b.
+        Then eccentricity: e = sqrt(1 - (b²/a²)).
+        """
+        a = 2 * b
+        e = np.sqrt(1 - (b**2) / (a**2))
+        return a, e
+
+    @staticmethod
+    def plot_ellipse(a, b, title="Ellipse", color="blue", show=True):
+        """Utility function to plot an ellipse x²/a² + y²/b² = 1."""
+        import matplotlib.pyplot as plt
+        theta = np.linspace(0, 2*np.pi, 400)
+        x = a * np.cos(theta)
+        y = b * np.sin(theta)
+        plt.plot(x, y, color=color, label=title)
+        plt.axis('equal')
+        if show:
+            plt.show()
+
+    @staticmethod
+    def fit_ellipse_through_points(p1, p2):
+        """
+        Example 11:
+        Finds ellipse parameters (a, b) such that
+           x²/a² + y²/b² = 1
+        holds for two given points p1 = (x1, y1) and p2 = (x2, y2).
+        By noting that if we set X = 1/a² and Y = 1/b² then:
+            x1²*X + y1²*Y = 1   and   x2²*X + y2²*Y = 1.
+        Returns a and b.
+        """
+        import sympy as sp
+        x1, y1 = p1
+        x2, y2 = p2
+        X, Y = sp.symbols('X Y', positive=True)
+        eq1 = sp.Eq(x1**2 * X + y1**2 * Y, 1)
+        eq2 = sp.Eq(x2**2 * X + y2**2 * Y, 1)
+        sol = sp.solve([eq1, eq2], (X, Y), dict=True)[0]
+        a_sq = 1 / sol[X]
+        b_sq = 1 / sol[Y]
+        return sp.sqrt(a_sq), sp.sqrt(b_sq)
+    
+    @staticmethod
+    def ellipse_from_minor_and_focal(b, focal_distance):
+        """
+        Example 12:
+        For an ellipse with minor axis length 2b and foci at (±ae, 0) such that
+           focal separation = 2ae,
+        we have e = (focal_distance)/(2a) and the relation:
+           b² = a² (1 - e²).
+        In Example 12, with b = 2 and focal_distance = 2, we recover a² = 5.
+        Returns a, b, and e.
+        """
+        # Use: b^2 = a^2 - (focal_distance^2)/4  ==>  a^2 = b^2 + (focal_distance^2)/4.
+        a = np.sqrt(b**2 + (focal_distance**2) / 4)
+        e = focal_distance / (2 * a)
+        return a, b, e
+
+    @staticmethod
+    def ellipse_from_latus_and_ecc(L, e):
+        """
+        Example 13:
+        For an ellipse, the latus rectum L = 2b²/a and b² = a²(1-e²).
+        Thus, L = 2a(1-e²). Then a = L/(2(1-e²)) and b = a*sqrt(1-e²).
+        Returns a, b, and e.
+        """
+        a = L / (2 * (1 - e**2))
+        b = a * np.sqrt(1 - e**2)
+        return a, b, e
+
+    @staticmethod
+    def ellipse_from_focal_perp(a):
+        """
+        Example 14:
+        If the line segments from the focus S=(ae,0) to the minor-axis endpoint (0,b)
+        are perpendicular then b² = a²e². Also, b² = a²(1-e²). Equate to get:
+            e² = 1 - e²   ->   e = 1/√2.
+        Then b = a*sqrt(1 - e²).
+        Here a is provided (from major-axis 2a).
+        Returns a, b, and e.
+        """
+        e = 1 / np.sqrt(2)
+        b = a * np.sqrt(1 - e**2)
+        return a, b, e
+
+    @staticmethod
+    def rational_parametrization(a, b, t):
+        """
+        Example 15:
+        Returns the point (x,y) by the rational parametrization:
+            x = a(1-t²)/(1+t²),   y = (2b*t)/(1+t²).
+        """
+        x = a * (1 - t**2) / (1 + t**2)
+        y = 2 * b * t / (1 + t**2)
+        return x, y
+
+    @staticmethod
+    def verify_rational_parametrization(a, b):
+        """
+        Example 15:
+        Symbolically verify that x²/a² + y²/b² = 1 when
+            x = a(1-t²)/(1+t²),   y = 2b*t/(1+t²).
+        Returns the symbolic expression (should simplify to 1).
+        """
+        import sympy as sp
+        t = sp.symbols('t', real=True)
+        x_expr = a * (1 - t**2) / (1 + t**2)
+        y_expr = 2 * b * t / (1 + t**2)
+        expr = sp.simplify(x_expr**2 / a**2 + y_expr**2 / b**2)
+        return expr
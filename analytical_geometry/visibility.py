@@ -0,0 +1,479 @@
+import heapq
+
+import numpy as np
+
+from analytical_geometry.ellipses import EllipseBatch
+
+# =============================================================================
+# Reduced visibility graph over elliptical obstacles
+# =============================================================================
+# Shortest paths around convex obstacles consist of straight segments tangent
+# to the obstacles and arcs along their boundaries.  The graph nodes are the
+# tangency points of every ellipse-ellipse common tangent (bitangent); edges
+# are the unobstructed bitangent segments plus the boundary arcs between
+# consecutive nodes on each ellipse.  Start and goal are joined at query time
+# through their point-ellipse tangents and the graph is searched with A*.
+#
+# Tangents are found from support functions.  For the unit normal
+# n = (cos α, sin α), the line n·p = h(α) with
+#     h(α) = n·c + s(α),   s(α) = sqrt(a² cos²(α - phi) + b² sin²(α - phi))
+# touches the ellipse and has it on the side n·p <= h(α).  A bitangent with both
+# ellipses on the same side satisfies h_i(α) = h_j(α); a separating one
+# satisfies h_i(α) + h_j(α + π) = 0.
+
+_N_SAMPLES = 96       # angular samples used to bracket tangent roots
+_HIT_TOL = 1e-7       # strict-interior tolerance on the implicit value
+_ARC_SAMPLES = 8      # points tested along each boundary arc
+_GAUSS_X, _GAUSS_W = np.polynomial.legendre.leggauss(16)
+
+KIND_SEGMENT = 0
+KIND_ARC = 1
+
+
+def _support(params, alpha):
+    """s(α) of ellipses params (.., 5) at normal angles alpha."""
+    a, b, phi = params[..., 2], params[..., 3], params[..., 4]
+    return np.hypot(a * np.cos(alpha - phi), b * np.sin(alpha - phi))
+
+
+def _tangency(params, alpha):
+    """Point where the supporting line with normal angle alpha touches."""
+    cx, cy, a, b, phi = np.moveaxis(params, -1, 0)
+    nu, nv = np.cos(alpha - phi), np.sin(alpha - phi)
+    s = np.hypot(a * nu, b * nv)
+    xl, yl = a**2 * nu / s, b**2 * nv / s
+    c, si = np.cos(phi), np.sin(phi)
+    return np.stack([cx + xl * c - yl * si, cy + xl * si + yl * c], axis=-1)
+
+
+def _eccentric_angle(params, points):
+    """Eccentric angle in [0, 2π) of boundary points in each ellipse's frame."""
+    cx, cy, a, b, phi = np.moveaxis(params, -1, 0)
+    dx, dy = points[..., 0] - cx, points[..., 1] - cy
+    c, s = np.cos(phi), np.sin(phi)
+    return np.mod(np.arctan2((-dx * s + dy * c) / b, (dx * c + dy * s) / a), 2*np.pi)
+
+
+def _roots(g, P, n_roots):
+    """
+    Zeros of a batch of P periodic functions of α.
+
+    Roots are bracketed on a uniform grid of _N_SAMPLES angles and refined by
+    bisection on the bracketing intervals only.
+
+    :param g: Callable g(rows, alpha) evaluating function `rows` at alpha
+              (arrays of broadcastable shape).
+    :param P: Number of functions in the batch.
+    :param n_roots: Maximum number of roots kept per function.
+    :return: Tuple (alpha, valid) of shape (P, n_roots).
+    """
+    grid = np.linspace(0, 2*np.pi, _N_SAMPLES + 1)
+    values = g(np.arange(P)[:, None], grid[None, :])
+    change = np.signbit(values[:, :-1]) != np.signbit(values[:, 1:])
+    # Keep the first n_roots sign changes of every row.
+    order = np.argsort(~change, axis=1, kind="stable")[:, :n_roots]
+    valid = np.take_along_axis(change, order, axis=1)
+    rows = np.broadcast_to(np.arange(P)[:, None], valid.shape)[valid]
+    lo = grid[order[valid]]
+    hi = grid[order[valid] + 1]
+    g_lo = np.take_along_axis(values[:, :-1], order, axis=1)[valid]
+    for _ in range(40):
+        mid = 0.5 * (lo + hi)
+        g_mid = g(rows, mid)
+        same = np.signbit(g_mid) == np.signbit(g_lo)
+        lo = np.where(same, mid, lo)
+        g_lo = np.where(same, g_mid, g_lo)
+        hi = np.where(same, hi, mid)
+    alpha = np.zeros(valid.shape)
+    alpha[valid] = 0.5 * (lo + hi)
+    return alpha, valid
+
+
+def bitangents(params_i, params_j):
+    """
+    Common tangent segments of ellipse pairs.
+
+    :param params_i: (P, 5) ellipse parameters (cx, cy, a, b, phi).
+    :param params_j: (P, 5) ellipse parameters of the partners.
+    :return: Tuple (pair, p_i, p_j): pair index of every bitangent (at most
+             four per pair) and its tangency points on ellipse i and j.
+    """
+    P = len(params_i)
+    dc = params_i[:, :2] - params_j[:, :2]
+
+    def outer(rows, alpha):
+        return (np.cos(alpha) * dc[rows, 0] + np.sin(alpha) * dc[rows, 1]
+                + _support(params_i[rows], alpha) - _support(params_j[rows], alpha))
+
+    def inner(rows, alpha):
+        # s(α + π) == s(α), so the partner's support needs no shift.
+        return (np.cos(alpha) * dc[rows, 0] + np.sin(alpha) * dc[rows, 1]
+                + _support(params_i[rows], alpha) + _support(params_j[rows], alpha))
+
+    alpha_o, ok_o = _roots(outer, P, 2)
+    alpha_i, ok_i = _roots(inner, P, 2)
+    pi_, pj_ = params_i[:, None, :], params_j[:, None, :]
+    ok = np.concatenate([ok_o, ok_i], axis=1)
+    p_i = np.concatenate([_tangency(pi_, alpha_o), _tangency(pi_, alpha_i)], axis=1)[ok]
+    p_j = np.concatenate([_tangency(pj_, alpha_o), _tangency(pj_, alpha_i + np.pi)], axis=1)[ok]
+    pair = np.broadcast_to(np.arange(P)[:, None], ok.shape)[ok]
+    return pair, p_i, p_j
+
+
+def point_tangents(point, params):
+    """
+    Tangency points of the (up to two) tangents from a point to each ellipse.
+
+    :param point: (2,) point.
+    :param params: (n, 5) ellipse parameters.
+    :return: Tuple (ellipse, p): ellipse index and tangency point per tangent.
+    """
+    P = len(params)
+    dc = params[:, :2] - np.asarray(point, dtype=float)
+
+    def g(rows, alpha):
+        return (np.cos(alpha) * dc[rows, 0] + np.sin(alpha) * dc[rows, 1]
+                + _support(params[rows], alpha))
+
+    alpha, ok = _roots(g, P, 2)
+    p = _tangency(params[:, None, :], alpha)
+    ellipse = np.broadcast_to(np.arange(P)[:, None], ok.shape)[ok]
+    return ellipse, p[ok]
+
+
+def segment_hits(p0, p1, params, chunk=1 << 20):
+    """
+    Number of ellipses whose strict interior each segment p0 -> p1 crosses.
+
+    Endpoints may lie on an ellipse boundary (tangency points) without
+    counting as a hit.
+
+    :param p0: (S, 2) segment starts.
+    :param p1: (S, 2) segment ends.
+    :param params: (n, 5) ellipse parameters.
+    :param chunk: Approximate number of segment-ellipse pairs per block.
+    :return: Integer array (S,).
+    """
+    p0 = np.asarray(p0, dtype=float).reshape(-1, 2)
+    p1 = np.asarray(p1, dtype=float).reshape(-1, 2)
+    counts = np.zeros(len(p0), dtype=int)
+    if len(p0) == 0 or len(params) == 0:
+        return counts
+    box = np.column_stack(EllipseBatch.from_array(params).aabb())
+    lo, hi = np.minimum(p0, p1), np.maximum(p0, p1)
+    step = max(1, chunk // len(params))
+    for start in range(0, len(p0), step):
+        sl = slice(start, start + step)
+        overlap = ((lo[sl, None, 0] <= box[None, :, 2]) & (hi[sl, None, 0] >= box[None, :, 0]) &
+                   (lo[sl, None, 1] <= box[None, :, 3]) & (hi[sl, None, 1] >= box[None, :, 1]))
+        s, k = np.nonzero(overlap)
+        if s.size == 0:
+            continue
+        cx, cy, a, b, phi = params[k].T
+        c, si = np.cos(phi), np.sin(phi)
+        dx0, dy0 = p0[sl][s, 0] - cx, p0[sl][s, 1] - cy
+        dx, dy = p1[sl][s, 0] - p0[sl][s, 0], p1[sl][s, 1] - p0[sl][s, 1]
+        X0 = (dx0 * c + dy0 * si) / a
+        Y0 = (-dx0 * si + dy0 * c) / b
+        DX = (dx * c + dy * si) / a
+        DY = (-dx * si + dy * c) / b
+        dd = DX**2 + DY**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip(-(X0 * DX + Y0 * DY) / dd, 0.0, 1.0)
+        t = np.where(dd > 0, t, 0.0)
+        f_min = (X0 + t * DX)**2 + (Y0 + t * DY)**2
+        counts[start:start + step] += np.bincount(
+            s, weights=f_min < 1 - _HIT_TOL, minlength=min(step, len(p0) - start)).astype(int)
+    return counts
+
+
+def points_blocked(points, params):
+    """True where a point lies strictly inside any of the ellipses."""
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    return segment_hits(points, points, params) > 0
+
+
+def _arc_length(a, b, t0, t1):
+    """Length of the ellipse arc between eccentric angles t0 < t1 (arrays)."""
+    half = 0.5 * (t1 - t0)
+    t = 0.5 * (t1 + t0)[..., None] + half[..., None] * _GAUSS_X
+    speed = np.sqrt((a[..., None] * np.sin(t))**2 + (b[..., None] * np.cos(t))**2)
+    return half * (speed @ _GAUSS_W)
+
+
+def _arc_points(params, t0, t1, num):
+    """(len(t0), num, 2) points along arcs from t0 to t1."""
+    cx, cy, a, b, phi = (v[:, None] for v in params.T)
+    t = t0[:, None] + (t1 - t0)[:, None] * np.linspace(0, 1, num)
+    xl, yl = a * np.cos(t), b * np.sin(t)
+    c, s = np.cos(phi), np.sin(phi)
+    return np.stack([cx + xl * c - yl * s, cy + xl * s + yl * c], axis=-1)
+
+
+class VisibilityGraph:
+    """
+    Cached reduced visibility graph for a scene of elliptical obstacles.
+
+    Bitangent segments and their obstruction counts are stored per segment;
+    update_obstacles only recomputes the tangents of the moved obstacles and
+    re-tests the remaining segments against those obstacles.  The searchable
+    graph (nodes, arcs, CSR adjacency) is rebuilt lazily from the segment
+    table on the next query.
+
+    :param obstacles: EllipseBatch or (n, 5) array of (cx, cy, a, b, phi).
+    """
+
+    def __init__(self, obstacles):
+        if isinstance(obstacles, EllipseBatch):
+            obstacles = obstacles.as_array()
+        self.params = np.array(obstacles, dtype=float).reshape(-1, 5)
+        n = len(self.params)
+        i, j = np.triu_indices(n, k=1)
+        self._seg_i = np.empty(0, dtype=int)
+        self._seg_j = np.empty(0, dtype=int)
+        self._seg_p0 = np.empty((0, 2))
+        self._seg_p1 = np.empty((0, 2))
+        self._seg_hits = np.empty(0, dtype=int)
+        self._add_pairs(i, j)
+        self._graph = None
+
+    def __len__(self):
+        return len(self.params)
+
+    def _add_pairs(self, i, j):
+        """Compute bitangents of pairs (i, j), test them and append them."""
+        if len(i) == 0:
+            return
+        pair, p_i, p_j = bitangents(self.params[i], self.params[j])
+        hits = segment_hits(p_i, p_j, self.params)
+        self._seg_i = np.concatenate([self._seg_i, i[pair]])
+        self._seg_j = np.concatenate([self._seg_j, j[pair]])
+        self._seg_p0 = np.concatenate([self._seg_p0, p_i])
+        self._seg_p1 = np.concatenate([self._seg_p1, p_j])
+        self._seg_hits = np.concatenate([self._seg_hits, hits])
+
+    def update_obstacles(self, indices, params):
+        """
+        Move, resize or rotate obstacles and update the graph incrementally.
+
+        :param indices: Indices of the obstacles that changed.
+        :param params: (len(indices), 5) new (cx, cy, a, b, phi) rows.
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=int))
+        params = np.asarray(params, dtype=float).reshape(-1, 5)
+        moved = np.zeros(len(self.params), dtype=bool)
+        moved[indices] = True
+
+        # Segments between unchanged obstacles: swap the moved obstacles'
+        # contribution to their obstruction counts.
+        keep = ~(moved[self._seg_i] | moved[self._seg_j])
+        for name in ("_seg_i", "_seg_j", "_seg_p0", "_seg_p1", "_seg_hits"):
+            setattr(self, name, getattr(self, name)[keep])
+        self._seg_hits -= segment_hits(self._seg_p0, self._seg_p1, self.params[indices])
+        self.params[indices] = params
+        self._seg_hits += segment_hits(self._seg_p0, self._seg_p1, self.params[indices])
+
+        # Pairs involving a moved obstacle are recomputed from scratch.
+        i, j = np.triu_indices(len(self.params), k=1)
+        touched = moved[i] | moved[j]
+        self._add_pairs(i[touched], j[touched])
+        self._graph = None
+
+    # -------------------------------------------------------------------------
+    # Graph assembly
+    # -------------------------------------------------------------------------
+    def _assemble(self):
+        free = self._seg_hits == 0
+        seg_i, seg_j = self._seg_i[free], self._seg_j[free]
+        p0, p1 = self._seg_p0[free], self._seg_p1[free]
+        S = len(seg_i)
+        # Node 2k is the tangency point on seg_i[k], node 2k + 1 the one on seg_j[k].
+        node_pos = np.empty((2 * S, 2))
+        node_pos[0::2], node_pos[1::2] = p0, p1
+        node_ell = np.empty(2 * S, dtype=int)
+        node_ell[0::2], node_ell[1::2] = seg_i, seg_j
+        node_t = _eccentric_angle(self.params[node_ell], node_pos)
+
+        # Order nodes along each ellipse.
+        order = np.lexsort((node_t, node_ell))
+        ell_sorted = node_ell[order]
+        ell_start = np.searchsorted(ell_sorted, np.arange(len(self.params) + 1))
+
+        edges_u = [np.arange(0, 2 * S, 2)]
+        edges_v = [np.arange(1, 2 * S, 2)]
+        edges_w = [np.hypot(*(p1 - p0).T)]
+        edges_kind = [np.full(S, KIND_SEGMENT)]
+        arc_u, arc_v = self._arcs_between(order, ell_start)
+        if len(arc_u):
+            w, ok = self._arc_weights(node_ell[arc_u], node_t[arc_u], node_t[arc_v])
+            edges_u.append(arc_u[ok])
+            edges_v.append(arc_v[ok])
+            edges_w.append(w[ok])
+            edges_kind.append(np.full(ok.sum(), KIND_ARC))
+
+        self._graph = dict(
+            node_pos=node_pos, node_ell=node_ell, node_t=node_t,
+            order=order, ell_start=ell_start,
+            edge_u=np.concatenate(edges_u), edge_v=np.concatenate(edges_v),
+            edge_w=np.concatenate(edges_w), edge_kind=np.concatenate(edges_kind))
+        self._graph.update(self._csr(self._graph, 2 * S))
+
+    @staticmethod
+    def _arcs_between(order, ell_start):
+        """Arcs (u, v) between consecutive sorted nodes, wrapping around, CCW u -> v."""
+        counts = np.diff(ell_start)
+        has_arc = np.repeat(counts >= 2, counts)
+        pos = np.arange(len(order))
+        nxt = pos + 1
+        last = np.zeros(len(order), dtype=bool)
+        last[ell_start[1:][counts > 0] - 1] = True
+        nxt[last] = np.repeat(ell_start[:-1], counts)[last]
+        return order[pos[has_arc]], order[nxt[has_arc]]
+
+    def _arc_weights(self, ell, t0, t1):
+        """Lengths of CCW arcs t0 -> t1 and whether they are unobstructed."""
+        t1 = np.where(t1 < t0, t1 + 2*np.pi, t1)
+        params = self.params[ell]
+        length = _arc_length(params[:, 2], params[:, 3], t0, t1)
+        pts = _arc_points(params, t0, t1, _ARC_SAMPLES).reshape(-1, 2)
+        ok = ~points_blocked(pts, self.params).reshape(-1, _ARC_SAMPLES).any(axis=1)
+        return length, ok
+
+    @staticmethod
+    def _csr(g, n_nodes):
+        """Undirected CSR adjacency (indptr, nbr, edge id) from the edge lists."""
+        u = np.concatenate([g["edge_u"], g["edge_v"]])
+        v = np.concatenate([g["edge_v"], g["edge_u"]])
+        eid = np.tile(np.arange(len(g["edge_u"])), 2)
+        order = np.argsort(u, kind="stable")
+        indptr = np.searchsorted(u[order], np.arange(n_nodes + 1))
+        return dict(indptr=indptr, nbr=v[order], nbr_edge=eid[order])
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def shortest_path(self, start, goal, arc_samples=16):
+        """
+        Shortest collision-free path from start to goal.
+
+        :param start: (2,) start point (must be outside every obstacle).
+        :param goal: (2,) goal point (must be outside every obstacle).
+        :param arc_samples: Points used to draw each boundary arc.
+        :return: Tuple (length, path) with path an (M, 2) polyline, or
+                 (inf, None) when start and goal are not connected.
+        """
+        start = np.asarray(start, dtype=float)
+        goal = np.asarray(goal, dtype=float)
+        if points_blocked(np.array([start, goal]), self.params).any():
+            raise ValueError("start and goal must lie outside every obstacle")
+        if self._graph is None:
+            self._assemble()
+        g = self._graph
+        N = len(g["node_pos"])
+        S_ID, G_ID = N, N + 1
+
+        # Overlay edges for this query only, stored per node as
+        # (v, w, kind, ellipse, t_from, t_to, ccw); arcs run CCW from u to v.
+        overlay = {}
+
+        def add(u, v, w, kind, ell=-1, t0=0.0, t1=0.0):
+            overlay.setdefault(u, []).append((v, w, kind, ell, t0, t1, True))
+            overlay.setdefault(v, []).append((u, w, kind, ell, t1, t0, False))
+
+        q_pos, q_ell, q_from = [], [], []
+        for qid, q in ((S_ID, start), (G_ID, goal)):
+            ell, p = point_tangents(q, self.params)
+            free = segment_hits(np.broadcast_to(q, p.shape), p, self.params) == 0
+            q_pos.append(p[free])
+            q_ell.append(ell[free])
+            q_from.append(np.full(free.sum(), qid))
+        q_pos = np.concatenate(q_pos)
+        q_ell = np.concatenate(q_ell)
+        q_from = np.concatenate(q_from)
+        q_t = _eccentric_angle(self.params[q_ell], q_pos)
+        q_ids = N + 2 + np.arange(len(q_pos))
+        all_pos = np.concatenate([g["node_pos"], [start, goal], q_pos])
+        for k, qid in enumerate(q_ids):
+            anchor = all_pos[q_from[k]]
+            add(q_from[k], qid, float(np.hypot(*(q_pos[k] - anchor))), KIND_SEGMENT)
+        if segment_hits(start[None], goal[None], self.params)[0] == 0:
+            add(S_ID, G_ID, float(np.hypot(*(goal - start))), KIND_SEGMENT)
+
+        # Insert the tangency points into the node order of their ellipses and
+        # join each to its neighbours with arcs.
+        for e in np.unique(q_ell):
+            base = g["order"][g["ell_start"][e]:g["ell_start"][e + 1]]
+            ids = np.concatenate([base, q_ids[q_ell == e]])
+            ts = np.concatenate([g["node_t"][base], q_t[q_ell == e]])
+            srt = np.argsort(ts, kind="stable")
+            ids, ts = ids[srt], ts[srt]
+            if len(ids) < 2:
+                continue
+            u, v = ids, np.roll(ids, -1)
+            t0, t1 = ts, np.roll(ts, -1)
+            touch = (u >= N) | (v >= N)
+            w, ok = self._arc_weights(np.full(touch.sum(), e), t0[touch], t1[touch])
+            for uu, vv, ww, a0, a1 in zip(u[touch][ok], v[touch][ok], w[ok],
+                                          t0[touch][ok], t1[touch][ok]):
+                add(int(uu), int(vv), float(ww), KIND_ARC, int(e), float(a0), float(a1))
+
+        route = self._astar(g, overlay, all_pos, S_ID, G_ID)
+        if route is None:
+            return np.inf, None
+        length = 0.0
+        pieces = [start[None]]
+        for v, w, kind, ell, t0, t1, ccw in route:
+            length += w
+            if kind == KIND_SEGMENT:
+                pieces.append(all_pos[v][None])
+                continue
+            if ccw and t1 < t0:
+                t1 += 2*np.pi
+            elif not ccw and t1 > t0:
+                t1 -= 2*np.pi
+            pts = _arc_points(self.params[ell][None], np.array([t0]),
+                              np.array([t1]), arc_samples)[0]
+            pieces.append(pts[1:])
+        return length, np.concatenate(pieces)
+
+    @staticmethod
+    def _astar(g, overlay, all_pos, source, target):
+        """A* with the Euclidean heuristic over base CSR edges plus overlay edges."""
+        indptr, nbr, nbr_edge = g["indptr"], g["nbr"], g["nbr_edge"]
+        N = len(indptr) - 1
+        goal_pos = all_pos[target]
+        h = lambda n: float(np.hypot(*(all_pos[n] - goal_pos)))
+        best = {source: 0.0}
+        came = {}
+        heap = [(h(source), 0.0, source)]
+        while heap:
+            _, dist, u = heapq.heappop(heap)
+            if u == target:
+                route = []
+                while u != source:
+                    u, step = came[u]
+                    route.append(step)
+                return route[::-1]
+            if dist > best.get(u, np.inf):
+                continue
+            steps = []
+            if u < N:
+                for k in range(indptr[u], indptr[u + 1]):
+                    e = nbr_edge[k]
+                    v = int(nbr[k])
+                    kind = int(g["edge_kind"][e])
+                    if kind == KIND_ARC:
+                        steps.append((v, float(g["edge_w"][e]), kind, int(g["node_ell"][u]),
+                                      float(g["node_t"][u]), float(g["node_t"][v]),
+                                      bool(g["edge_u"][e] == u)))
+                    else:
+                        steps.append((v, float(g["edge_w"][e]), kind, -1, 0.0, 0.0, True))
+            steps.extend(overlay.get(u, ()))
+            for step in steps:
+                v, w = step[0], step[1]
+                nd = dist + w
+                if nd < best.get(v, np.inf):
+                    best[v] = nd
+                    came[v] = (u, step)
+                    heapq.heappush(heap, (nd + h(v), nd, v))
+        return None
@@ -1,8 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D  # for 3D plotting
 
+from analytical_geometry.animation import FrameData, frame_animation, precompute, segment
+
 # ========================================================
 # Global Ellipse Parameters and Static Geometry Definitions
 # ========================================================
@@ -57,46 +58,54 @@ point_Q_aux, = ax2d.plot([], [], 'ko', markersize=6, label=r"Aux. Pt $\phi'$")
 point_P, = ax2d.plot([], [], 'bo', markersize=6, label=r"Ellipse Pt $\phi$")
 point_Q, = ax2d.plot([], [], 'bo', markersize=6, label=r"Ellipse Pt $\phi'$")
 
-def update_2d(frame):
+def eccentric_geometry(frame):
     """
-    Animate the 2D geometry by updating positions of the dynamic objects.
-    The eccentric angles vary with time.
+    Geometry of all 2D frames at once.  The eccentric angles vary with time
+    around 30° and 70° with small oscillatory variations.
     """
-    # Base angles (in radians) with small oscillatory variations:
-    base_phi = np.radians(30)
-    base_phi_dash = np.radians(70)
-    phi = base_phi + np.radians(10) * np.sin(0.05 * frame)
-    phi_dash = base_phi_dash + np.radians(10) * np.cos(0.05 * frame)
-    
+    phi = np.radians(30) + np.radians(10) * np.sin(0.05 * frame)
+    phi_dash = np.radians(70) + np.radians(10) * np.cos(0.05 * frame)
+
     # Points on the auxiliary circle (where the angles are formed)
-    P_aux = np.array([a * np.cos(phi), a * np.sin(phi)])
-    Q_aux = np.array([a * np.cos(phi_dash), a * np.sin(phi_dash)])
-    
+    P_aux = np.column_stack([a * np.cos(phi), a * np.sin(phi)])
+    Q_aux = np.column_stack([a * np.cos(phi_dash), a * np.sin(phi_dash)])
+
     # Corresponding points on the ellipse
-    P = np.array([a * np.cos(phi), b * np.sin(phi)])
-    Q = np.array([a * np.cos(phi_dash), b * np.sin(phi_dash)])
-    
-    # Update chord joining the ellipse points
-    chord_line.set_data([P[0], Q[0]], [P[1], Q[1]])
-    
-    # Update eccentric rays (from origin to auxiliary circle points)
-    ray1_line.set_data([0, P_aux[0]], [0, P_aux[1]])
-    ray2_line.set_data([0, Q_aux[0]], [0, Q_aux[1]])
-    
-    # Update vertical drops (perpendiculars) from auxiliary circle points to the base (y=0)
-    perp1_line.set_data([P_aux[0], P_aux[0]], [P_aux[1], 0])
-    perp2_line.set_data([Q_aux[0], Q_aux[0]], [Q_aux[1], 0])
-    
+    P = np.column_stack([a * np.cos(phi), b * np.sin(phi)])
+    Q = np.column_stack([a * np.cos(phi_dash), b * np.sin(phi_dash)])
+
+    # Feet of the vertical drops from the auxiliary circle points to the base (y=0)
+    P_foot = P_aux * [1, 0]
+    Q_foot = Q_aux * [1, 0]
+    return {"P": P, "Q": Q, "P_aux": P_aux, "Q_aux": Q_aux,
+            "chord": segment(P, Q),
+            "ray1": segment(np.zeros(2), P_aux), "ray2": segment(np.zeros(2), Q_aux),
+            "perp1": segment(P_aux, P_foot), "perp2": segment(Q_aux, Q_foot)}
+
+geometry_2d = precompute(eccentric_geometry, np.arange(200))
+
+def update_2d(frame):
+    """
+    Animate the 2D geometry by copying the precomputed positions of this
+    frame into the dynamic objects.
+    """
+    g = geometry_2d
+    for line, name in ((chord_line, "chord"), (ray1_line, "ray1"), (ray2_line, "ray2"),
+                       (perp1_line, "perp1"), (perp2_line, "perp2")):
+        seg = getattr(g, name)[frame]
+        line.set_data(seg[:, 0], seg[:, 1])
+
     # Update point markers (each as a sequence with one element)
-    point_P_aux.set_data([P_aux[0]], [P_aux[1]])
-    point_Q_aux.set_data([Q_aux[0]], [Q_aux[1]])
-    point_P.set_data([P[0]], [P[1]])
-    point_Q.set_data([Q[0]], [Q[1]])
-    
+    for marker, name in ((point_P_aux, "P_aux"), (point_Q_aux, "Q_aux"),
+                         (point_P, "P"), (point_Q, "Q")):
+        pt = getattr(g, name)[frame]
+        marker.set_data(pt[:1], pt[1:])
+
     return (chord_line, ray1_line, ray2_line, perp1_line, perp2_line,
             point_P_aux, point_Q_aux, point_P, point_Q)
 
-anim2d = FuncAnimation(fig2d, update_2d, frames=200, interval=50, blit=False)
+# Only the dynamic artists are redrawn; the static geometry is a cached background.
+anim2d = frame_animation(fig2d, geometry_2d, update_2d, interval=50, blit=True)
 
 
 # ========================================================
@@ -123,14 +132,18 @@ ax3d.set_zlim([-a/2, a/2])
 ax3d.set_box_aspect([1, 1, 0.5])
 ax3d.legend(loc="upper right", fontsize=8)
 
+# Camera path of the 3D animation; frame_animation applies it to ax3d and,
+# since the view changes, redraws the whole figure every frame.
+azimuths = np.arange(0, 360, 2)
+view_3d = FrameData(azimuths, elev=np.full(len(azimuths), 30), azim=azimuths)
+
 def update_3d(frame):
     """
-    Update function for the 3D animation; simply rotates the view.
+    Update function for the 3D animation; only the view rotates.
     """
-    ax3d.view_init(elev=30, azim=frame)
-    return ax3d
+    return ()
 
-anim3d = FuncAnimation(fig3d, update_3d, frames=np.arange(0, 360, 2), interval=50, blit=False)
+anim3d = frame_animation(fig3d, view_3d, update_3d, interval=50, blit=True)
 
 # ========================================================
 # Display the Animations
@@ -1,5 +1,7 @@
 from graphviz import Digraph
 
+from analytical_geometry.concept_maps import render_cached
+
 # Create a concept map for Section 0.5 "Director Circle"
 dot = Digraph(comment='Concept Map for 0.5 Director Circle')
 dot.attr(rankdir='TB', size='8,5')
@@ -21,4 +23,5 @@ dot.edge('E', 'F', label='implies')
 dot.edge('B', 'F', label='Combine with center')
 
 # Render the concept map into a PNG file and open it.
-dot.render('concept_map_director_circle', view=True, format='png')
\ No newline at end of file
+# (Skipped when the PNG is up to date.)
+render_cached(dot, 'concept_map_director_circle', format='png', view=True)
\ No newline at end of file
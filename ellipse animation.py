@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+
+from analytical_geometry.animation import chord_geometry, frame_animation, precompute
 
 # Ellipse Parameters
 a = 5  # Semi-major axis
@@ -43,29 +44,22 @@ def init():
     point_aux2.set_data([], [])
     return point_ellipse1, point_ellipse2, chord_line, point_aux1, point_aux2
 
-def update(frame):
-    # Define the eccentric angles that vary with the frame number
-    phi1 = frame * 0.05
-    phi2 = (phi1 + phi_offset) % (2 * np.pi)
-
-    # Compute coordinates on the ellipse for the given eccentric angles
-    x1, y1 = a * np.cos(phi1), b * np.sin(phi1)
-    x2, y2 = a * np.cos(phi2), b * np.sin(phi2)
-
-    # Compute points on the auxiliary circle (with radius = a)
-    aux_x1, aux_y1 = a * np.cos(phi1), a * np.sin(phi1)
-    aux_x2, aux_y2 = a * np.cos(phi2), a * np.sin(phi2)
-
-    # Set the updated point coordinates as sequences (lists)
-    point_ellipse1.set_data([x1], [y1])
-    point_ellipse2.set_data([x2], [y2])
-    chord_line.set_data([x1, x2], [y1, y2])
-    point_aux1.set_data([aux_x1], [aux_y1])
-    point_aux2.set_data([aux_x2], [aux_y2])
+# Geometry of all frames (points on the ellipse and on the auxiliary circle),
+# evaluated once before rendering
+geometry = precompute(lambda phi1: chord_geometry(a, b, phi1, phi_offset),
+                      np.arange(200) * 0.05)
 
+def update(frame):
+    # Only look up the precomputed geometry of this frame
+    g = geometry
+    point_ellipse1.set_data(g.P1[frame, :1], g.P1[frame, 1:])
+    point_ellipse2.set_data(g.P2[frame, :1], g.P2[frame, 1:])
+    chord_line.set_data(g.chord[frame, :, 0], g.chord[frame, :, 1])
+    point_aux1.set_data(g.A1[frame, :1], g.A1[frame, 1:])
+    point_aux2.set_data(g.A2[frame, :1], g.A2[frame, 1:])
     return point_ellipse1, point_ellipse2, chord_line, point_aux1, point_aux2
 
 # Create and run the animation
-anim = FuncAnimation(fig, update, frames=200, init_func=init, blit=True, interval=50)
+anim = frame_animation(fig, geometry, update, init_func=init, blit=True, interval=50)
 plt.legend()
 plt.show()
\ No newline at end of file
@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 import folium
 import math
 
+from analytical_geometry.geodesy import great_circle_path, haversine, slerp
+
 # --- Weapon data (from provided script) ---
 weapons = [
     {"name": "MIM-104 Patriot", "country": "USA",   "weight": 5000,  "cost":  4000000,
@@ -78,13 +80,8 @@ for xi, nm in zip(res_cost.x, names):
 # Start (Brest) and target (Washington, DC) coordinates
 start = (53.3108, 28.8103)  # 53°18'38.9"N 28°48'37.1"E (approx.)
 target = (38.9072, -77.0369)  # Washington, DC&#8203;:contentReference[oaicite:6]{index=6}
-def haversine(lat1, lon1, lat2, lon2):
-    R = 6371  # Earth radius (km)
-    phi1, phi2 = np.radians(lat1), np.radians(lat2)
-    dphi = np.radians(lat2 - lat1)
-    dl = np.radians(lon2 - lon1)
-    a = np.sin(dphi/2)**2 + np.cos(phi1)*np.cos(phi2)*np.sin(dl/2)**2
-    return 2*R*np.arcsin(np.sqrt(a))
+# Distances (haversine, km) and moves (slerp) follow the great circle; both
+# live in analytical_geometry.geodesy and also work on whole arrays.
 
 # Define a sequence of strikes (from high to lower destruction) until reaching DC
 sequence = ["Aegis BMD", "S-400", "MIM-104 Patriot", "THAAD", 
@@ -98,9 +95,8 @@ for weapon_name in sequence:
         coords.append(target)
         break
     frac = dmg / dist
-    new_lat = current[0] + frac * (target[0] - current[0])
-    new_lon = current[1] + frac * (target[1] - current[1])
-    current = (new_lat, new_lon)
+    new_lat, new_lon = slerp(current[0], current[1], target[0], target[1], frac)
+    current = (float(new_lat), float(new_lon))
     coords.append(current)
 
 print("\nSimulated strikes and new coordinates:")
@@ -110,8 +106,11 @@ for i, (lat, lon) in enumerate(coords):
 # --- Plot movement path using Matplotlib ---
 lats = [c[0] for c in coords]
 lons = [c[1] for c in coords]
+# Great-circle legs between the steps, one point every 50 km.
+path_lat, path_lon = great_circle_path(lats, lons, step=50)
 plt.figure(figsize=(6,6))
-plt.plot(lons, lats, 'ro-')
+plt.plot(path_lon, path_lat, 'r-')
+plt.plot(lons, lats, 'ro')
 for i, (lat, lon) in enumerate(coords):
     plt.text(lon, lat, str(i), fontsize=8, ha='right')
 plt.xlabel("Longitude"); plt.ylabel("Latitude")
@@ -129,6 +128,6 @@ folium.Marker(location=target, popup="Washington, DC", icon=folium.Icon(color='b
 for i, (lat, lon) in enumerate(coords[1:-1], start=1):
     folium.Marker(location=(lat, lon), popup=f"Step {i}", icon=folium.Icon(color='red')).add_to(m3)
 # Draw polyline path
-folium.PolyLine(locations=coords, color="red", weight=2.5, opacity=0.8).add_to(m3)
+folium.PolyLine(locations=np.column_stack([path_lat, path_lon]).tolist(), color="red", weight=2.5, opacity=0.8).add_to(m3)
 m3.save("movement_path_map.html")
 print("\nMovement path map saved as 'movement_path_map.html'.")
@@ -1,41 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-# =============================================================================
-# Helper function: Rotate points (works on an (N,2) array).
-# =============================================================================
-def rotate_points(points, theta, pivot=None):
-    """
-    Rotate an array of 2D points by an angle theta (in radians).
-    If pivot is provided, rotate about that point; otherwise, rotate about the origin.
-
-    :param points: NumPy array of shape (N, 2).
-    :param theta: Rotation angle in radians.
-    :param pivot: Optional point (array-like of shape (2,)).
-    :return: Rotated points as a NumPy array.
-    """
-    R = np.array([[np.cos(theta), -np.sin(theta)],
-                  [np.sin(theta),  np.cos(theta)]])
-    if pivot is not None:
-        return (points - pivot) @ R.T + pivot
-    else:
-        return points @ R.T
-
-# =============================================================================
-# Helper function: Rotate coordinate grids (for mesh grids).
-# =============================================================================
-def rotate_axes(X, Y, theta):
-    """
-    Rotate coordinate grid arrays X and Y by angle theta.
-
-    :param X: X coordinates (NumPy array).
-    :param Y: Y coordinates (NumPy array).
-    :param theta: Rotation angle in radians.
-    :return: Tuple (x_rot, y_rot)
-    """
-    x_rot = X * np.cos(theta) - Y * np.sin(theta)
-    y_rot = X * np.sin(theta) + Y * np.cos(theta)
-    return x_rot, y_rot
+from analytical_geometry.conic import eval_conic_grid, rotate_conic
+from analytical_geometry.grid import get_grid
+from analytical_geometry.kernels import rotate_points
 
 # =============================================================================
 # Example 1: Rotating Points about a Pivot and Displaying Rotated Axes
@@ -100,22 +68,24 @@ plt.show()
 # Rotation for the equation.
 theta_eq = np.pi / 4  # 45° rotation
 
-# Create a grid.
-X, Y = np.meshgrid(np.linspace(-100, 100, 400),
-                   np.linspace(-100, 100, 400))
+# Create a grid (1-D axes only; contour accepts them directly).
+grid = get_grid((-100, 100, -100, 100), 400)
+x_axis, y_axis = grid.x, grid.y
 # Define a quadratic equation; here, we use:
 #   2x² + 4xy − 5y² + 20x − 22y − 14 = 0.
-Z = 2*X**2 + 4*X*Y - 5*Y**2 + 20*X - 22*Y - 14
+conic = (2, 4, -5, 20, -22, -14)
+Z = eval_conic_grid(conic, x_axis, y_axis)
 
-# Rotate the grid (rotation about the origin).
-x_rot_grid, y_rot_grid = rotate_axes(X, Y, theta_eq)
-Z_rot = 2*x_rot_grid**2 + 4*x_rot_grid*y_rot_grid - 5*y_rot_grid**2 + 20*x_rot_grid - 22*y_rot_grid - 14
+# Rotate the grid (rotation about the origin).  Evaluating the conic on the
+# rotated grid is the same as evaluating the rotated conic on the original
+# grid, so the rotated coordinates never need to be materialized.
+Z_rot = eval_conic_grid(rotate_conic(conic, theta_eq), x_axis, y_axis)
 
 # Set up subplots.
 fig2, (ax2, ax3) = plt.subplots(1, 2, figsize=(14, 6))
 
 # Plot the original equation.
-ax2.contour(X, Y, Z, levels=[0], colors="blue")
+ax2.contour(x_axis, y_axis, Z, levels=[0], colors="blue")
 ax2.set_title("Original Equation")
 ax2.set_xlabel("X")
 ax2.set_ylabel("Y")
@@ -124,7 +94,7 @@ ax2.axvline(0, color="gray", linestyle="--", linewidth=1)
 ax2.grid(True, linestyle="--", linewidth=0.5)
 
 # Plot the transformed (rotated) equation.
-ax3.contour(X, Y, Z_rot, levels=[0], colors="red")
+ax3.contour(x_axis, y_axis, Z_rot, levels=[0], colors="red")
 ax3.set_title("Transformed Equation After 45° Rotation")
 ax3.set_xlabel("X")
 ax3.set_ylabel("Y")
@@ -1,6 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from analytical_geometry.conic import eval_conic_grid
+from analytical_geometry.grid import get_grid
+
 def rotate_coordinates(points, theta):
     """
     Rotate the coordinate axes by an angle theta (in radians).
@@ -108,17 +111,14 @@ print(f"Y: {E_new}")
 print(f"Constant: {F_new}")
 
 # Generate a grid to plot contours
-x = np.linspace(-5, 5, 400)
-y = np.linspace(-5, 5, 400)
-X_grid, Y_grid = np.meshgrid(x, y)
+grid = get_grid((-5, 5, -5, 5), 400)
+x, y = grid.x, grid.y
 
 # Original equation expressed in (x,y)
-original_eq = X_grid**2 - Y_grid**2 + 2*X_grid + 4*y[:, None]
-# Note: using broadcasting for the linear term in y to ensure proper shapes.
+original_eq = eval_conic_grid((1, 0, -1, 2, 4, 0), x, y)
 
 # Transformed equation expressed in the rotated coordinates (X, Y)
-transformed_eq = (A_new*X_grid**2 + B_new*X_grid*Y_grid +
-                  C_new*Y_grid**2 + D_new*X_grid + E_new*Y_grid + F_new)
+transformed_eq = eval_conic_grid((A_new, B_new, C_new, D_new, E_new, F_new), x, y)
 
 plt.figure(figsize=(10, 8))
 
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+
+from analytical_geometry.animation import frame_animation, precompute
+from analytical_geometry.kernels import tangent_at
 
 # Ellipse parameters
 a = 5.0
@@ -8,7 +10,7 @@ b = 3.0
 
 def tangent_properties(theta):
     """
-    Compute the following for a given angle theta (a scalar):
+    Compute the following for an array of angles theta:
       - P is the point on the ellipse: P = (a*cos(theta), b*sin(theta))
       - u is defined such that u^T * P = 1:
             u = (x0/a^2, y0/b^2)  where x0=a*cos(theta), y0=b*sin(theta)
@@ -16,15 +18,20 @@ def tangent_properties(theta):
             u[0]*x = 1  -->  x = 1/u[0]
       - t_pt is the intersection with the y-axis (by setting x = 0):
             u[1]*y = 1  -->  y = 1/u[1]
+    Each is returned as an (n, 2) array (NaN where the tangent is parallel to the axis).
     """
-    x0 = a * np.cos(theta)
-    y0 = b * np.sin(theta)
-    P = np.array([x0, y0])
-    u = np.array([x0/(a**2), y0/(b**2)])
-    # Using if...else to protect against division by zero; u[0] and u[1] are scalars here.
-    T = np.array([1/u[0], 0]) if np.abs(u[0]) > 1e-9 else np.array([np.nan, np.nan])
-    t_pt = np.array([0, 1/u[1]]) if np.abs(u[1]) > 1e-9 else np.array([np.nan, np.nan])
-    return P, T, t_pt
+    return tangent_at(a, b, theta)
+
+def tangent_geometry(theta):
+    """Points and tangent-line samples of every frame."""
+    P, T, t_pt = tangent_properties(theta)
+    # d is orthogonal to u = (x0/a^2, y0/b^2); the line is based at T.
+    d = np.column_stack([-P[:, 1]/(b**2), P[:, 0]/(a**2)])
+    t_line = np.linspace(-10, 10, 100)
+    line = T[:, None, :] + t_line[:, None] * d[:, None, :]
+    return {"P": P, "T": T, "t": t_pt, "line": line}
+
+geometry = precompute(tangent_geometry, np.linspace(0, 2*np.pi, 200))
 
 # Set up the figure and initial plot
 fig, ax = plt.subplots(figsize=(8,8))
@@ -45,33 +52,21 @@ point_T, = ax.plot([], [], 'go', markersize=8, label="T on x-axis")
 point_t, = ax.plot([], [], 'mo', markersize=8, label="t on y-axis")
 ax.legend(loc='upper right')
 
-def update_tangent(theta):
-    # Given a scalar theta, compute properties.
-    P, T, t_pt = tangent_properties(theta)
-    # Because set_data expects sequences, we wrap scalars in lists:
-    point_P.set_data([P[0]], [P[1]])
-    point_T.set_data([T[0]], [T[1]])
-    point_t.set_data([t_pt[0]], [t_pt[1]])
-    
-    # Compute the tangent's direction.
-    # Use u = (x0/a^2, y0/b^2) computed at P.
-    x0, y0 = P
-    u = np.array([x0/(a**2), y0/(b**2)])
-    # d is a vector orthogonal to u.
-    d = np.array([-u[1], u[0]])
-    # Use T as the base point.
-    base = T
-    t_line = np.linspace(-10, 10, 100)
-    # Ensure base is reshaped to column vector.
-    line_points = base.reshape(2,1) + np.outer(d, t_line)
-    tangent_line.set_data(line_points[0, :], line_points[1, :])
+def update_tangent(frame):
+    # Look up the properties precomputed for this frame.
+    g = geometry
+    P, T, t_pt = g.P[frame], g.T[frame], g.t[frame]
+    point_P.set_data(P[:1], P[1:])
+    point_T.set_data(T[:1], T[1:])
+    point_t.set_data(t_pt[:1], t_pt[1:])
+    tangent_line.set_data(g.line[frame, :, 0], g.line[frame, :, 1])
     
     return point_P, point_T, point_t, tangent_line
 
-# Here, we pass the function update_tangent directly and supply frames as a sequence of scalar theta values.
-anim1 = FuncAnimation(fig,
-                      update_tangent,
-                      frames=np.linspace(0, 2*np.pi, 200),
-                      interval=50, blit=True)
+# The frames are indices into the geometry precomputed for 200 theta values.
+anim1 = frame_animation(fig,
+                        geometry,
+                        update_tangent,
+                        interval=50, blit=True)
 
 plt.show()
\ No newline at end of file